@@ -9,12 +9,30 @@ cdef class Observable(ObjectWithUid):
     cdef object bound_uid
 
 
+cdef class EventObservers
+
+
+cdef class PropertyLayout:
+    # the slots of the properties of an EventDispatcher class
+    cdef dict slots  # slot index of each property name
+    cdef list names  # property name of each slot
+    cdef list properties  # Property of each slot, None if not a property
+    cdef int add(self, object name, object prop) except -1
+
+
 cdef class EventDispatcher(ObjectWithUid):
     cdef dict __event_stack
     cdef dict __properties
-    cdef dict __storage
+    cdef list __storage
+    cdef PropertyLayout __layout
+    cdef int __batch_depth
+    cdef list __batch_pending
     cdef object __weakref__
     cpdef dict properties(self)
+    cdef void begin_batch(self)
+    cdef int end_batch(self) except -1
+    cdef object property_storage(self, object name)
+    cdef EventObservers event_observers(self, object name, int create)
 
 
 cdef enum BoundLock:
@@ -54,4 +72,7 @@ cdef class EventObservers:
     cdef inline void remove_callback(self, BoundCallback callback, int force=*) except *
     cdef inline object _dispatch(
         self, object f, tuple slargs, dict skwargs, object obj, object value, tuple largs, dict kwargs)
-    cdef inline int dispatch(self, object obj, object value, tuple largs, dict kwargs, int stop_on_true) except 2
+    cdef inline int dispatch(self, object obj, object value, tuple largs, dict kwargs, int stop_on_true, object name) except 2
+
+
+cdef void record_dispatch(object obj, object name) except *
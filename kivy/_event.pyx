@@ -9,9 +9,39 @@ handlers.
 .. versionchanged:: 1.0.9
     Property discovery and methods have been moved from the
     :class:`~kivy.uix.widget.Widget` to the :class:`EventDispatcher`.
+
+.. _dispatch-profiling:
+
+Profiling
+---------
+
+.. versionadded:: 1.9.0
+
+To find which properties and events are dispatched too often, or have
+expensive observers, the dispatches of all the :class:`EventDispatcher` can be
+recorded::
+
+    from kivy.event import start_dispatch_profiling, stop_dispatch_profiling
+
+    profiler = start_dispatch_profiling()
+    # ... run the application for a while
+    stop_dispatch_profiling()
+    profiler.print_stats()
+
+:meth:`DispatchProfiler.get_stats` returns, for each class and property or
+event name, the number of dispatches, the number of observer calls and the
+time spent in the observers. :meth:`DispatchProfiler.get_top_observers`
+returns the most expensive observers. With the `KIVY_PROFILE_DISPATCH`
+environment variable, the profiling is started when Kivy is imported, and the
+statistics are logged when the application exits.
+
+The time of an observer includes the time of the dispatches it causes. When
+the profiling is stopped, only one test is added to each dispatch.
 '''
 
-__all__ = ('EventDispatcher', 'ObjectWithUid', 'Observable')
+__all__ = ('EventDispatcher', 'ObjectWithUid', 'Observable',
+           'DispatchProfiler', 'start_dispatch_profiling',
+           'stop_dispatch_profiling')
 
 
 cdef extern from "Python.h":
@@ -27,6 +57,9 @@ cdef extern from "Python.h":
 from libc.stdlib cimport malloc, free
 from libc.string cimport memset
 
+import time
+from os import environ
+from timeit import default_timer
 from functools import partial
 from collections import defaultdict
 from kivy.weakmethod import WeakMethod
@@ -37,8 +70,10 @@ from kivy.properties cimport (Property, PropertyStorage, ObjectProperty,
 
 cdef int widget_uid = 0
 cdef dict cache_properties = {}
+cdef dict cache_layouts = {}
 cdef dict cache_events = {}
 cdef dict cache_events_handlers = {}
+cdef object dispatch_profiler = None
 
 def _get_bases(cls):
     for base in cls.__bases__:
@@ -49,6 +84,71 @@ def _get_bases(cls):
             yield cbase
 
 
+cdef dict _get_class_properties(cls):
+    cdef dict attrs_found = {}
+    cdef basestring k
+    for k in dir(cls):
+        uattr = getattr(cls, k, None)
+        if not isinstance(uattr, Property):
+            continue
+        if k == 'touch_down' or k == 'touch_move' or k == 'touch_up':
+            raise Exception('The property <%s> has a forbidden name' % k)
+        attrs_found[k] = uattr
+    cache_properties[cls] = attrs_found
+    return attrs_found
+
+
+cdef PropertyLayout _get_class_layout(cls):
+    # The layout of a class starts with the slots of its nearest dispatcher
+    # base class, so that a property keeps its slot in the subclasses
+    cdef PropertyLayout layout = PropertyLayout()
+    cdef PropertyLayout base_layout = None
+    cdef dict attrs_found = cache_properties.get(cls)
+    if attrs_found is None:
+        attrs_found = _get_class_properties(cls)
+
+    for base in cls.__mro__[1:]:
+        if base is EventDispatcher:
+            break
+        if issubclass(base, EventDispatcher):
+            base_layout = cache_layouts.get(base)
+            if base_layout is None:
+                base_layout = _get_class_layout(base)
+            break
+
+    if base_layout is not None:
+        for name in base_layout.names:
+            layout.add(name, attrs_found.get(name))
+    for name in sorted(attrs_found):
+        if name not in layout.slots:
+            layout.add(name, attrs_found[name])
+    cache_layouts[cls] = layout
+    return layout
+
+
+cdef class PropertyLayout:
+    '''(internal) The slots of the properties of an :class:`EventDispatcher`
+    class. Each instance keeps its property storages in a list, indexed by the
+    slots of the layout of its class. The properties remember the first slot
+    they were given, so that the storage is found without looking up the name
+    in the instances inheriting from the same classes.
+    '''
+
+    def __cinit__(self):
+        self.slots = {}
+        self.names = []
+        self.properties = []
+
+    cdef int add(self, object name, object prop) except -1:
+        cdef int slot = len(self.names)
+        self.slots[name] = slot
+        self.names.append(name)
+        self.properties.append(prop)
+        if prop is not None and (<Property>prop).slot < 0:
+            (<Property>prop).slot = slot
+        return slot
+
+
 cdef class ObjectWithUid(object):
     '''
     (internal) This class assists in providing unique identifiers for class
@@ -171,28 +271,27 @@ cdef class EventDispatcher(ObjectWithUid):
         global cache_properties
         cdef dict cp = cache_properties
         cdef dict attrs_found
-        cdef list attrs
         cdef Property attr
         cdef basestring k
+        cdef PropertyLayout layout
 
-        self.__event_stack = {}
-        self.__storage = {}
+        self.__batch_depth = 0
+        self.__batch_pending = None
 
         __cls__ = self.__class__
 
         if __cls__ not in cp:
-            attrs_found = cp[__cls__] = {}
-            attrs = dir(__cls__)
-            for k in attrs:
-                uattr = getattr(__cls__, k, None)
-                if not isinstance(uattr, Property):
-                    continue
-                if k == 'touch_down' or k == 'touch_move' or k == 'touch_up':
-                    raise Exception('The property <%s> has a forbidden name' % k)
-                attrs_found[k] = uattr
+            attrs_found = _get_class_properties(__cls__)
         else:
             attrs_found = cp[__cls__]
 
+        # The storages are kept in a list, in the slots of the class layout
+        layout = cache_layouts.get(__cls__)
+        if layout is None:
+            layout = _get_class_layout(__cls__)
+        self.__layout = layout
+        self.__storage = [None] * len(layout.names)
+
         # First loop, link all the properties storage to our instance
         for k in attrs_found:
             attr = attrs_found[k]
@@ -237,9 +336,8 @@ cdef class EventDispatcher(ObjectWithUid):
         else:
             events = ce[__cls__]
 
-        # then auto register
-        for event in events:
-            self.__event_stack[event] = EventObservers(1, 0)
+        # then auto register, the observers are created on the first bind
+        self.__event_stack = dict.fromkeys(events)
 
     def __init__(self, **kwargs):
         cdef basestring func, name, key
@@ -307,7 +405,7 @@ cdef class EventDispatcher(ObjectWithUid):
 
         # Add the event type to the stack
         if event_type not in self.__event_stack:
-            self.__event_stack[event_type] = EventObservers(1, 0)
+            self.__event_stack[event_type] = None
 
     def unregister_event_types(self, basestring event_type):
         '''Unregister an event type in the dispatcher.
@@ -427,13 +525,17 @@ cdef class EventDispatcher(ObjectWithUid):
         for key, value in kwargs.iteritems():
             assert callable(value), '{!r} is not callable'.format(value)
             if key[:3] == 'on_':
-                observers = self.__event_stack.get(key)
+                observers = self.event_observers(key, 1)
                 if observers is None:
                     continue
                 # convert the handler to a weak method
                 observers.bind(WeakMethod(value), 1)
             else:
-                ps = self.__storage[key]
+                ps = self.property_storage(key)
+                if ps is None:
+                    raise KeyError(key)
+                if ps.observers is None:
+                    ps.observers = EventObservers()
                 ps.observers.bind(WeakMethod(value), 1)
 
     def unbind(self, **kwargs):
@@ -453,14 +555,17 @@ cdef class EventDispatcher(ObjectWithUid):
 
         for key, value in kwargs.iteritems():
             if key[:3] == 'on_':
-                observers = self.__event_stack.get(key)
+                observers = self.event_observers(key, 0)
                 if observers is None:
                     continue
                 # it's a ref, and stop on first match
                 observers.unbind(value, 1, 1)
             else:
-                ps = self.__storage[key]
-                ps.observers.unbind(value, 1, 1)
+                ps = self.property_storage(key)
+                if ps is None:
+                    raise KeyError(key)
+                if ps.observers is not None:
+                    ps.observers.unbind(value, 1, 1)
 
     def fast_bind(self, name, func, *largs, **kwargs):
         '''A method for faster binding. This method is somewhat different than
@@ -556,14 +661,16 @@ cdef class EventDispatcher(ObjectWithUid):
         cdef PropertyStorage ps
 
         if name[:3] == 'on_':
-            observers = self.__event_stack.get(name)
+            observers = self.event_observers(name, 1)
             if observers is not None:
                 return observers.fast_bind(func, largs, kwargs, 0)
             return 0
         else:
-            ps = self.__storage.get(name)
+            ps = self.property_storage(name)
             if ps is None:
                 return 0
+            if ps.observers is None:
+                ps.observers = EventObservers()
             return ps.observers.fast_bind(func, largs, kwargs, 0)
 
     def fast_unbind(self, name, func, *largs, **kwargs):
@@ -583,12 +690,12 @@ cdef class EventDispatcher(ObjectWithUid):
         cdef PropertyStorage ps
 
         if name[:3] == 'on_':
-            observers = self.__event_stack.get(name)
+            observers = self.event_observers(name, 0)
             if observers is not None:
                 observers.fast_unbind(func, largs, kwargs)
         else:
-            ps = self.__storage.get(name)
-            if ps is not None:
+            ps = self.property_storage(name)
+            if ps is not None and ps.observers is not None:
                 ps.observers.fast_unbind(func, largs, kwargs)
 
     def unbind_uid(self, name, uid):
@@ -617,12 +724,12 @@ cdef class EventDispatcher(ObjectWithUid):
         cdef PropertyStorage ps
 
         if name[:3] == 'on_':
-            observers = self.__event_stack.get(name)
+            observers = self.event_observers(name, 0)
             if observers is not None:
                 observers.unbind_uid(uid)
         else:
-            ps = self.__storage.get(name)
-            if ps is not None:
+            ps = self.property_storage(name)
+            if ps is not None and ps.observers is not None:
                 ps.observers.unbind_uid(uid)
 
     def get_property_observers(self, name, args=False):
@@ -659,8 +766,12 @@ cdef class EventDispatcher(ObjectWithUid):
         if name[:3] == 'on_':
             observers = self.__event_stack[name]
         else:
-            ps = self.__storage[name]
+            ps = self.property_storage(name)
+            if ps is None:
+                raise KeyError(name)
             observers = ps.observers
+        if observers is None:
+            return []
         return list(observers) if args else [item[0] for item in observers]
 
     def events(EventDispatcher self):
@@ -692,7 +803,9 @@ cdef class EventDispatcher(ObjectWithUid):
 
         '''
         cdef EventObservers observers = self.__event_stack[event_type]
-        if observers.dispatch(self, None, largs, kwargs, 1):
+        if observers is None:
+            record_dispatch(self, event_type)
+        elif observers.dispatch(self, None, largs, kwargs, 1, event_type):
             return True
 
         handler = getattr(self, event_type)
@@ -788,8 +901,9 @@ cdef class EventDispatcher(ObjectWithUid):
         cdef dict ret, p
         ret = {}
         p = self.__properties
-        for x in self.__storage:
-            ret[x] = p[x]
+        for x in self.__layout.slots:
+            if self.property_storage(x) is not None:
+                ret[x] = p[x]
         return ret
 
     def create_property(self, name, value=None, *largs, **kwargs):
@@ -847,6 +961,90 @@ cdef class EventDispatcher(ObjectWithUid):
         self.__properties[name] = prop
         setattr(self.__class__, name, prop)
 
+    def batch_dispatch(self):
+        '''Return a context manager delaying the dispatch of the properties
+        changed within it. When the outermost block exits, the observers of
+        each changed property are called once, with the last value::
+
+            with widget.batch_dispatch():
+                widget.x = 10
+                widget.y = 20
+            # the observers of x, y and pos are called once here
+
+        The properties depending on the changed ones (like `pos` on `x` and
+        `y`, or `center` on `x` and `width`) are dispatched once too.
+        Properties are dispatched in the order they were first changed.
+
+        .. versionadded:: 1.9.0
+        '''
+        return _BatchDispatch(self)
+
+    def set_properties(self, **kwargs):
+        '''Set several properties at once, and dispatch each changed property
+        only once, after all the values were set. It is equivalent to setting
+        the values within a :meth:`batch_dispatch` block::
+
+            widget.set_properties(x=10, y=20, width=100, height=50)
+
+        .. note::
+
+            The values are set in an unspecified order, use
+            :meth:`batch_dispatch` if the order matters (for example, when
+            setting both `right` and `width`).
+
+        .. versionadded:: 1.9.0
+        '''
+        self.begin_batch()
+        try:
+            for key, value in kwargs.iteritems():
+                setattr(self, key, value)
+        finally:
+            self.end_batch()
+
+    cdef void begin_batch(self):
+        self.__batch_depth += 1
+
+    cdef int end_batch(self) except -1:
+        cdef Property prop
+        cdef PropertyStorage ps
+        cdef list pending
+        self.__batch_depth -= 1
+        if self.__batch_depth:
+            return 0
+        # keep batching while dispatching, so that the properties depending on
+        # the dispatched ones are queued and dispatched only once as well
+        self.__batch_depth = 1
+        try:
+            while self.__batch_pending:
+                pending = self.__batch_pending
+                self.__batch_pending = None
+                for prop in pending:
+                    ps = self.property_storage(prop._name)
+                    if ps.observers is None:
+                        record_dispatch(self, prop._name)
+                    else:
+                        ps.observers.dispatch(
+                            self, ps.value, None, None, 0, prop._name)
+        finally:
+            self.__batch_depth = 0
+            self.__batch_pending = None
+        return 0
+
+    cdef object property_storage(self, object name):
+        # return the PropertyStorage of the property name, or None
+        cdef object slot = self.__layout.slots.get(name)
+        if slot is None or slot >= len(self.__storage):
+            return None
+        return self.__storage[slot]
+
+    cdef EventObservers event_observers(self, object name, int create):
+        # return the observers of the event name, or None if it's not an
+        # event. If create is False, None is returned if nothing was bound yet
+        cdef EventObservers observers = self.__event_stack.get(name)
+        if observers is None and create and name in self.__event_stack:
+            observers = self.__event_stack[name] = EventObservers(1, 0)
+        return observers
+
     property proxy_ref:
         '''Default implementation of proxy_ref, returns self.
         ..versionadded:: 1.9.0
@@ -855,6 +1053,21 @@ cdef class EventDispatcher(ObjectWithUid):
             return self
 
 
+cdef class _BatchDispatch:
+    # context manager returned by EventDispatcher.batch_dispatch()
+    cdef EventDispatcher obj
+
+    def __cinit__(self, EventDispatcher obj):
+        self.obj = obj
+
+    def __enter__(self):
+        self.obj.begin_batch()
+        return self.obj
+
+    def __exit__(self, *largs):
+        self.obj.end_batch()
+
+
 cdef class BoundCallback:
 
     def __cinit__(self, object func, tuple largs, dict kwargs, int is_ref,
@@ -1092,7 +1305,8 @@ cdef class EventObservers:
                         return f(obj, *largs, **kwargs)
 
     cdef inline int dispatch(self, object obj, object value, tuple largs,
-                             dict kwargs, int stop_on_true) except 2:
+                             dict kwargs, int stop_on_true,
+                             object name) except 2:
         '''Dispatches obj, value to all bound observers. If largs and/or kwargs,
         they are forwarded after obj, value. if stop_on_true, if a observer returns
         true, the function stops and returns true.
@@ -1124,11 +1338,20 @@ cdef class EventObservers:
         Each callback as it is dispatched is locked. Also, the last callback
         scheduled to be executed is immediatly locked, so that we know where to
         stop, in case new callbacks are added.
+
+        name is the name of the property or event, recorded when the dispatch
+        profiling is started.
         '''
         cdef BoundCallback callback, final, next
         cdef object f, result
         cdef BoundLock current_lock, last_lock
         cdef int done = 0, res = 0, reverse = self.dispatch_reverse
+        cdef object profiler = dispatch_profiler
+        cdef list stats
+        cdef double start
+
+        if profiler is not None:
+            stats = profiler.record_dispatch(obj, name)
 
         if reverse:  # dispatch starting from last until first
             callback = self.last_callback  # start callback
@@ -1165,8 +1388,17 @@ cdef class EventObservers:
             if current_lock == unlocked:  # and lock it if unlocked
                 callback.lock = locked
 
-            result = self._dispatch(
-                f, callback.largs, callback.kwargs, obj, value, largs, kwargs)
+            if profiler is None:
+                result = self._dispatch(
+                    f, callback.largs, callback.kwargs, obj, value, largs,
+                    kwargs)
+            else:
+                start = profiler.time()
+                result = self._dispatch(
+                    f, callback.largs, callback.kwargs, obj, value, largs,
+                    kwargs)
+                profiler.record_call(stats, obj, name, f,
+                                     profiler.time() - start)
 
             if current_lock == unlocked:  # now unlock/delete if it was unlocked
                 if callback.lock == deleted:
@@ -1198,3 +1430,148 @@ cdef class EventObservers:
                 callback.kwargs if callback.kwargs is not None else {},
                 callback.is_ref, callback.uid)
             callback = callback.next
+
+
+cdef void record_dispatch(object obj, object name) except *:
+    # record a dispatch without observers
+    if dispatch_profiler is not None:
+        dispatch_profiler.record_dispatch(obj, name)
+
+
+def _observer_name(observer):
+    if isinstance(observer, partial):
+        observer = observer.func
+    name = getattr(observer, '__name__', None)
+    if name is None:
+        return repr(observer)
+    obj = getattr(observer, '__self__', None)
+    if obj is not None:
+        name = '%s.%s' % (obj.__class__.__name__, name)
+    module = getattr(observer, '__module__', None)
+    if module is not None:
+        name = '%s.%s' % (module, name)
+    return name
+
+
+class DispatchProfiler(object):
+    '''Records the dispatches of the properties and events of all the
+    :class:`EventDispatcher`, created by :func:`start_dispatch_profiling`. See
+    :ref:`dispatch-profiling`.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    def __init__(self):
+        # (class, name) -> [dispatches, observer calls, observer time]
+        self.stats = {}
+        # (observer name, class, name) -> [calls, time]
+        self.observers = {}
+        self.time = getattr(time, 'perf_counter', default_timer)
+
+    def record_dispatch(self, obj, name):
+        '''Record a dispatch of the property or event `name` of `obj`, and
+        return its statistics.
+        '''
+        key = (obj.__class__, name)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = [0, 0, 0.]
+        stats[0] += 1
+        return stats
+
+    def record_call(self, stats, obj, name, observer, duration):
+        '''Record a call of `observer` that lasted `duration`, during a
+        dispatch of `name` of `obj` whose statistics are `stats`.
+        '''
+        stats[1] += 1
+        stats[2] += duration
+        key = (_observer_name(observer), obj.__class__, name)
+        ostats = self.observers.get(key)
+        if ostats is None:
+            ostats = self.observers[key] = [0, 0.]
+        ostats[0] += 1
+        ostats[1] += duration
+
+    def get_stats(self, sort='time'):
+        '''Return a list of dicts with the `cls` (class name), the `name` of
+        the property or event, the number of `dispatches`, the number of
+        observer `calls` and the `time` spent in the observers, sorted by
+        decreasing `sort` value.
+        '''
+        result = [{
+            'cls': cls.__name__, 'name': name, 'dispatches': dispatches,
+            'calls': calls, 'time': duration}
+            for (cls, name), (dispatches, calls, duration)
+            in self.stats.items()]
+        result.sort(key=lambda x: x[sort], reverse=True)
+        return result
+
+    def get_top_observers(self, limit=10):
+        '''Return a list of dicts with the name of the `observer`, the `cls`
+        and `name` of the dispatched property or event, the number of `calls`
+        and the `time` spent in the observer, for the `limit` observers taking
+        the most time.
+        '''
+        result = [{
+            'observer': observer, 'cls': cls.__name__, 'name': name,
+            'calls': calls, 'time': duration}
+            for (observer, cls, name), (calls, duration)
+            in self.observers.items()]
+        result.sort(key=lambda x: x['time'], reverse=True)
+        return result[:limit]
+
+    def print_stats(self, limit=20):
+        '''Log the `limit` properties and events whose observers take the most
+        time, and the `limit` most expensive observers.
+        '''
+        from kivy.logger import Logger
+        Logger.info('Dispatch: %-50s %10s %10s %10s' % (
+            'property or event', 'dispatches', 'calls', 'total ms'))
+        for stats in self.get_stats()[:limit]:
+            Logger.info('Dispatch: %-50s %10d %10d %10.3f' % (
+                ('%s.%s' % (stats['cls'], stats['name']))[-50:],
+                stats['dispatches'], stats['calls'], stats['time'] * 1000))
+        Logger.info('Dispatch: %-50s %-30s %10s %10s' % (
+            'observer', 'of', 'calls', 'total ms'))
+        for stats in self.get_top_observers(limit):
+            Logger.info('Dispatch: %-50s %-30s %10d %10.3f' % (
+                stats['observer'][-50:],
+                ('%s.%s' % (stats['cls'], stats['name']))[-30:],
+                stats['calls'], stats['time'] * 1000))
+
+
+def start_dispatch_profiling():
+    '''Start recording the dispatches of all the :class:`EventDispatcher`,
+    and return the :class:`DispatchProfiler`. If the profiling is already
+    started, the current profiler is returned. See :ref:`dispatch-profiling`.
+
+    .. versionadded:: 1.9.0
+    '''
+    global dispatch_profiler
+    if dispatch_profiler is None:
+        dispatch_profiler = DispatchProfiler()
+    return dispatch_profiler
+
+
+def stop_dispatch_profiling():
+    '''Stop the profiling, and return the :class:`DispatchProfiler` with the
+    recorded statistics, or None if the profiling was not started.
+
+    .. versionadded:: 1.9.0
+    '''
+    global dispatch_profiler
+    profiler = dispatch_profiler
+    dispatch_profiler = None
+    return profiler
+
+
+if 'KIVY_PROFILE_DISPATCH' in environ:
+    import atexit
+
+    def _print_dispatch_stats():
+        profiler = stop_dispatch_profiling()
+        if profiler is not None:
+            profiler.print_stats()
+
+    start_dispatch_profiling()
+    atexit.register(_print_dispatch_stats)
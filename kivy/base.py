@@ -318,8 +318,17 @@ class EventLoopBase(EventDispatcher):
            * it reads all input and dispatches events.
            * it dispatches `on_update`, `on_draw` and `on_flip` events to the
              window.
+
+        .. versionchanged:: 1.9.0
+            The clock doesn't sleep in idle mode if the window needs to be
+            redrawn. See :ref:`clock-idle`.
         '''
 
+        # don't wait for anything if the window changed since the last frame
+        window = self.window
+        if window and window.canvas.needs_redraw:
+            Clock.wakeup()
+
         # update dt
         Clock.tick()
 
@@ -3,8 +3,8 @@ Cache manager
 =============
 
 The cache manager can be used to store python objects attached to a unique
-key. The cache can be controlled in two ways: with a object limit or a
-timeout.
+key. The cache can be controlled in three ways: with a object limit, a
+memory budget or a timeout.
 
 For example, we can create a new cache with a limit of 10 objects and a
 timeout of 5 seconds::
@@ -22,13 +22,307 @@ timeout of 5 seconds::
 
 If the instance is NULL, the cache may have trashed it because you've
 not used the label for 5 seconds and you've reach the limit.
+
+.. versionchanged:: 1.9.0
+    The limit of a category is now enforced: when it is reached, the least
+    recently used object is removed from the cache. :meth:`Cache.get`
+    marks the object as recently used. Timed out objects are found with a
+    heap of expiry times instead of checking every object each second.
+
+Memory budget
+-------------
+
+.. versionadded:: 1.9.0
+
+An object limit doesn't say much about the memory used by a category when the
+objects have very different sizes, like textures. A category can instead be
+given a budget in bytes::
+
+    Cache.register('mytextures', max_bytes=64 * 1024 * 1024)
+
+The least recently used objects are removed until the new object fits in the
+budget. The size of an object is computed when it is added to the cache, by
+the `sizeof` function given to :meth:`Cache.register`, or by
+:meth:`Cache.sizeof` which knows about
+:class:`~kivy.graphics.texture.Texture`, :class:`~kivy.core.image.Image` and
+:class:`~kivy.core.image.ImageData`.
+
+The memory used, and the hits, misses and evictions of each category are
+available with :meth:`Cache.get_stats`, and displayed by
+:meth:`Cache.print_usage`.
+
+Disk tier
+---------
+
+.. versionadded:: 1.9.0
+
+A category can be backed by a size capped directory, to keep data that is
+costly to compute across application runs::
+
+    Cache.register_disk('kv.image', max_bytes=256 * 1024 * 1024)
+
+The data is stored with :meth:`Cache.disk_append` and read back with
+:meth:`Cache.disk_get`, which maps the file in memory instead of reading it.
+When a `source` file is given, its modification time and size are stored
+along with the data, and the data is discarded as soon as the source file
+changes. The least recently used files are deleted when the directory
+reaches its size limit.
+
+When the `kv.image` category has a disk tier, the decoded pixels of the
+images loaded from files are stored in it, and the next loads of these
+images don't decode them again.
+
+Memory pressure
+---------------
+
+.. versionadded:: 1.9.0
+
+:meth:`Cache.release_memory` shrinks every category to a fraction of its
+size, removing the least recently used objects first, and then calls the
+handlers added with :meth:`Cache.register_memory_handler`, so that other
+parts of Kivy, like the font caches of the text providers, can release their
+memory too. The textures and framebuffers which were only kept alive by the
+caches are then collected, and their GPU memory is released on the next
+frame.
+
+It is called by the window when the system reports that it is low on memory
+(see :meth:`~kivy.core.window.WindowBase.on_memorywarning`), and can be
+called manually::
+
+    released = Cache.release_memory(.25)
+    print('%d bytes released' % released)
 '''
 
 __all__ = ('Cache', )
 
-from os import environ
+import gc
+import sys
+import json
+import zlib
+from os import environ, listdir, makedirs, remove, rename, stat, utime
+from os.path import exists, join
+from hashlib import sha1
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from heapq import heappush, heappop, heapify
+from itertools import count
+from collections import OrderedDict
+from threading import RLock
 from kivy.logger import Logger
 from kivy.clock import Clock
+from kivy.compat import PY2
+
+# sequence number of the cache entries, used to detect stale expiry entries
+_entry_seq = count()
+
+# approximate size of a texture pixel, for each color format
+_texture_bpp = {
+    'rgb': 3, 'bgr': 3, 'rgba': 4, 'bgra': 4, 'argb': 4, 'abgr': 4,
+    'luminance': 1, 'luminance_alpha': 2, 'red': 1, 'rg': 2,
+    'alpha': 1, 'ALPHA': 1}
+
+
+def _texture_size(texture):
+    size = texture.width * texture.height * _texture_bpp.get(
+        texture.colorfmt, 4)
+    if texture.mipmap:
+        # the mipmap levels take one third of the base level
+        size += size // 3
+    return size
+
+
+def _imagedata_size(imagedata):
+    # the data is released once uploaded, it is then counted in the texture
+    size = 0
+    for level, width, height, data, rowlength in imagedata.iterate_mipmaps():
+        if data is not None:
+            size += len(data)
+    return size
+
+
+def _to_bytes(data):
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    if isinstance(data, bytes):
+        return data
+    return bytes(data)
+
+
+def _source_signature(source):
+    st = stat(source)
+    return [st.st_mtime, st.st_size]
+
+
+class _CacheDisk(object):
+    # A size capped directory of files, each made of a json header and of the
+    # raw data. The files are kept from the least to the most recently used.
+    # Images are loaded from the Loader threads, so the methods are locked.
+
+    magic = b'KVC1'
+    header_length = Struct('<I')
+
+    def __init__(self, directory, max_bytes, compress):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.files = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = RLock()
+
+    def scan(self):
+        if self.files is not None:
+            return
+        directory = self.directory
+        files = []
+        if not exists(directory):
+            makedirs(directory)
+        for name in listdir(directory):
+            if not name.endswith('.bin'):
+                continue
+            try:
+                st = stat(join(directory, name))
+            except OSError:
+                continue
+            files.append((st.st_mtime, name, st.st_size))
+        files.sort()
+        self.files = OrderedDict((name, size) for _, name, size in files)
+        self.bytes = sum(self.files.values())
+
+    def get_filename(self, key):
+        return sha1(repr(key).encode('utf-8')).hexdigest() + '.bin'
+
+    def discard(self, name):
+        self.bytes -= self.files.pop(name, 0)
+        try:
+            remove(join(self.directory, name))
+        except OSError:
+            pass
+
+    def clear(self):
+        with self.lock:
+            self.scan()
+            for name in list(self.files):
+                self.discard(name)
+
+    def remove(self, key):
+        with self.lock:
+            self.scan()
+            self.discard(self.get_filename(key))
+
+    def get(self, key, source):
+        with self.lock:
+            return self._get(key, source)
+
+    def append(self, key, data, meta, source):
+        with self.lock:
+            return self._append(key, data, meta, source)
+
+    def _get(self, key, source):
+        self.scan()
+        name = self.get_filename(key)
+        if name not in self.files:
+            self.misses += 1
+            return None
+
+        path = join(self.directory, name)
+        buf = None
+        try:
+            signature = _source_signature(source) if source else None
+            with open(path, 'rb') as fd:
+                buf = mmap(fd.fileno(), 0, access=ACCESS_READ)
+            if buf[:4] != self.magic:
+                raise ValueError('invalid file')
+            length = self.header_length.unpack(buf[4:8])[0]
+            offset = 8 + length
+            header = json.loads(buf[8:offset].decode('utf-8'))
+            if header['key'] != repr(key) or header['source'] != signature:
+                raise ValueError('outdated file')
+            if header['compressed']:
+                # the map is only kept open for an uncompressed memoryview
+                try:
+                    data = zlib.decompress(buf[offset:])
+                finally:
+                    buf.close()
+        except (IOError, OSError, ValueError, KeyError, zlib.error):
+            # the file can't be removed while it's mapped on windows
+            if buf is not None:
+                buf.close()
+            self.discard(name)
+            self.misses += 1
+            return None
+
+        if not header['compressed']:
+            try:
+                data = memoryview(buf)[offset:]
+            except TypeError:
+                # python 2 mmap doesn't support memoryview
+                data = buf[offset:]
+                buf.close()
+
+        # mark the file as the most recently used, also for the next runs
+        self.files[name] = self.files.pop(name)
+        try:
+            utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return header['meta'], data
+
+    def _append(self, key, data, meta, source):
+        self.scan()
+        try:
+            signature = _source_signature(source) if source else None
+        except OSError:
+            return False
+        header = json.dumps({
+            'key': repr(key), 'source': signature, 'meta': meta,
+            'compressed': self.compress}).encode('utf-8')
+        if self.compress:
+            data = zlib.compress(_to_bytes(data))
+        elif PY2:
+            data = _to_bytes(data)
+        size = 8 + len(header) + len(data)
+        if size > self.max_bytes:
+            return False
+
+        name = self.get_filename(key)
+        if name in self.files:
+            self.discard(name)
+        files = self.files
+        while files and self.bytes + size > self.max_bytes:
+            self.discard(next(iter(files)))
+
+        # write in a temporary file first, for concurrent readers
+        path = join(self.directory, name)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as fd:
+                fd.write(self.magic)
+                fd.write(self.header_length.pack(len(header)))
+                fd.write(header)
+                fd.write(data)
+            rename(tmp_path, path)
+        except (IOError, OSError) as e:
+            Logger.warning('Cache: unable to write %s: %s' % (path, e))
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        files[name] = size
+        self.bytes += size
+        return True
+
+
+def _imageloader_size(loader):
+    size = 0
+    for imagedata in loader._data or ():
+        size += _imagedata_size(imagedata)
+    for texture in loader._textures or ():
+        size += _texture_size(texture)
+    return size
 
 
 class Cache(object):
@@ -37,28 +331,83 @@ class Cache(object):
 
     _categories = {}
     _objects = {}
+    _expiry = {}
+    _disks = {}
+    _memory_handlers = []
 
     @staticmethod
-    def register(category, limit=None, timeout=None):
+    def register(category, limit=None, timeout=None, max_bytes=None,
+                 sizeof=None):
         '''Register a new category in the cache with the specified limit.
 
         :Parameters:
             `category` : str
                 Identifier of the category.
             `limit` : int (optional)
-                Maximum number of objects allowed in the cache.
+                Maximum number of objects allowed in the cache. When the limit
+                is reached, the least recently used object is removed.
                 If None, no limit is applied.
             `timeout` : double (optional)
                 Time after which to delete the object if it has not been used.
                 If None, no timeout is applied.
+            `max_bytes` : int (optional)
+                Maximum memory used by the objects of the category, in bytes.
+                When it is reached, the least recently used objects are
+                removed. If None, no budget is applied.
+            `sizeof` : callable (optional)
+                Function returning the size in bytes of an object of the
+                category. Defaults to :meth:`Cache.sizeof`.
+
+        .. versionchanged:: 1.9.0
+            `max_bytes` and `sizeof` have been added.
         '''
         Cache._categories[category] = {
             'limit': limit,
-            'timeout': timeout}
-        Cache._objects[category] = {}
+            'timeout': timeout,
+            'max_bytes': max_bytes,
+            'sizeof': sizeof or Cache.sizeof,
+            'bytes': 0,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0}
+        Cache._objects[category] = OrderedDict()
+        Cache._expiry[category] = []
         Logger.debug(
-            'Cache: register <%s> with limit=%s, timeout=%ss' %
-            (category, str(limit), str(timeout)))
+            'Cache: register <%s> with limit=%s, timeout=%ss, max_bytes=%s' %
+            (category, str(limit), str(timeout), str(max_bytes)))
+
+    @staticmethod
+    def sizeof(obj):
+        '''Return the approximate memory used by an object, in bytes.
+
+        The size of a :class:`~kivy.graphics.texture.Texture` is computed from
+        its size and color format, the one of a
+        :class:`~kivy.core.image.ImageData` from the pixel data it still
+        holds, and the one of an :class:`~kivy.core.image.Image` or of an
+        image loader from its textures and image data. The size of any other
+        object is given by :func:`sys.getsizeof`.
+
+        .. versionadded:: 1.9.0
+        '''
+        # only check the types of the modules already imported
+        texture_module = sys.modules.get('kivy.graphics.texture')
+        if texture_module is not None and \
+                isinstance(obj, texture_module.Texture):
+            return _texture_size(obj)
+        image_module = sys.modules.get('kivy.core.image')
+        if image_module is not None:
+            if isinstance(obj, image_module.ImageData):
+                return _imagedata_size(obj)
+            if isinstance(obj, image_module.ImageLoaderBase):
+                return _imageloader_size(obj)
+            if isinstance(obj, image_module.Image):
+                if obj.image is not None:
+                    return _imageloader_size(obj.image)
+                if obj._texture is not None:
+                    return _texture_size(obj._texture)
+                return 0
+        return sys.getsizeof(obj)
 
     @staticmethod
     def append(category, key, obj, timeout=None):
@@ -84,15 +433,41 @@ class Cache(object):
             Logger.warning('Cache: category <%s> not exist' % category)
             return
         timeout = timeout or cat['timeout']
-        # FIXME: activate purge when limit is hit
-        #limit = cat['limit']
-        #if limit is not None and len(Cache._objects[category]) >= limit:
-        #    Cache._purge_oldest(category)
-        Cache._objects[category][key] = {
+        objects = Cache._objects[category]
+
+        # the most recently used objects are at the end
+        entry = objects.pop(key, None)
+        if entry is not None:
+            cat['bytes'] -= entry.get('size', 0)
+        size = cat['sizeof'](obj)
+        max_bytes = cat['max_bytes']
+        if max_bytes is not None:
+            if size > max_bytes:
+                Logger.debug('Cache: object <%s> is too big for <%s>' % (
+                    key, category))
+                return
+            while objects and cat['bytes'] + size > max_bytes:
+                Cache._purge_oldest(category)
+        limit = cat['limit']
+        if limit is not None and len(objects) >= limit:
+            Cache._purge_oldest(category, len(objects) - limit + 1)
+
+        curtime = Clock.get_time()
+        seq = next(_entry_seq)
+        objects[key] = {
             'object': obj,
             'timeout': timeout,
-            'lastaccess': Clock.get_time(),
-            'timestamp': Clock.get_time()}
+            'lastaccess': curtime,
+            'timestamp': curtime,
+            'seq': seq,
+            'size': size}
+        cat['bytes'] += size
+        if timeout is not None:
+            expiry = Cache._expiry[category]
+            heappush(expiry, (curtime + timeout, seq, key))
+            # drop the stale entries if they are taking over the heap
+            if len(expiry) > 2 * len(objects) + 64:
+                Cache._rebuild_expiry(category)
 
     @staticmethod
     def get(category, key, default=None):
@@ -107,10 +482,18 @@ class Cache(object):
                 Default value to be returned if the key is not found.
         '''
         try:
-            Cache._objects[category][key]['lastaccess'] = Clock.get_time()
-            return Cache._objects[category][key]['object']
+            objects = Cache._objects[category]
+            entry = objects.pop(key)
         except Exception:
+            cat = Cache._categories.get(category)
+            if cat is not None:
+                cat['misses'] += 1
             return default
+        # mark the object as the most recently used
+        objects[key] = entry
+        Cache._categories[category]['hits'] += 1
+        entry['lastaccess'] = Clock.get_time()
+        return entry['object']
 
     @staticmethod
     def get_timestamp(category, key, default=None):
@@ -157,33 +540,237 @@ class Cache(object):
                 Unique identifier of the object in the store. If this
                 arguement is not supplied, the entire category will be purged.
         '''
+        # the expiry heap is not touched, its stale entries are ignored
         try:
             if key is not None:
-                del Cache._objects[category][key]
+                entry = Cache._objects[category].pop(key)
+                Cache._categories[category]['bytes'] -= entry.get('size', 0)
             else:
-                Cache._objects[category] = {}
+                Cache._objects[category] = OrderedDict()
+                Cache._categories[category]['bytes'] = 0
         except Exception:
             pass
 
+    @staticmethod
+    def get_stats(category):
+        '''Return a dict with the usage statistics of a category:
+
+        * `count`: number of objects in the cache
+        * `bytes`: memory used by these objects, in bytes
+        * `limit`, `max_bytes` and `timeout`: the limits of the category
+        * `hits` and `misses`: number of successful and failed
+          :meth:`get`
+        * `evictions`: number of objects removed to respect the limits
+        * `expirations`: number of objects removed after their timeout
+        * `disk_bytes`, `disk_hits` and `disk_misses`: usage of the disk
+          tier, only if the category has one. See :meth:`register_disk`.
+
+        .. versionadded:: 1.9.0
+        '''
+        cat = Cache._categories[category]
+        stats = dict((name, cat[name]) for name in (
+            'limit', 'timeout', 'max_bytes', 'bytes', 'hits', 'misses',
+            'evictions', 'expirations'))
+        stats['count'] = len(Cache._objects[category])
+        disk = Cache._disks.get(category)
+        if disk is not None:
+            stats['disk_bytes'] = disk.bytes
+            stats['disk_hits'] = disk.hits
+            stats['disk_misses'] = disk.misses
+        return stats
+
+    @staticmethod
+    def trim(category, fraction):
+        '''Remove the least recently used objects of a category, until both
+        the number of objects and the memory they use are at most `fraction`
+        of their current values. Returns the number of bytes released.
+
+        .. versionadded:: 1.9.0
+        '''
+        cat = Cache._categories[category]
+        objects = Cache._objects[category]
+        nbytes = cat['bytes']
+        max_count = int(len(objects) * fraction)
+        max_bytes = nbytes * fraction
+        while objects and (len(objects) > max_count or
+                           cat['bytes'] > max_bytes):
+            Cache._purge_oldest(category)
+        return nbytes - cat['bytes']
+
+    @staticmethod
+    def release_memory(fraction=None):
+        '''Release memory when the system is low on memory: every category is
+        trimmed with :meth:`trim`, the memory handlers are called, and the
+        garbage is collected. Returns the number of bytes released, as
+        reported by the categories and the handlers.
+
+        :Parameters:
+            `fraction` : float (optional)
+                Fraction of their size that the caches keep. Defaults to the
+                `memory_trim_fraction` token of the `kivy` section of the
+                configuration.
+
+        .. versionadded:: 1.9.0
+        '''
+        if fraction is None:
+            from kivy.config import Config
+            fraction = Config.getfloat('kivy', 'memory_trim_fraction')
+        released = 0
+        for category in list(Cache._categories):
+            released += Cache.trim(category, fraction)
+        for handler in Cache._memory_handlers[:]:
+            released += handler(fraction) or 0
+        gc.collect()
+        Logger.info('Cache: released %d bytes (fraction=%s)' % (
+            released, str(fraction)))
+        return released
+
+    @staticmethod
+    def register_memory_handler(handler):
+        '''Add a handler to call in :meth:`release_memory`. It receives the
+        fraction of their size that the caches must keep, and returns the
+        number of bytes it released, or None if unknown.
+
+        .. versionadded:: 1.9.0
+        '''
+        if handler not in Cache._memory_handlers:
+            Cache._memory_handlers.append(handler)
+
+    @staticmethod
+    def unregister_memory_handler(handler):
+        '''Remove a handler added with :meth:`register_memory_handler`.
+
+        .. versionadded:: 1.9.0
+        '''
+        if handler in Cache._memory_handlers:
+            Cache._memory_handlers.remove(handler)
+
+    @staticmethod
+    def register_disk(category, max_bytes=64 * 1024 * 1024, directory=None,
+                      compress=False):
+        '''Back a category with a directory on the disk. See the module
+        documentation for more information.
+
+        :Parameters:
+            `category` : str
+                Identifier of the category.
+            `max_bytes` : int, defaults to 64MB
+                Maximum size of the directory, in bytes.
+            `directory` : str (optional)
+                Directory where the data are stored. Defaults to
+                `cache/<category>` in the Kivy home directory.
+            `compress` : bool, defaults to False
+                Compress the data with zlib. It saves disk space, but the
+                data is then decompressed in memory instead of being mapped.
+
+        .. versionadded:: 1.9.0
+        '''
+        if directory is None:
+            from kivy import kivy_home_dir
+            directory = join(kivy_home_dir, 'cache', category)
+        Cache._disks[category] = _CacheDisk(directory, max_bytes, compress)
+        Logger.debug(
+            'Cache: register disk for <%s> in %s with max_bytes=%s' %
+            (category, directory, str(max_bytes)))
+
+    @staticmethod
+    def disk_append(category, key, data, meta=None, source=None):
+        '''Store data in the disk tier of a category. Returns True if the data
+        has been stored.
+
+        :Parameters:
+            `category` : str
+                Identifier of the category.
+            `key` : str
+                Unique identifier of the data to store.
+            `data` : bytes
+                Data to store, or any object supporting the buffer interface.
+            `meta` : object (optional)
+                Metadata stored along with the data, must be serializable with
+                :mod:`json`.
+            `source` : str (optional)
+                File the data is computed from. The data will be discarded if
+                the modification time or the size of the file change.
+
+        .. versionadded:: 1.9.0
+        '''
+        disk = Cache._disks.get(category)
+        if disk is None:
+            return False
+        return disk.append(key, data, meta, source)
+
+    @staticmethod
+    def disk_get(category, key, source=None):
+        '''Get data from the disk tier of a category. Returns a tuple
+        `(meta, data)`, where `data` is a memory view of the file mapped in
+        memory, or None if the data is not found or is outdated.
+
+        :Parameters:
+            `category` : str
+                Identifier of the category.
+            `key` : str
+                Unique identifier of the data.
+            `source` : str (optional)
+                File the data is computed from, as given to
+                :meth:`disk_append`.
+
+        .. versionadded:: 1.9.0
+        '''
+        disk = Cache._disks.get(category)
+        if disk is None:
+            return None
+        return disk.get(key, source)
+
+    @staticmethod
+    def disk_remove(category, key=None):
+        '''Remove data from the disk tier of a category.
+
+        :Parameters:
+            `category` : str
+                Identifier of the category.
+            `key` : str (optional)
+                Unique identifier of the data. If this argument is not
+                supplied, the whole directory of the category is purged.
+
+        .. versionadded:: 1.9.0
+        '''
+        disk = Cache._disks.get(category)
+        if disk is None:
+            return
+        if key is None:
+            disk.clear()
+        else:
+            disk.remove(key)
+
+    @staticmethod
+    def _update_usage(category):
+        # recompute the memory used, after the objects have been changed
+        # without using the Cache methods
+        Cache._categories[category]['bytes'] = sum(
+            entry.get('size', 0)
+            for entry in Cache._objects[category].values())
+
     @staticmethod
     def _purge_oldest(category, maxpurge=1):
-        print('PURGE', category)
-        import heapq
-        heap_list = []
-        for key in Cache._objects[category]:
-            obj = Cache._objects[category][key]
-            if obj['lastaccess'] == obj['timestamp']:
-                continue
-            heapq.heappush(heap_list, (obj['lastaccess'], key))
-            print('<<<', obj['lastaccess'])
-        n = 0
-        while n < maxpurge:
-            try:
-                lastaccess, key = heapq.heappop(heap_list)
-                print('=>', key, lastaccess, Clock.get_time())
-            except Exception:
-                return
-            del Cache._objects[category][key]
+        # remove the least recently used objects
+        objects = Cache._objects[category]
+        cat = Cache._categories[category]
+        while maxpurge > 0 and objects:
+            entry = objects.pop(next(iter(objects)))
+            cat['bytes'] -= entry.get('size', 0)
+            cat['evictions'] += 1
+            maxpurge -= 1
+
+    @staticmethod
+    def _rebuild_expiry(category):
+        expiry = []
+        for key, entry in Cache._objects[category].items():
+            timeout = entry['timeout']
+            if timeout is not None:
+                expiry.append((entry['lastaccess'] + timeout,
+                               entry.get('seq'), key))
+        heapify(expiry)
+        Cache._expiry[category] = expiry
 
     @staticmethod
     def _purge_by_timeout(dt):
@@ -203,31 +790,37 @@ class Cache(object):
                 Cache._categories[category]['timeout'] = timeout
                 continue
 
-            for key in list(Cache._objects[category].keys())[:]:
-                lastaccess = Cache._objects[category][key]['lastaccess']
-                objtimeout = Cache._objects[category][key]['timeout']
-
-                # take the object timeout if available
-                if objtimeout is not None:
-                    timeout = objtimeout
-
-                # no timeout, cancel
-                if timeout is None:
+            cat = Cache._categories[category]
+            objects = Cache._objects[category]
+            expiry = Cache._expiry[category]
+            while expiry and expiry[0][0] < curtime:
+                deadline, seq, key = heappop(expiry)
+                entry = objects.get(key)
+                # removed or replaced since
+                if entry is None or entry.get('seq') != seq:
                     continue
-
-                if curtime - lastaccess > timeout:
-                    del Cache._objects[category][key]
+                # used since, check it again later
+                deadline = entry['lastaccess'] + entry['timeout']
+                if deadline >= curtime:
+                    heappush(expiry, (deadline, seq, key))
+                    continue
+                del objects[key]
+                cat['bytes'] -= entry.get('size', 0)
+                cat['expirations'] += 1
 
     @staticmethod
     def print_usage():
         '''Print the cache usage to the console.'''
         print('Cache usage :')
         for category in Cache._categories:
-            print(' * %s : %d / %s, timeout=%s' % (
-                category.capitalize(),
-                len(Cache._objects[category]),
-                str(Cache._categories[category]['limit']),
-                str(Cache._categories[category]['timeout'])))
+            stats = Cache.get_stats(category)
+            print(' * %s : %d / %s, %d / %s bytes, timeout=%s, '
+                  'hits=%d, misses=%d, evictions=%d, expirations=%d' % (
+                      category.capitalize(), stats['count'],
+                      str(stats['limit']), stats['bytes'],
+                      str(stats['max_bytes']), str(stats['timeout']),
+                      stats['hits'], stats['misses'], stats['evictions'],
+                      stats['expirations']))
 
 if 'KIVY_DOC_INCLUDE' not in environ:
     # install the schedule clock for purging
@@ -157,6 +157,96 @@ Even if x and y changes within one frame, the callback is only run once.
     :meth:`ClockBase.create_trigger` also has a timeout parameter that
     behaves exactly like :meth:`ClockBase.schedule_once`.
 
+Clock implementations
+---------------------
+
+.. versionadded:: 1.9.0
+
+By default, :class:`ClockBase` checks every scheduled event on each frame,
+which is fine for a few hundred events. Applications scheduling thousands of
+events can use :class:`ClockBaseHeap` instead, which keeps the events sorted
+by deadline and only processes the due ones. The implementation is selected
+with the `kivy_clock` token of the `kivy` section of the configuration, or
+the `KIVY_CLOCK` environment variable::
+
+    $ KIVY_CLOCK=heap python main.py
+
+Both implementations have the same API and behavior.
+
+.. _clock-work:
+
+Deferred work
+-------------
+
+.. versionadded:: 1.9.0
+
+Creating hundreds of widgets in one callback stalls a frame, while creating
+them from a callback scheduled every frame is slow and requires some
+bookkeeping. :meth:`ClockBase.schedule_work` accepts a list of small jobs, or
+a generator, and runs as many steps as fit within
+:attr:`ClockBase.work_budget` seconds on each frame, carrying the rest over
+to the next frames::
+
+    def create_rows(self):
+        for item in self.data:
+            self.add_widget(Row(item=item))
+            yield
+
+    work = Clock.schedule_work(self.create_rows(), priority=1)
+    # if the data changes before the rows are created
+    work.cancel()
+
+At least one step is done per frame. The work with the highest priority is
+done first, then the work scheduled first. Unlike callbacks, the work is not
+weak-referenced.
+
+.. _clock-profiling:
+
+Profiling
+---------
+
+.. versionadded:: 1.9.0
+
+To find which callbacks take the most time in a frame, the clock can record
+the duration of each callback, of each pass of the callbacks scheduled before
+the frame, and of :meth:`ClockBase.tick_draw`::
+
+    profiler = Clock.start_profiling()
+    # ... run the application for a while
+    Clock.stop_profiling()
+    profiler.print_stats()
+    profiler.export_trace('trace.json')
+
+:meth:`ClockProfiler.get_stats` returns the count, total, mean and max time
+and an histogram of the durations of each callback.
+:meth:`ClockProfiler.export_trace` writes a timeline that can be loaded in
+`chrome://tracing`. The :mod:`~kivy.modules.clockprofiler` module profiles a
+whole run of an application. When the profiling is stopped, the clock only
+checks for the profiler once per callback.
+
+.. _clock-idle:
+
+Idle mode
+---------
+
+.. versionadded:: 1.9.0
+
+By default, the main loop runs continuously: with `maxfps` set to 0 it never
+sleeps, otherwise it sleeps for the rest of the frame budget whether or not
+there is something to do. Setting the `idle_timeout` token of the `graphics`
+section of the configuration (or :attr:`ClockBase.idle_timeout`) to a value
+greater than 0 makes :meth:`ClockBase.tick` sleep until:
+
+* the next scheduled event is due,
+* :meth:`ClockBase.wakeup` is called, for example by an input provider
+  receiving new events, an event being scheduled from another thread, or the
+  window canvas needing a redraw,
+* or `idle_timeout` seconds elapsed, so that the window events which are
+  polled by the window provider are still handled.
+
+The window is only redrawn when its canvas changed, so an application
+displaying a static screen uses almost no CPU.
+
 Threading
 ----------
 
@@ -205,17 +295,41 @@ from two threads simultaneously without any locking mechanism::
 
 Note, in the code above, thread 1 or thread 2 could be the kivy thread, not
 just an external thread.
+
+Scheduling from threads
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Threads handing many results back to the kivy thread should use
+:meth:`ClockBase.schedule_from_thread`. The callbacks are appended to a
+queue which is drained once per frame, at the start of :meth:`ClockBase.tick`,
+without touching the scheduled events nor taking any lock::
+
+    def on_result(self, result):
+        Clock.schedule_from_thread(partial(self.show_result, result))
+
+The queue can be bounded by setting :attr:`ClockBase.max_thread_callbacks`.
+When it is full, :meth:`~ClockBase.schedule_from_thread` either returns False
+or, if `block` is True, waits for the kivy thread to drain it.
+:attr:`ClockBase.pending_thread_callbacks` gives the number of callbacks
+waiting in the queue. The :func:`mainthread` decorator uses this queue.
 '''
 
-__all__ = ('Clock', 'ClockBase', 'ClockEvent', 'mainthread')
+__all__ = ('Clock', 'ClockBase', 'ClockBaseHeap', 'ClockEvent', 'ClockWork',
+           'ClockProfiler', 'mainthread')
 
 from sys import platform
 from os import environ
 from functools import wraps, partial
+from heapq import heapify, heappop, heappush
+from bisect import bisect_left
+from itertools import count
+from threading import Condition, Event, current_thread
+from collections import deque
 from kivy.context import register_context
 from kivy.weakmethod import WeakMethod
 from kivy.config import Config
 from kivy.logger import Logger
+import json
 import time
 
 try:
@@ -291,12 +405,15 @@ class ClockEvent(object):
         self.loop = loop
         self.weak_callback = None
         self.callback = callback
-        self.timeout = timeout
+        self._timeout = timeout
         self._is_triggered = trigger
         self._last_dt = starttime
         self._dt = 0.
+        # bookkeeping owned by the clock the event is scheduled in
+        self._clock_key = None
+        self._clock_seq = 0
         if trigger:
-            clock._events[cid].append(self)
+            clock._schedule_event(self)
 
     def __call__(self, *largs):
         ''' Schedules the callback associated with this instance.
@@ -307,7 +424,7 @@ class ClockEvent(object):
             self._is_triggered = True
             # update starttime
             self._last_dt = self.clock._last_tick
-            self.clock._events[self.cid].append(self)
+            self.clock._schedule_event(self)
             return True
 
     def get_callback(self):
@@ -323,15 +440,30 @@ class ClockEvent(object):
     def is_triggered(self):
         return self._is_triggered
 
+    @property
+    def timeout(self):
+        '''The timeout of the event, in seconds, -1 for before the next frame.
+        It can be changed while the event is scheduled: the next call is then
+        due after the new timeout, counted from the last call.
+
+        .. versionchanged:: 1.9.0
+            The changes are taken into account by :class:`ClockBaseHeap`.
+        '''
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        old = self._timeout
+        self._timeout = value
+        if self._is_triggered and value != old:
+            self.clock._update_event_timeout(self, old)
+
     def cancel(self):
         ''' Cancels the callback if it was scheduled to be called.
         '''
         if self._is_triggered:
             self._is_triggered = False
-            try:
-                self.clock._events[self.cid].remove(self)
-            except ValueError:
-                pass
+            self.clock._cancel_event(self)
 
     def release(self):
         self.weak_callback = WeakMethod(self.callback)
@@ -341,7 +473,7 @@ class ClockEvent(object):
         # timeout happened ? (check also if we would miss from 5ms) this
         # 5ms increase the accuracy if the timing of animation for
         # example.
-        if curtime - self._last_dt < self.timeout - 0.005:
+        if curtime - self._last_dt < self._timeout - 0.005:
             return True
 
         # calculate current timediff for this event
@@ -371,7 +503,11 @@ class ClockEvent(object):
                 pass
 
         # call the callback
-        ret = callback(self._dt)
+        profiler = self.clock._profiler
+        if profiler is None:
+            ret = callback(self._dt)
+        else:
+            ret = profiler.run_callback(callback, self._dt)
 
         # if the user returns False explicitly, remove the event
         if loop and ret is False:
@@ -387,13 +523,197 @@ class ClockEvent(object):
         return '<ClockEvent callback=%r>' % self.get_callback()
 
 
+def _callback_name(callback):
+    if isinstance(callback, partial):
+        callback = callback.func
+    name = getattr(callback, '__name__', None)
+    if name is None:
+        return repr(callback)
+    obj = getattr(callback, '__self__', None)
+    if obj is not None:
+        name = '%s.%s' % (obj.__class__.__name__, name)
+    module = getattr(callback, '__module__', None)
+    if module is not None:
+        name = '%s.%s' % (module, name)
+    return name
+
+
+class ClockProfiler(object):
+    '''Records the time spent in the callbacks and the steps of a
+    :class:`ClockBase`, created by :meth:`ClockBase.start_profiling`. See
+    :ref:`clock-profiling`.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    #: Upper bounds, in seconds, of the buckets of the histograms. The last
+    #: bucket counts the calls longer than the last bound.
+    histogram_bounds = (.0001, .0005, .001, .002, .005, .01, .02, .05, .1)
+
+    #: Maximum number of calls recorded in the timeline.
+    max_trace_events = 1000000
+
+    def __init__(self, trace=True):
+        self.trace = trace
+        self.stats = {}
+        self.events = []
+        self.time = getattr(time, 'perf_counter', _default_time)
+        self.start_time = self.time()
+
+    def run(self, name, category, func, *largs):
+        '''Call `func` with `largs` and record its duration under `name`.
+        '''
+        clock = self.time
+        start = clock()
+        try:
+            return func(*largs)
+        finally:
+            self.record(name, category, start, clock())
+
+    def run_callback(self, callback, dt):
+        '''Call a clock callback and record its duration.
+        '''
+        clock = self.time
+        start = clock()
+        try:
+            return callback(dt)
+        finally:
+            self.record(_callback_name(callback), 'callback', start, clock())
+
+    def record(self, name, category, start, end):
+        '''Record a call of `name` that lasted from `start` to `end`.
+        '''
+        duration = end - start
+        stats = self.stats.get((name, category))
+        if stats is None:
+            stats = self.stats[(name, category)] = [
+                0, 0., 0., [0] * (len(self.histogram_bounds) + 1)]
+        stats[0] += 1
+        stats[1] += duration
+        if duration > stats[2]:
+            stats[2] = duration
+        stats[3][bisect_left(self.histogram_bounds, duration)] += 1
+
+        if self.trace:
+            if len(self.events) < self.max_trace_events:
+                self.events.append((name, category, start, duration))
+            else:
+                Logger.warning('Clock: Too many calls recorded, the timeline '
+                               'is not recorded anymore')
+                self.trace = False
+
+    def get_stats(self, category=None):
+        '''Return a list of dicts with the `name`, `category`, `count`,
+        `total`, `mean` and `max` time, and the `histogram` of each recorded
+        callback or clock step, sorted by decreasing total time.
+        '''
+        result = []
+        for (name, cat), (n, total, maximum, histogram) in self.stats.items():
+            if category is not None and cat != category:
+                continue
+            result.append({
+                'name': name, 'category': cat, 'count': n, 'total': total,
+                'mean': total / n, 'max': maximum,
+                'histogram': list(histogram)})
+        result.sort(key=lambda x: x['total'], reverse=True)
+        return result
+
+    def print_stats(self, limit=20):
+        '''Log the `limit` most expensive callbacks and clock steps.
+        '''
+        Logger.info('Clock: %-50s %8s %10s %10s %10s' % (
+            'name', 'count', 'total ms', 'mean ms', 'max ms'))
+        for stats in self.get_stats()[:limit]:
+            Logger.info('Clock: %-50s %8d %10.3f %10.3f %10.3f' % (
+                stats['name'][-50:], stats['count'], stats['total'] * 1000,
+                stats['mean'] * 1000, stats['max'] * 1000))
+
+    def export_trace(self, filename):
+        '''Write the recorded timeline in the Chrome trace event format, which
+        can be loaded in chrome://tracing.
+        '''
+        start_time = self.start_time
+        events = [{
+            'name': name, 'cat': category, 'ph': 'X', 'pid': 0, 'tid': 0,
+            'ts': (start - start_time) * 1e6, 'dur': duration * 1e6}
+            for name, category, start, duration in self.events]
+        with open(filename, 'w') as fd:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fd)
+
+
+class ClockWork(object):
+    '''A work scheduled with :meth:`ClockBase.schedule_work`. This class is
+    never created by the user; instead, kivy creates and returns an instance of
+    this class when scheduling a work.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    def __init__(self, clock, work, priority, on_complete):
+        if callable(work):
+            work = (work, )
+        self.clock = clock
+        self.priority = priority
+        self.on_complete = on_complete
+        self._iter = iter(work)
+        self._is_done = False
+        #: The exception raised by a step of the work, or None. The work is
+        #: finished by the exception: the remaining steps are not done, and
+        #: `on_complete` is called.
+        self.error = None
+
+    @property
+    def is_done(self):
+        '''True when the work is finished, failed or canceled.
+        '''
+        return self._is_done
+
+    def cancel(self):
+        '''Cancels the remaining steps of the work. `on_complete` is not
+        called.
+        '''
+        self._is_done = True
+
+    def step(self):
+        '''Runs the next step of the work, and returns True if the work is
+        done. An exception raised by the step is logged and stored in
+        :attr:`error`, and finishes the work.
+        '''
+        if self._is_done:
+            return True
+        try:
+            job = next(self._iter)
+            if callable(job):
+                job()
+        except StopIteration:
+            pass
+        except Exception as e:
+            Logger.exception('Clock: Exception in the step of %r' % self)
+            self.error = e
+        else:
+            return False
+        self._is_done = True
+        if self.on_complete is not None:
+            self.on_complete(self)
+        return True
+
+    def __repr__(self):
+        return '<ClockWork priority=%r done=%r error=%r>' % (
+            self.priority, self._is_done, self.error)
+
+
 class ClockBase(_ClockBase):
     '''A clock object with event support.
     '''
     __slots__ = ('_dt', '_last_fps_tick', '_last_tick', '_fps', '_rfps',
                  '_start_tick', '_fps_counter', '_rfps_counter', '_events',
                  '_frames', '_frames_displayed',
-                 '_max_fps', 'max_iteration')
+                 '_max_fps', 'max_iteration', 'idle_timeout',
+                 '_wake_event', '_sleeping', '_wakeup_hook', 'work_budget',
+                 '_works', '_works_counter', '_profiler',
+                 'max_thread_callbacks',
+                 '_thread_queue', '_thread_condition', '_thread_waiters',
+                 '_thread')
 
     MIN_SLEEP = 0.005
     SLEEP_UNDERSHOOT = MIN_SLEEP - 0.001
@@ -418,6 +738,34 @@ class ClockBase(_ClockBase):
         #:     relayout.
         self.max_iteration = 10
 
+        #: .. versionadded:: 1.9.0
+        #:     When greater than 0, :meth:`tick` sleeps until the next
+        #:     scheduled event is due or :meth:`wakeup` is called, but never
+        #:     longer than this number of seconds. See :ref:`clock-idle`.
+        self.idle_timeout = Config.getfloat('graphics', 'idle_timeout')
+        self._wake_event = Event()
+        self._sleeping = False
+        # called, from any thread, when the clock is woken up or something is
+        # scheduled, by a main loop that doesn't sleep in tick()
+        self._wakeup_hook = None
+
+        #: .. versionadded:: 1.9.0
+        #:     Time in seconds allowed on each frame for the steps of the works
+        #:     scheduled with :meth:`schedule_work`.
+        self.work_budget = 0.005
+        self._works = []
+        self._works_counter = count()
+        self._profiler = None
+
+        #: .. versionadded:: 1.9.0
+        #:     Maximum number of callbacks waiting in the queue of
+        #:     :meth:`schedule_from_thread`, 0 for no limit.
+        self.max_thread_callbacks = 0
+        self._thread_queue = deque()
+        self._thread_condition = Condition()
+        self._thread_waiters = 0
+        self._thread = current_thread()
+
     @property
     def frametime(self):
         '''Time spent between the last frame and the current frame
@@ -449,6 +797,10 @@ class ClockBase(_ClockBase):
 
         self._release_references()
 
+        # wait for something to do
+        if self.idle_timeout > 0:
+            self._idle_sleep()
+
         # do we need to sleep ?
         if self._max_fps > 0:
             min_sleep = self.MIN_SLEEP
@@ -479,18 +831,111 @@ class ClockBase(_ClockBase):
             self._fps_counter = 0
             self._rfps_counter = 0
 
+        # callbacks sent by other threads
+        if self._thread_queue:
+            self._process_thread_queue()
+
         # process event
-        self._process_events()
+        profiler = self._profiler
+        if profiler is None:
+            self._process_events()
+        else:
+            profiler.run('process_events', 'clock', self._process_events)
+
+        # then the deferred work, as long as the frame budget allows it
+        if self._works:
+            if profiler is None:
+                self._process_works()
+            else:
+                profiler.run('process_works', 'clock', self._process_works)
 
         return self._dt
 
     def tick_draw(self):
         '''Tick the drawing counter.
         '''
-        self._process_events_before_frame()
+        profiler = self._profiler
+        if profiler is None:
+            self._process_events_before_frame()
+        else:
+            profiler.run('tick_draw', 'clock',
+                         self._process_events_before_frame)
         self._rfps_counter += 1
         self._frames_displayed += 1
 
+    @property
+    def profiler(self):
+        '''The :class:`ClockProfiler` recording the clock activity, or None if
+        the profiling is not started. See :ref:`clock-profiling`.
+
+        .. versionadded:: 1.9.0
+        '''
+        return self._profiler
+
+    def start_profiling(self, trace=True):
+        '''Start recording the time spent in each callback and in each step
+        of the clock, and return the :class:`ClockProfiler`. If `trace` is
+        True, the timeline is recorded as well, for
+        :meth:`ClockProfiler.export_trace`.
+
+        .. versionadded:: 1.9.0
+        '''
+        self._profiler = ClockProfiler(trace=trace)
+        return self._profiler
+
+    def stop_profiling(self):
+        '''Stop the profiling, and return the :class:`ClockProfiler` with the
+        recorded data.
+
+        .. versionadded:: 1.9.0
+        '''
+        profiler = self._profiler
+        self._profiler = None
+        return profiler
+
+    def wakeup(self):
+        '''Interrupt the idle sleep of the clock, or make the next one return
+        immediately. Can be called from any thread, typically by input
+        providers when new events are available.
+
+        .. versionadded:: 1.9.0
+        '''
+        self._wake_event.set()
+        if self._wakeup_hook is not None:
+            self._wakeup_hook()
+
+    def get_next_event_timeout(self):
+        '''Return the time in seconds until the next scheduled event is due,
+        0 if an event is already due, or None if nothing is scheduled.
+
+        .. versionadded:: 1.9.0
+        '''
+        if self._works or self._thread_queue:
+            return 0
+        deadline = None
+        for events in self._events:
+            for event in events:
+                if event.timeout == -1:
+                    return 0
+                ev_deadline = event._last_dt + event.timeout
+                if deadline is None or ev_deadline < deadline:
+                    deadline = ev_deadline
+        if deadline is None:
+            return None
+        return max(0, deadline - 0.005 - self.time())
+
+    def _idle_sleep(self):
+        wake_event = self._wake_event
+        # events scheduled from another thread from now will wake us up
+        self._sleeping = True
+        timeout = self.get_next_event_timeout()
+        if timeout is None or timeout > self.idle_timeout:
+            timeout = self.idle_timeout
+        if timeout > 0:
+            wake_event.wait(timeout)
+        self._sleeping = False
+        wake_event.clear()
+
     def get_fps(self):
         '''Get the current average FPS calculated by the clock.
         '''
@@ -565,6 +1010,116 @@ class ClockBase(_ClockBase):
             True)
         return event
 
+    def schedule_from_thread(self, callback, block=False, timeout=None):
+        '''Schedule `callback` to be called at the start of the next tick, from
+        any thread. The callback is called with the frame time, and is not
+        weak-referenced.
+
+        :parameters:
+
+            `callback`: callable
+                The callback to call in the kivy thread.
+            `block`: bool
+                If the queue is full (see :attr:`max_thread_callbacks`), wait
+                until the kivy thread drained it. Ignored when called from the
+                kivy thread. Defaults to False.
+            `timeout`: float
+                Maximum time to wait if `block` is True, None to wait as long
+                as needed. Defaults to None.
+
+        :returns:
+
+            True if the callback is scheduled, False if the queue is full.
+
+        .. versionadded:: 1.9.0
+        '''
+        queue = self._thread_queue
+        maxlen = self.max_thread_callbacks
+        if maxlen and len(queue) >= maxlen:
+            if not block or current_thread() is self._thread:
+                return False
+            condition = self._thread_condition
+            with condition:
+                self._thread_waiters += 1
+                try:
+                    if timeout is not None:
+                        end = self.time() + timeout
+                    while len(queue) >= maxlen:
+                        if timeout is None:
+                            condition.wait()
+                            continue
+                        remaining = end - self.time()
+                        if remaining <= 0:
+                            return False
+                        condition.wait(remaining)
+                finally:
+                    self._thread_waiters -= 1
+        queue.append(callback)
+        if self._sleeping:
+            self._wake_event.set()
+        if self._wakeup_hook is not None:
+            self._wakeup_hook()
+        return True
+
+    @property
+    def pending_thread_callbacks(self):
+        '''Number of callbacks scheduled with :meth:`schedule_from_thread`
+        waiting for the next tick.
+
+        .. versionadded:: 1.9.0
+        '''
+        return len(self._thread_queue)
+
+    def _process_thread_queue(self):
+        # only the callbacks queued so far, the next ones wait for the next
+        # tick
+        queue = self._thread_queue
+        popleft = queue.popleft
+        profiler = self._profiler
+        dt = self._dt
+        try:
+            for x in range(len(queue)):
+                if profiler is None:
+                    popleft()(dt)
+                else:
+                    profiler.run_callback(popleft(), dt)
+        finally:
+            if self._thread_waiters:
+                with self._thread_condition:
+                    self._thread_condition.notify_all()
+
+    def schedule_work(self, work, priority=0, on_complete=None):
+        '''Schedule a work to be done in small steps, within the
+        :attr:`work_budget` of each frame. See :ref:`clock-work`.
+
+        :parameters:
+
+            `work`: iterable or callable
+                Each item of the iterable is one step of the work. If the
+                item is callable, it is called. A generator can be used to
+                do the work step by step. A callable is a work of one step.
+            `priority`: int
+                Works with a higher priority are done first. Defaults to 0.
+            `on_complete`: callable
+                Called with the :class:`ClockWork` once all the steps are
+                done, or once a step raised an exception (see
+                :attr:`ClockWork.error`). Defaults to None.
+
+        :returns:
+
+            A :class:`ClockWork` instance, that can be used to cancel the
+            work.
+
+        .. versionadded:: 1.9.0
+        '''
+        work = ClockWork(self, work, priority, on_complete)
+        heappush(self._works, (-priority, next(self._works_counter), work))
+        if self._sleeping:
+            self._wake_event.set()
+        if self._wakeup_hook is not None:
+            self._wakeup_hook()
+        return work
+
     def unschedule(self, callback, all=True):
         '''Remove a previously scheduled event.
 
@@ -597,10 +1152,29 @@ class ClockBase(_ClockBase):
                         ev.cancel()
                         break
 
+    def _schedule_event(self, event):
+        # called by the event when it gets (re)triggered
+        self._events[event.cid].append(event)
+        if self._sleeping:
+            self._wake_event.set()
+        if self._wakeup_hook is not None:
+            self._wakeup_hook()
+
+    def _cancel_event(self, event):
+        # called by the event when it is canceled
+        try:
+            self._events[event.cid].remove(event)
+        except ValueError:
+            pass
+
+    def _update_event_timeout(self, event, old):
+        # called by the event when its timeout changes while it's scheduled,
+        # the events are scanned on each tick with their current timeout
+        pass
+
     def _release_references(self):
         # call that function to release all the direct reference to any
         # callback and replace it with a weakref
-        events = self._events
         for events in self._events:
             for event in events[:]:
                 if event.callback is not None:
@@ -614,10 +1188,26 @@ class ClockBase(_ClockBase):
                 if event in events:
                     event.tick(self._last_tick, remove)
 
+    def _process_works(self):
+        works = self._works
+        time = self.time
+        end = time() + self.work_budget
+        while works:
+            entry = heappop(works)
+            work = entry[2]
+            # do at least one step per frame, and let a work with a higher
+            # priority scheduled in the meantime go first
+            while not work.step():
+                if time() >= end or works and works[0] < entry:
+                    heappush(works, entry)
+                    break
+            if time() >= end:
+                break
+
     def _process_events_before_frame(self):
         found = True
         count = self.max_iteration
-        events = self._events
+        profiler = self._profiler
         while found:
             count -= 1
             if count == -1:
@@ -627,17 +1217,26 @@ class ClockBase(_ClockBase):
                     ' the Clock.max_iteration attribute')
                 break
 
-            # search event that have timeout = -1
-            found = False
-            for events in self._events:
-                remove = events.remove
-                for event in events[:]:
-                    if event.timeout != -1:
-                        continue
-                    found = True
-                    # event may be already removed from original list
-                    if event in events:
-                        event.tick(self._last_tick, remove)
+            if profiler is None:
+                found = self._process_events_before_frame_pass()
+            else:
+                found = profiler.run(
+                    'before_frame_pass', 'clock',
+                    self._process_events_before_frame_pass)
+
+    def _process_events_before_frame_pass(self):
+        # search event that have timeout = -1, return True if any was found
+        found = False
+        for events in self._events:
+            remove = events.remove
+            for event in events[:]:
+                if event.timeout != -1:
+                    continue
+                found = True
+                # event may be already removed from original list
+                if event in events:
+                    event.tick(self._last_tick, remove)
+        return found
 
     time = staticmethod(partial(_default_time))
 
@@ -645,12 +1244,191 @@ ClockBase.time.__doc__ = '''Proxy method for time.time() or time.clock(),
 whichever is more suitable for the running OS'''
 
 
+def _callback_key(callback):
+    # bound methods are recreated by WeakMethod, so key them by their
+    # instance and name rather than by their own id
+    obj = getattr(callback, '__self__', None)
+    if obj is not None:
+        return id(obj), getattr(callback, '__name__', None)
+    return id(callback)
+
+
+class ClockBaseHeap(ClockBase):
+    '''A clock object that keeps its events in a binary heap ordered by
+    deadline, instead of scanning every scheduled event on each tick.
+
+    A tick only touches the events that are due, which makes the cost of a
+    frame independent of the number of pending events. Unscheduling uses an
+    index of the callbacks, and canceling an event is O(1): its heap entry is
+    left in place and skipped when popped, the heap being compacted once the
+    stale entries outnumber the live ones.
+
+    Events with a timeout of -1 are kept in a separate list processed by
+    :meth:`tick_draw`, as with :class:`ClockBase`.
+
+    This clock is used when the `kivy_clock` configuration token or the
+    `KIVY_CLOCK` environment variable is set to `heap`.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    __slots__ = ('_heap', '_heap_counter', '_heap_stale', '_callbacks',
+                 '_events_before_frame', '_new_events')
+
+    def __init__(self):
+        super(ClockBaseHeap, self).__init__()
+        self._heap = []
+        self._heap_counter = count(1)
+        self._heap_stale = 0
+        self._callbacks = {}
+        self._events_before_frame = []
+        self._new_events = []
+
+    def unschedule(self, callback, all=True):
+        if isinstance(callback, ClockEvent):
+            callback.cancel()
+            return
+        events = self._callbacks.get(_callback_key(callback))
+        if not events:
+            return
+        for ev in events[:]:
+            if ev.get_callback() == callback:
+                ev.cancel()
+                if not all:
+                    break
+
+    def _push(self, event):
+        event._clock_seq = seq = next(self._heap_counter)
+        heappush(self._heap, (event._last_dt + event.timeout, seq, event))
+
+    def _schedule_event(self, event):
+        if event._clock_key is None:
+            event._clock_key = _callback_key(event.get_callback())
+        self._callbacks.setdefault(event._clock_key, []).append(event)
+        if event.callback is not None:
+            self._new_events.append(event)
+
+        if event.timeout == -1:
+            self._events_before_frame.append(event)
+        else:
+            self._push(event)
+        if self._sleeping:
+            self._wake_event.set()
+        if self._wakeup_hook is not None:
+            self._wakeup_hook()
+
+    def get_next_event_timeout(self):
+        if self._events_before_frame or self._works or self._thread_queue:
+            return 0
+        heap = self._heap
+        # drop the stale entries hiding the next live event
+        while heap and heap[0][2]._clock_seq != heap[0][1]:
+            heappop(heap)
+            self._heap_stale -= 1
+        if not heap:
+            return None
+        return max(0, heap[0][0] - 0.005 - self.time())
+
+    def _remove_event(self, event):
+        # only drop the event from the indexes, its heap entry is either
+        # already popped or will be skipped as stale
+        events = self._callbacks.get(event._clock_key)
+        if events is not None:
+            try:
+                events.remove(event)
+            except ValueError:
+                pass
+            if not events:
+                del self._callbacks[event._clock_key]
+        if event.timeout == -1:
+            try:
+                self._events_before_frame.remove(event)
+            except ValueError:
+                pass
+
+    def _cancel_event(self, event):
+        self._remove_event(event)
+        if event.timeout != -1:
+            self._drop_heap_entry(event)
+
+    def _update_event_timeout(self, event, old):
+        # move the event to the list or the heap entry of its new timeout
+        if old == -1:
+            try:
+                self._events_before_frame.remove(event)
+            except ValueError:
+                pass
+        else:
+            self._drop_heap_entry(event)
+        if event.timeout == -1:
+            self._events_before_frame.append(event)
+        else:
+            self._push(event)
+
+    def _drop_heap_entry(self, event):
+        # the heap entry of the event is left in place and skipped as stale
+        if not event._clock_seq:
+            return
+        event._clock_seq = 0
+        self._heap_stale += 1
+        heap = self._heap
+        if self._heap_stale > 64 and self._heap_stale * 2 > len(heap):
+            heap[:] = [entry for entry in heap
+                       if entry[2]._clock_seq == entry[1]]
+            heapify(heap)
+            self._heap_stale = 0
+
+    def _release_references(self):
+        for event in self._new_events:
+            if event.callback is not None:
+                event.release()
+        del self._new_events[:]
+
+    def _process_events(self):
+        heap = self._heap
+        curtime = self._last_tick
+        # same 5ms tolerance as in ClockEvent.tick()
+        limit = curtime + 0.005
+        due = []
+        while heap and heap[0][0] <= limit:
+            due.append(heappop(heap))
+
+        remove = self._remove_event
+        for deadline, seq, event in due:
+            if event._clock_seq != seq:
+                self._heap_stale -= 1
+                continue
+            # the event is out of the heap while its callback runs
+            event._clock_seq = 0
+            # the callback may have rescheduled the event, or changed its
+            # timeout, which reschedules it
+            if (event.tick(curtime, remove) and event._is_triggered and
+                    not event._clock_seq and event.timeout != -1):
+                self._push(event)
+
+        events = self._events_before_frame
+        for event in events[:]:
+            if event in events:
+                event.tick(curtime, remove)
+
+    def _process_events_before_frame_pass(self):
+        events = self._events_before_frame
+        remove = self._remove_event
+        found = bool(events)
+        for event in events[:]:
+            # event may be already removed from original list
+            if event in events:
+                event.tick(self._last_tick, remove)
+        return found
+
+
 def mainthread(func):
     '''Decorator that will schedule the call of the function for the next
     available frame in the mainthread. It can be useful when you use
     :class:`~kivy.network.urlrequest.UrlRequest` or when you do Thread
     programming: you cannot do any OpenGL-related work in a thread.
 
+    The call is scheduled with :meth:`ClockBase.schedule_from_thread`.
     Please note that this method will return directly and no result can be
     returned::
 
@@ -662,16 +1440,28 @@ def mainthread(func):
         self.req = UrlRequest(url='http://...', on_success=callback)
 
     .. versionadded:: 1.8.0
+
+    .. versionchanged:: 1.9.0
+        Uses :meth:`ClockBase.schedule_from_thread`, and waits if its queue is
+        full. In the kivy thread, which can't wait for the queue, the call is
+        scheduled with :meth:`ClockBase.schedule_once` instead.
     '''
     @wraps(func)
     def delayed_func(*args, **kwargs):
         def callback_func(dt):
             func(*args, **kwargs)
-        Clock.schedule_once(callback_func, 0)
+        if not Clock.schedule_from_thread(callback_func, block=True):
+            # the queue is full, and we are in the kivy thread
+            Clock.schedule_once(callback_func, 0)
     return delayed_func
 
 if 'KIVY_DOC_INCLUDE' in environ:
     #: Instance of :class:`ClockBase`.
     Clock = None
 else:
-    Clock = register_context('Clock', ClockBase)
+    _clocks = {'default': ClockBase, 'heap': ClockBaseHeap}
+    _clock = environ.get('KIVY_CLOCK', Config.get('kivy', 'kivy_clock'))
+    if _clock not in _clocks:
+        Logger.warning('Clock: Unknown clock <%s>, using default' % _clock)
+        _clock = 'default'
+    Clock = register_context('Clock', _clocks[_clock])
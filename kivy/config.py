@@ -68,6 +68,11 @@ Available configuration tokens
         * 'systemanddock' - virtual docked keyboard plus input from real
           keyboard.
         * 'systemandmulti' - analogous.
+    `kivy_clock`: one of `default`, `heap`
+        The clock implementation to use. `heap` selects
+        :class:`~kivy.clock.ClockBaseHeap`, which only processes the due
+        events on each frame and is faster when a lot of events are
+        scheduled. See :mod:`kivy.clock`.
     `log_dir`: string
         Path of log directory.
     `log_enable`: int, 0 or 1
@@ -76,6 +81,9 @@ Available configuration tokens
         Set the minimum log level to use.
     `log_name`: string
         Format string to use for the filename of log file.
+    `memory_trim_fraction`: float, defaults to 0.5
+        Fraction of their current size that the caches keep when the system
+        is low on memory. See :meth:`kivy.cache.Cache.release_memory`.
     `window_icon`: string
         Path of the window icon. Use this if you want to replace the default
         pygame icon.
@@ -127,6 +135,10 @@ Available configuration tokens
     `height`: int
         Height of the :class:`~kivy.core.window.Window`, not used if
         `fullscreen` is set to `auto`.
+    `idle_timeout`: float, defaults to 0
+        If greater than 0, the main loop sleeps until there is something to
+        do, but never longer than this number of seconds. See
+        :ref:`clock-idle`.
     `left`: int
         Left position of the :class:`~kivy.core.window.Window`.
     `maxfps`: int, defaults to 60
@@ -234,6 +246,9 @@ Available configuration tokens
     The `fake` option of `fullscreen` in the graphics section has been
     deprecated, use the `borderless` option instead.
     `pause_on_minimize` has been added to the kivy section.
+    `kivy_clock` has been added to the kivy section.
+    `idle_timeout` has been added to the graphics section.
+    `memory_trim_fraction` has been added to the kivy section.
 
 .. versionchanged:: 1.8.0
     `systemanddock` and `systemandmulti` has been added as possible values for
@@ -274,7 +289,7 @@ from weakref import ref
 _is_rpi = exists('/opt/vc/include/bcm_host.h')
 
 # Version number of current configuration format
-KIVY_CONFIG_VERSION = 12
+KIVY_CONFIG_VERSION = 15
 
 Config = None
 '''Kivy configuration object. Its :attr:`~kivy.config.ConfigParser.name` is
@@ -744,6 +759,15 @@ if not environ.get('KIVY_DOC_INCLUDE'):
         elif version == 11:
             Config.setdefault('kivy', 'pause_on_minimize', '0')
 
+        elif version == 12:
+            Config.setdefault('kivy', 'kivy_clock', 'default')
+
+        elif version == 13:
+            Config.setdefault('graphics', 'idle_timeout', '0')
+
+        elif version == 14:
+            Config.setdefault('kivy', 'memory_trim_fraction', '0.5')
+
         #elif version == 1:
         #   # add here the command for upgrading from configuration 0 to 1
         #
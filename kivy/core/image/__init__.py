@@ -300,6 +300,70 @@ class ImageLoaderBase(object):
         return self._nocache
 
 
+class ImageLoaderDisk(ImageLoaderBase):
+    '''Image loader for the decoded images stored in the disk tier of the
+    `kv.image` cache category. See :meth:`kivy.cache.Cache.register_disk`.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    def __init__(self, filename, data, **kwargs):
+        self._disk_data = data
+        super(ImageLoaderDisk, self).__init__(filename, **kwargs)
+
+    def load(self, filename):
+        return self._disk_data
+
+    @staticmethod
+    def dump(image):
+        '''Return the `(meta, data)` to store in the disk tier for a list of
+        :class:`ImageData`, or None if the data has already been released.
+        '''
+        meta = []
+        chunks = []
+        offset = 0
+        for imagedata in image:
+            mipmaps = []
+            for level, width, height, data, rowlength in \
+                    imagedata.iterate_mipmaps():
+                if data is None:
+                    return None
+                if isinstance(data, memoryview):
+                    data = data.tobytes()
+                chunks.append(data)
+                mipmaps.append((width, height, rowlength, offset, len(data)))
+                offset += len(data)
+            meta.append({'fmt': imagedata.fmt, 'mipmaps': mipmaps,
+                         'flip_vertical': imagedata.flip_vertical})
+        return meta, b''.join(bytes(chunk) if isinstance(chunk, bytearray)
+                              else chunk for chunk in chunks)
+
+    @staticmethod
+    def restore(filename, meta, data):
+        '''Build the list of :class:`ImageData` stored by :meth:`dump`.
+        '''
+        image = []
+        for item in meta:
+            imagedata = None
+            for level, (width, height, rowlength, offset, length) in \
+                    enumerate(item['mipmaps']):
+                # data is a read-only view of the cache file, and the texture
+                # upload needs bytes or a writable buffer
+                chunk = data[offset:offset + length]
+                if not isinstance(chunk, bytes):
+                    chunk = chunk.tobytes()
+                if imagedata is None:
+                    imagedata = ImageData(
+                        width, height, item['fmt'], chunk, source=filename,
+                        flip_vertical=item['flip_vertical'],
+                        rowlength=rowlength)
+                else:
+                    imagedata.add_mipmap(level, width, height, chunk,
+                                         rowlength)
+            image.append(imagedata)
+        return image
+
+
 class ImageLoader(object):
 
     loaders = []
@@ -420,6 +484,19 @@ class ImageLoader(object):
         if ext == 'zip':
             return ImageLoader.zip_loader(filename)
         else:
+            # decoded image stored in the disk cache ?
+            stored = None
+            if filename and 'kv.image' in Cache._disks:
+                stored = Cache.disk_get('kv.image', filename, source=filename)
+            if stored is not None:
+                Logger.debug('ImageDisk: Load <%s>' % filename)
+                try:
+                    image = ImageLoaderDisk.restore(filename, *stored)
+                except (ValueError, TypeError, KeyError, AssertionError):
+                    Cache.disk_remove('kv.image', filename)
+                else:
+                    return ImageLoaderDisk(filename, image, **kwargs)
+
             im = None
             for loader in ImageLoader.loaders:
                 if ext not in loader.extensions():
@@ -430,6 +507,14 @@ class ImageLoader(object):
                 break
             if im is None:
                 raise Exception('Unknown <%s> type, no loader found.' % ext)
+
+            # store the decoded image for the next loads
+            if filename and 'kv.image' in Cache._disks and \
+                    isinstance(im, ImageLoaderBase) and im._data:
+                stored = ImageLoaderDisk.dump(im._data)
+                if stored is not None:
+                    Cache.disk_append('kv.image', filename, stored[1],
+                                      meta=stored[0], source=filename)
             return im
 
 
@@ -40,6 +40,7 @@ from functools import partial
 from copy import copy
 from kivy import kivy_data_dir
 from kivy.utils import platform
+from kivy.cache import Cache
 from kivy.graphics.texture import Texture
 from kivy.core import core_select_lib
 from kivy.core.text.text_layout import layout_text, LayoutWord
@@ -258,6 +259,34 @@ class LabelBase(object):
             fontscache[fontname] = filename
             options['font_name_r'] = filename
 
+    @staticmethod
+    def release_memory(fraction):
+        '''Close the least recently opened fonts, to keep only `fraction` of
+        the fonts cached by the provider. Called by
+        :meth:`kivy.cache.Cache.release_memory`.
+
+        Returns an estimate of the number of bytes released: the size of the
+        files of the closed fonts, the memory used by a font being at least
+        the size of its file. None if unknown.
+
+        .. versionadded:: 1.9.0
+        '''
+        return None
+
+    @staticmethod
+    def _font_memory(filename):
+        # estimate of the memory used by an opened font (see release_memory)
+        try:
+            return os.path.getsize(filename)
+        except (OSError, TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _font_id_memory(fontid):
+        # same for the 'size|filename|bold|italic' ids of _get_font_id()
+        filename = fontid.split('|', 1)[-1].rsplit('|', 2)[0]
+        return LabelBase._font_memory(filename)
+
     @staticmethod
     def get_system_fonts_dir():
         '''Return the Directory used by the system for fonts.
@@ -739,6 +768,8 @@ if 'KIVY_DOC' not in os.environ:
         Logger.critical('App: Unable to get a Text provider, abort.')
         sys.exit(1)
 
+    Cache.register_memory_handler(Label.release_memory)
+
 # For the first initalization, register the default font
     Label.register('DroidSans',
                    'data/fonts/DroidSans.ttf',
@@ -124,6 +124,17 @@ cdef TTF_Font *_get_font(self):
 
     return ttfc.font
 
+def _release_fonts(fraction):
+    # close the least recently opened fonts, and return their ids
+    cdef int keep = int(len(sdl2_cache_order) * fraction)
+    cdef list released = []
+    while len(sdl2_cache_order) > keep:
+        popid = sdl2_cache_order.pop(0)
+        del sdl2_cache[popid]
+        released.append(popid)
+    return released
+
+
 def _get_extents(container, text):
     cdef TTF_Font *font = _get_font(container)
     cdef int w, h
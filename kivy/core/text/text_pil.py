@@ -34,6 +34,17 @@ class LabelPIL(LabelBase):
 
         return self._cache[id]
 
+    @staticmethod
+    def release_memory(fraction):
+        cache = LabelPIL._cache
+        keys = list(cache.keys())
+        released = 0
+        for key in keys[:len(keys) - int(len(keys) * fraction)]:
+            del cache[key]
+            # the ids are 'filename.size'
+            released += LabelBase._font_memory(key.rsplit('.', 1)[0])
+        return released
+
     def get_extents(self, text):
         font = self._select_font()
         w, h = font.getsize(text)
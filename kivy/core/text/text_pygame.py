@@ -75,6 +75,19 @@ class LabelPygame(LabelBase):
 
         return pygame_cache[fontid]
 
+    @staticmethod
+    def release_memory(fraction):
+        keep = int(len(pygame_cache_order) * fraction)
+        released = 0
+        while len(pygame_cache_order) > keep:
+            popid = pygame_cache_order.pop(0)
+            del pygame_cache[popid]
+            font_handle = pygame_font_handles.pop(popid)
+            if font_handle is not None:
+                font_handle.close()
+            released += LabelBase._font_id_memory(popid)
+        return released
+
     def get_ascent(self):
         return self._get_font().get_ascent()
 
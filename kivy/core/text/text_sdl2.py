@@ -10,7 +10,8 @@ __all__ = ('LabelSDL2', )
 from kivy.compat import PY2
 from kivy.core.text import LabelBase
 from kivy.core.text._text_sdl2 import (_SurfaceContainer, _get_extents,
-                                       _get_fontdescent, _get_fontascent)
+                                       _get_fontdescent, _get_fontascent,
+                                       _release_fonts)
 
 
 class LabelSDL2(LabelBase):
@@ -39,6 +40,11 @@ class LabelSDL2(LabelBase):
     def get_ascent(self):
         return _get_fontascent(self)
 
+    @staticmethod
+    def release_memory(fraction):
+        return sum(LabelBase._font_id_memory(fontid)
+                   for fontid in _release_fonts(fraction))
+
     def _render_begin(self):
         self._surface = _SurfaceContainer(self._size[0], self._size[1])
 
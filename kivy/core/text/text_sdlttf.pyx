@@ -160,6 +160,16 @@ class LabelSDLttf(LabelBase):
     def get_ascent(self):
         return TTF_FontAscent(_get_font(self))
 
+    @staticmethod
+    def release_memory(fraction):
+        keep = int(len(pygame_cache_order) * fraction)
+        released = 0
+        while len(pygame_cache_order) > keep:
+            popid = pygame_cache_order.pop(0)
+            del pygame_cache[popid]
+            released += LabelBase._font_id_memory(popid)
+        return released
+
     def _render_begin(self):
         cdef _SurfaceContainer sc = _SurfaceContainer()
         cdef SDL_Rect r
@@ -252,6 +252,10 @@ class WindowBase(EventDispatcher):
 
         `on_dropfile`: str
             Fired when a file is dropped on the application.
+        `on_memorywarning`:
+            Fired when the system is low on memory.
+
+            .. versionadded:: 1.9.0
 
     '''
 
@@ -513,7 +517,8 @@ class WindowBase(EventDispatcher):
                   'on_mouse_down', 'on_mouse_move', 'on_mouse_up',
                   'on_keyboard', 'on_key_down', 'on_key_up', 'on_dropfile',
                   'on_request_close', 'on_joy_axis', 'on_joy_hat',
-                  'on_joy_ball', 'on_joy_button_down', "on_joy_button_up")
+                  'on_joy_ball', 'on_joy_button_down', "on_joy_button_up",
+                  'on_memorywarning')
 
     def __new__(cls, **kwargs):
         if cls.__instance is None:
@@ -1138,6 +1143,19 @@ class WindowBase(EventDispatcher):
         '''
         pass
 
+    def on_memorywarning(self):
+        '''Event called when the system is low on memory. By default, it calls
+        :meth:`kivy.cache.Cache.release_memory` to shrink the caches.
+
+        .. warning::
+
+            This event is currently only fired by the sdl2 window provider.
+
+        .. versionadded:: 1.9.0
+        '''
+        from kivy.cache import Cache
+        Cache.release_memory()
+
     @reify
     def dpi(self):
         '''Return the DPI of the screen. If the implementation doesn't support
@@ -153,6 +153,8 @@ cdef class _WindowSDL2Storage:
         action = None
         if event.type == SDL_QUIT:
             return ('quit', )
+        elif event.type == SDL_APP_LOWMEMORY:
+            return ('applowmemory', )
         elif event.type == SDL_DROPFILE:
             return ('dropfile', event.drop.file)
         elif event.type == SDL_MOUSEMOTION:
@@ -324,6 +324,9 @@ class WindowSDL(WindowBase):
             elif action == 'dropfile':
                 dropfile = args
                 self.dispatch('on_dropfile', dropfile[0])
+
+            elif action == 'applowmemory':
+                self.dispatch('on_memorywarning')
             # video resize
             elif action == 'windowresized':
                 self._size = args
@@ -3,10 +3,15 @@
 # conflict. We have one conflict with pygame.event and kivy.event => Both are
 # python extension and have the same "initevent" symbol. So right now, just
 # rename this one.
-__all__ = ('EventDispatcher', 'ObjectWithUid', 'Observable')
+__all__ = ('EventDispatcher', 'ObjectWithUid', 'Observable',
+           'DispatchProfiler', 'start_dispatch_profiling',
+           'stop_dispatch_profiling')
 
 import kivy._event
 __doc__ = kivy._event.__doc__
 EventDispatcher = kivy._event.EventDispatcher
 ObjectWithUid = kivy._event.ObjectWithUid
 Observable = kivy._event.Observable
+DispatchProfiler = kivy._event.DispatchProfiler
+start_dispatch_profiling = kivy._event.start_dispatch_profiling
+stop_dispatch_profiling = kivy._event.stop_dispatch_profiling
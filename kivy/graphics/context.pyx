@@ -225,6 +225,8 @@ cdef class Context:
         Cache._objects['kv.texture'] = texture_objects
         image_objects.update(Cache._objects['kv.image'])
         Cache._objects['kv.image'] = image_objects
+        Cache._update_usage('kv.texture')
+        Cache._update_usage('kv.image')
 
         gc_objects = gc.get_objects()[:]
         Logger.debug('Context: Reload vbos')
@@ -19,8 +19,8 @@ cdef class StripMesh(VertexInstruction):
 
 
 cdef class Mesh(VertexInstruction):
-    cdef list _vertices
-    cdef list _indices
+    cdef object _vertices
+    cdef object _indices
     cdef VertexFormat vertex_format
     cdef int is_built
 
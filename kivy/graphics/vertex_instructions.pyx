@@ -323,6 +323,20 @@ cdef class StripMesh(VertexInstruction):
         return 1
 
 
+cdef int is_contiguous_buffer(value, str fmt):
+    # whether value is a one-dimensional contiguous buffer of fmt items, that
+    # can be uploaded without being copied. Read-only buffers are copied: the
+    # typed memoryviews of build() need writable ones.
+    if isinstance(value, (list, tuple)):
+        return 0
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return 0
+    return (view.format == fmt and view.ndim == 1 and not view.readonly and
+            getattr(view, 'c_contiguous', False))
+
+
 cdef class Mesh(VertexInstruction):
     '''A 2d mesh.
 
@@ -418,47 +432,77 @@ cdef class Mesh(VertexInstruction):
         cdef long icount = len(self._indices)
         cdef float *vertices = NULL
         cdef unsigned short *indices = NULL
-        cdef list lvertices = self._vertices
-        cdef list lindices = self._indices
+        cdef float[::1] vview = None
+        cdef unsigned short[::1] iview = None
+        cdef list lvertices, lindices
         cdef vsize = self.batch.vbo.vertex_format.vsize
 
         if vcount == 0 or icount == 0:
             self.batch.clear_data()
             return
 
-        vertices = <float *>malloc(vcount * sizeof(float))
-        if vertices == NULL:
-            raise MemoryError('vertices')
-
-        indices = <unsigned short *>malloc(icount * sizeof(unsigned short))
-        if indices == NULL:
-            free(vertices)
-            raise MemoryError('indices')
-
-        for i in xrange(vcount):
-            vertices[i] = lvertices[i]
-        for i in xrange(icount):
-            indices[i] = lindices[i]
+        # buffers are uploaded from their own memory, lists are copied
+        if type(self._vertices) is list:
+            vertices = <float *>malloc(vcount * sizeof(float))
+            if vertices == NULL:
+                raise MemoryError('vertices')
+            lvertices = self._vertices
+            for i in xrange(vcount):
+                vertices[i] = lvertices[i]
+        else:
+            vview = self._vertices
+            vertices = &vview[0]
+
+        if type(self._indices) is list:
+            indices = <unsigned short *>malloc(
+                icount * sizeof(unsigned short))
+            if indices == NULL:
+                if vview is None:
+                    free(vertices)
+                raise MemoryError('indices')
+            lindices = self._indices
+            for i in xrange(icount):
+                indices[i] = lindices[i]
+        else:
+            iview = self._indices
+            indices = &iview[0]
 
         self.batch.set_data(vertices, <int>(vcount / vsize), indices, <int>icount)
 
-        free(vertices)
-        free(indices)
+        if vview is None:
+            free(vertices)
+        if iview is None:
+            free(indices)
 
     property vertices:
         '''List of x, y, u, v coordinates used to construct the Mesh. Right now,
         the Mesh instruction doesn't allow you to change the format of the
         vertices, which means it's only x, y + one texture coordinate.
+
+        .. versionchanged:: 1.9.0
+            A one-dimensional contiguous writable buffer of floats (e.g. the
+            value of a :class:`~kivy.properties.ArrayProperty`, or a float32
+            NumPy array) is kept as is instead of being copied into a list,
+            and uploaded directly from its memory. Read-only buffers are
+            still copied. The mesh is updated when the attribute
+            is set again, not when the buffer content is changed.
         '''
         def __get__(self):
             return self._vertices
         def __set__(self, value):
-            self._vertices = list(value)
+            if is_contiguous_buffer(value, 'f'):
+                self._vertices = value
+            else:
+                self._vertices = list(value)
             self.flag_update()
 
     property indices:
         '''Vertex indices used to specify the order when drawing the
         mesh.
+
+        .. versionchanged:: 1.9.0
+            A one-dimensional contiguous writable buffer of unsigned shorts
+            (typecode 'H') is kept as is, see :attr:`vertices`.
         '''
         def __get__(self):
             return self._indices
@@ -467,7 +511,10 @@ cdef class Mesh(VertexInstruction):
                 raise GraphicException(
                     'Cannot upload more than 65535 indices (OpenGL ES 2'
                     ' limitation - consider setting KIVY_GLES_LIMITS)')
-            self._indices = list(value)
+            if is_contiguous_buffer(value, 'H'):
+                self._indices = value
+            else:
+                self._indices = list(value)
             self.flag_update()
 
     property mode:
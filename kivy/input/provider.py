@@ -36,5 +36,12 @@ class MotionEventProvider(object):
     def update(self, dispatch_fn):
         '''Update the provider and dispatch all the new touch events though the
         `dispatch_fn` argument.
+
+        .. note::
+            Providers receiving their events outside of this method, from a
+            thread or a window callback, should call
+            :meth:`~kivy.clock.ClockBase.wakeup` when new events are
+            available, so that the main loop doesn't wait for them in idle
+            mode. See :ref:`clock-idle`.
         '''
         pass
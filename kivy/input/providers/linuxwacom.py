@@ -62,6 +62,7 @@ else:
     import collections
     import struct
     import fcntl
+    from kivy.clock import Clock
     from kivy.input.provider import MotionEventProvider
     from kivy.input.factory import MotionEventFactory
     from kivy.logger import Logger
@@ -251,6 +252,9 @@ else:
                             touches_sent.remove(tid)
                         del touches[tid]
 
+                # wake up the main loop if it's idle
+                Clock.wakeup()
+
             def normalize(value, vmin, vmax):
                 return (value - vmin) / float(vmax - vmin)
 
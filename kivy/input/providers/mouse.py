@@ -63,6 +63,7 @@ multitouch_sim      If multitouch is simulated. Use property `multitouch_sim`.
 __all__ = ('MouseMotionEventProvider', )
 
 from kivy.base import EventLoop
+from kivy.clock import Clock
 from collections import deque
 from kivy.logger import Logger
 from kivy.input.provider import MotionEventProvider
@@ -201,6 +202,7 @@ class MouseMotionEventProvider(MotionEventProvider):
         if do_graphics:
             cur.update_graphics(EventLoop.window, True)
         self.waiting_event.append(('begin', cur))
+        Clock.wakeup()
         return cur
 
     def remove_touch(self, cur):
@@ -209,6 +211,7 @@ class MouseMotionEventProvider(MotionEventProvider):
         del self.touches[cur.id]
         cur.update_time_end()
         self.waiting_event.append(('end', cur))
+        Clock.wakeup()
         cur.clear_graphics(EventLoop.window)
 
     def on_mouse_motion(self, win, x, y, modifiers):
@@ -220,6 +223,7 @@ class MouseMotionEventProvider(MotionEventProvider):
             cur.move([rx, ry])
             cur.update_graphics(win)
             self.waiting_event.append(('update', cur))
+            Clock.wakeup()
         elif self.alt_touch is not None and 'alt' not in modifiers:
             # alt just released ?
             is_double_tap = 'shift' in modifiers
@@ -78,6 +78,7 @@ else:
         MTDEV_CODE_TRACKING_ID, MTDEV_ABS_POSITION_X, \
         MTDEV_ABS_POSITION_Y, MTDEV_ABS_TOUCH_MINOR, \
         MTDEV_ABS_TOUCH_MAJOR
+    from kivy.clock import Clock
     from kivy.input.provider import MotionEventProvider
     from kivy.input.factory import MotionEventFactory
     from kivy.logger import Logger
@@ -188,6 +189,9 @@ else:
                         touch.update_time_end()
                     queue.append((action, touch))
 
+                # wake up the main loop if it's idle
+                Clock.wakeup()
+
             def normalize(value, vmin, vmax):
                 return (value - vmin) / float(vmax - vmin)
 
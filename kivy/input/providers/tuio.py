@@ -41,6 +41,7 @@ __all__ = ('TuioMotionEventProvider', 'Tuio2dCurMotionEvent',
 
 from kivy.lib import osc
 from collections import deque
+from kivy.clock import Clock
 from kivy.input.provider import MotionEventProvider
 from kivy.input.factory import MotionEventFactory
 from kivy.input.motionevent import MotionEvent
@@ -159,6 +160,8 @@ class TuioMotionEventProvider(MotionEventProvider):
         message = incoming[0]
         oscpath, types, args = message[0], message[1], message[2:]
         self.tuio_event_q.appendleft([oscpath, args, types])
+        # wake up the main loop if it's idle
+        Clock.wakeup()
 
     def _update(self, dispatch_fn, value):
         oscpath, args, types = value
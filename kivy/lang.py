@@ -772,30 +772,152 @@ will first be unloaded and then reloaded again. For example:
                 pos: self.pos
                 size: (self.size[0]/4, self.size[1]/4)
 
+.. _compiled_cache:
+
+Compiled cache
+--------------
+
+.. versionadded:: 1.9.0
+
+Parsing a kv file and compiling its expressions takes time, and is done again
+on every launch. The result of the :class:`Parser` is therefore stored in the
+`kv.compiled` disk tier of the :mod:`~kivy.cache` (in `cache/kv.compiled` in
+the Kivy home directory), like Python does with the `.pyc` files. The next
+time the same content is loaded, the rules, templates, dynamic classes,
+compiled expressions and watched keys are read back instead of being parsed
+and compiled again. The directives are still executed.
+
+The stored result is used only if the content of the file, its name, the
+Kivy version and the Python bytecode version are the same. Set the
+`KIVY_NO_KVCACHE` environment variable to disable the cache.
+
+When an application loads many kv files at startup, load them together with
+:meth:`BuilderBase.load_files`: the ones that are not in the cache yet are
+parsed in parallel, in a pool of processes.
+
+Compiled kv modules
+-------------------
+
+.. versionadded:: 1.9.0
+
+For production builds, the parser can be skipped entirely by translating the
+kv files into Python modules ahead of time with the
+:mod:`~kivy.tools.kvcompiler` tool::
+
+    $ python -m kivy.tools.kvcompiler mywidget.kv
+
+The generated `mywidget_kv.py` module holds the rules, templates, dynamic
+classes and directives of the kv file. Its expressions are compiled together
+with the module (and cached in its `.pyc`), and each expression has a
+dedicated function that resolves its names once and binds its watched
+properties with :meth:`~kivy.event.EventDispatcher.fast_bind`. Load it with::
+
+    import mywidget_kv
+    root = mywidget_kv.load()
+
+which is the same as calling :meth:`BuilderBase.load_file` on the kv file.
+The module must be generated again when the kv file changes.
+
+.. _lazy_loading:
+
+Lazy loading
+------------
+
+.. versionadded:: 1.9.0
+
+An application with many screens usually loads the kv files of all of them at
+startup, while only the first one is needed. A kv file that only holds rules
+can instead be loaded lazily::
+
+    Builder.load_file('settingsscreen.kv', lazy=True)
+
+Only the rule headers are read. The file is parsed the first time a widget
+needs its rules: when a widget of one of its classes (or of a subclass) is
+created, or when one of its templates is used. Its dynamic classes are
+registered in the :class:`~kivy.factory.Factory` right away. The rules keep
+the same order as if the file had been loaded right away, so they are applied
+before the ones of the files loaded after it.
+
+The directives of the file (`#:import`, `#:set`...) are executed only when it
+is parsed, so the names they define are not available to the other files
+before. A file with a root widget, or with rules using class (`<.name>`) or
+id (`<#name>`) selectors, is loaded right away.
+
+Live reload
+-----------
+
+.. versionadded:: 1.9.0
+
+While designing, a kv file can be loaded again with
+:meth:`BuilderBase.reload_file` instead of unloading it and creating all the
+widgets again. Set :attr:`BuilderBase.live_reload` before creating the
+widgets::
+
+    Builder.live_reload = True
+    root = Builder.load_file('myscreen.kv')
+    ...
+    # after each save of the file
+    Builder.reload_file('myscreen.kv')
+
+The new rules are compared to the old ones, and only the properties, event
+handlers and canvas blocks that changed are applied again to the existing
+widgets. If the tree of a rule changed (children or ids added or removed),
+its widgets are not updated and must be created again.
+
+Profiling
+---------
+
+.. versionadded:: 1.9.0
+
+To find the rules and expressions that make a screen slow to build or to
+update, record their stats with :meth:`BuilderBase.start_profiling`::
+
+    Builder.start_profiling()
+    screen = MyScreen()
+    Builder.stop_profiling()
+    print(Builder.dump_stats(sort='time', limit=20))
+
+For each rule, property expression and event handler, the number of
+applications or evaluations, the time spent and the number of handlers created
+are recorded. :meth:`BuilderBase.get_stats` returns them as a list, and
+:meth:`BuilderBase.dump_stats` as a text report or as JSON.
+
+With the `KIVY_PROFILE_LANG` environment variable, the profiling is started
+when Kivy is imported, and the stats are written in `builder_stats.json` at
+exit, in addition to `builder_stats.html`.
+
 '''
 import os
 
 __all__ = ('Observable', 'Builder', 'BuilderBase', 'BuilderException', 'Parser',
            'ParserException')
 
+import ast
 import codecs
+import json
+import keyword
+import marshal
 import re
 import sys
 import traceback
 import types
+from binascii import hexlify
+from hashlib import sha1
 from re import sub, findall
 from os import environ
 from os.path import join
 from copy import copy
 from types import CodeType
 from functools import partial
+from operator import itemgetter
+from timeit import default_timer
 from collections import OrderedDict, defaultdict
 
 from kivy.factory import Factory
 from kivy.logger import Logger
 from kivy.utils import QueryDict
 from kivy.cache import Cache
-from kivy import kivy_data_dir, require
+from kivy import kivy_data_dir, require, __version__
 from kivy.compat import PY2, iteritems, iterkeys
 from kivy.context import register_context
 from kivy.resources import resource_find
@@ -812,6 +934,20 @@ Instruction = None
 # register cache for creating new classtype (template)
 Cache.register('kv.lang')
 
+# register the disk cache for the parsed and compiled kv
+if 'KIVY_DOC_INCLUDE' not in environ and 'KIVY_NO_KVCACHE' not in environ:
+    Cache.register_disk('kv.compiled', max_bytes=16 * 1024 * 1024)
+
+# the compiled kv depends of the parser and of the bytecode version
+if PY2:
+    import imp
+    _kv_compiled_version = '%s|%s' % (
+        __version__, hexlify(imp.get_magic()).decode('ascii'))
+else:
+    from importlib.util import MAGIC_NUMBER
+    _kv_compiled_version = '%s|%s' % (
+        __version__, hexlify(MAGIC_NUMBER).decode('ascii'))
+
 # all previously included files
 __KV_INCLUDES__ = []
 
@@ -823,8 +959,10 @@ lang_tr = re.compile('(_\()')
 
 # class types to check with isinstance
 if PY2:
+    import __builtin__ as builtins
     _cls_type = (type, types.ClassType)
 else:
+    import builtins
     _cls_type = (type, )
 
 # all the widget handlers, used to correctly unbind all the callbacks then the
@@ -893,6 +1031,50 @@ global_idmap['sp'] = Metrics.sp
 # Builder.sync is called.
 _delayed_start = None
 
+# the _KvProfile when the profiling is started, and the last one started, see
+# BuilderBase.start_profiling
+_profile = None
+_profile_data = None
+
+
+class _KvProfile(object):
+    # stats of the profiled rules, properties and handlers:
+    # [count, time, total time, handlers created]
+
+    __slots__ = ('stats', 'handlers')
+
+    def __init__(self):
+        super(_KvProfile, self).__init__()
+        self.stats = {}
+        self.handlers = 0
+
+    def add(self, key, elapsed, total, handlers=0):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = [0, 0., 0., 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += total
+        stats[3] += handlers
+
+
+class _LiveRule(object):
+    # A rule applied to a widget, recorded when BuilderBase.live_reload is
+    # True, so that a reload can update the widget: the ids of the root
+    # rule, the bindings of each property expression, the (key, uid) of each
+    # event handler, and the InstructionGroup and bindings of each canvas.
+
+    __slots__ = ('rule', 'widget', 'ids', 'properties', 'handlers', 'canvas')
+
+    def __init__(self, rule, widget, ids):
+        super(_LiveRule, self).__init__()
+        self.rule = rule
+        self.widget = widget
+        self.ids = ids
+        self.properties = {}
+        self.handlers = []
+        self.canvas = {}
+
 
 class ParserException(Exception):
     '''Exception raised when something wrong happened in a kv file.
@@ -932,7 +1114,7 @@ class ParserRuleProperty(object):
     '''
 
     __slots__ = ('ctx', 'line', 'name', 'value', 'co_value',
-                 'watched_keys', 'mode', 'count')
+                 'watched_keys', 'mode', 'count', 'binder', 'closure')
 
     def __init__(self, ctx, line, name, value):
         super(ParserRuleProperty, self).__init__()
@@ -952,6 +1134,10 @@ class ParserRuleProperty(object):
         self.watched_keys = None
         #: Stats
         self.count = 0
+        #: Function binding the value, from a compiled kv module
+        self.binder = None
+        #: Closure factory of the value, see get_closure()
+        self.closure = None
 
     def precompile(self):
         name = self.name
@@ -995,6 +1181,35 @@ class ParserRuleProperty(object):
             else:
                 self.watched_keys = [['_']]
 
+    def get_closure(self):
+        '''Return a `(factory, names)` tuple for the expression, or None if it
+        can only be evaluated with :func:`eval`. `factory(self, *values)`
+        returns a closure of the expression over `self` and the values of
+        `names`.
+
+        .. versionadded:: 1.9.0
+        '''
+        closure = self.closure
+        if closure is None:
+            # compiled on the first use, and False if not possible
+            closure = False
+            names = None
+            if self.mode == 'eval' and type(self.co_value) is CodeType:
+                names = expression_names(self.value, self.watched_keys)
+            if names is not None:
+                source = '\n' * self.line + \
+                    'def _kv_closure({}): return lambda: ({}\n)'.format(
+                        ', '.join(['self'] + names), self.value)
+                namespace = {}
+                try:
+                    exec(compile(source, self.ctx.filename or '<string>',
+                                 'exec'), namespace)
+                    closure = (namespace['_kv_closure'], names)
+                except SyntaxError:
+                    pass
+            self.closure = closure
+        return closure or None
+
     def __repr__(self):
         return '<ParserRuleProperty name=%r filename=%s:%d ' \
                'value=%r watched_keys=%r>' % (
@@ -1008,7 +1223,8 @@ class ParserRule(object):
 
     __slots__ = ('ctx', 'line', 'name', 'children', 'id', 'properties',
                  'canvas_before', 'canvas_root', 'canvas_after',
-                 'handlers', 'level', 'cache_marked', 'avoid_previous_rules')
+                 'handlers', 'level', 'cache_marked', 'avoid_previous_rules',
+                 'recipe')
 
     def __init__(self, ctx, line, name, level):
         super(ParserRule, self).__init__()
@@ -1038,6 +1254,8 @@ class ParserRule(object):
         self.cache_marked = []
         #: Indicate if any previous rules should be avoided.
         self.avoid_previous_rules = False
+        #: Canvas recipe, built by the Builder at the first use of the rule
+        self.recipe = None
 
         if level == 0:
             self._detect_selectors()
@@ -1179,10 +1397,15 @@ class Parser(object):
         self.directives = []
         self.dynamic_classes = {}
         self.filename = kwargs.get('filename', None)
+        compiled = kwargs.get('compiled', None)
+        if compiled is not None:
+            self.sourcecode = list(enumerate(kwargs.get('sourcecode', [])))
+            self._restore(compiled, kwargs.get('execute', True))
+            return
         content = kwargs.get('content', None)
         if content is None:
             raise ValueError('No content passed')
-        self.parse(content)
+        self.parse(content, kwargs.get('execute', True))
 
     def execute_directives(self):
         global __KV_INCLUDES__
@@ -1262,9 +1485,12 @@ class Parser(object):
             else:
                 raise ParserException(self, ln, 'Unknown directive')
 
-    def parse(self, content):
+    def parse(self, content, execute=True):
         '''Parse the contents of a Parser file and return a list
         of root objects.
+
+        .. versionchanged:: 1.9.0
+            `execute` was added. If False, the directives are not executed.
         '''
         # Read and parse the lines of the file
         lines = content.splitlines()
@@ -1274,6 +1500,14 @@ class Parser(object):
         lines = list(zip(list(range(num_lines)), lines))
         self.sourcecode = lines[:]
 
+        # already parsed and compiled ?
+        key, content_hash, compiled = get_compiled_kv(self.filename, content)
+        if compiled is not None:
+            if __debug__:
+                trace('Parser: using compiled kv for %s' % key)
+            self._restore(compiled, execute)
+            return
+
         if __debug__:
             trace('Parser: parsing %d lines' % num_lines)
 
@@ -1281,7 +1515,8 @@ class Parser(object):
         self.strip_comments(lines)
 
         # Execute directives
-        self.execute_directives()
+        if execute:
+            self.execute_directives()
 
         # Get object from the first level
         objects, remaining_lines = self.parse_level(0, lines)
@@ -1296,6 +1531,85 @@ class Parser(object):
             ln, content = remaining_lines[0]
             raise ParserException(self, ln, 'Invalid data (not parsed)')
 
+        self._store_compiled(key, content_hash, objects)
+
+    def _store_compiled(self, key, content_hash, objects):
+        if key is None:
+            return
+        try:
+            data = marshal.dumps(self._dump(objects))
+        except ValueError:
+            # a constant value that marshal doesn't support
+            return
+        Cache.disk_append('kv.compiled', key, data,
+                          meta=[content_hash, _kv_compiled_version])
+
+    def _dump(self, objects=None):
+        # the compiled data of the parser, as restored by _restore(); the
+        # level 0 rules default to the ones found by the parser
+        if objects is None:
+            objects = []
+            for selector, rule in self.rules:
+                if rule not in objects:
+                    objects.append(rule)
+            objects.extend(x[2] for x in self.templates)
+            if self.root is not None:
+                objects.append(self.root)
+        return self.directives, [self._dump_rule(x) for x in objects]
+
+    def _restore(self, compiled, execute=True):
+        self.directives = [tuple(x) for x in compiled[0]]
+        if execute:
+            self.execute_directives()
+        for data in compiled[1]:
+            self._restore_rule(data)
+
+    def _dump_rule(self, rule):
+        dump_rule = self._dump_rule
+        dump_property = self._dump_property
+        return (
+            rule.line, rule.name, rule.level, rule.id,
+            [dump_property(x) for x in rule.properties.values()],
+            [dump_property(x) for x in rule.handlers],
+            [dump_rule(x) for x in rule.children],
+            dump_rule(rule.canvas_before) if rule.canvas_before else None,
+            dump_rule(rule.canvas_root) if rule.canvas_root else None,
+            dump_rule(rule.canvas_after) if rule.canvas_after else None)
+
+    def _dump_property(self, prop):
+        return (prop.line, prop.name, prop.value, prop.mode, prop.co_value,
+                prop.watched_keys)
+
+    def _restore_rule(self, data):
+        (line, name, level, uid, properties, handlers, children,
+         canvas_before, canvas_root, canvas_after) = data
+        # the level 0 rules register themselves as in parse_level()
+        rule = ParserRule(self, line, name, level)
+        rule.id = uid
+        for prop in properties:
+            prop = self._restore_property(prop)
+            rule.properties[prop.name] = prop
+        rule.handlers = [self._restore_property(x) for x in handlers]
+        rule.children = [self._restore_rule(x) for x in children]
+        if canvas_before:
+            rule.canvas_before = self._restore_rule(canvas_before)
+        if canvas_root:
+            rule.canvas_root = self._restore_rule(canvas_root)
+        if canvas_after:
+            rule.canvas_after = self._restore_rule(canvas_after)
+        return rule
+
+    def _restore_property(self, data):
+        line, name, value, mode, co_value, watched_keys = data[:6]
+        prop = ParserRuleProperty(self, line, name, value)
+        prop.mode = mode
+        prop.co_value = co_value
+        prop.watched_keys = watched_keys
+        # the compiled kv modules add the binder
+        if len(data) > 6:
+            prop.binder = data[6]
+        return prop
+
     def strip_comments(self, lines):
         '''Remove all comments from all lines in-place.
            Comments need to be on a single line and not at the end of a line.
@@ -1453,6 +1767,185 @@ class Parser(object):
         return objects, []
 
 
+# nodes that create a new scope in an expression: the names they bind cannot
+# be resolved in advance
+_scope_nodes = tuple(getattr(ast, x) for x in (
+    'Lambda', 'ListComp', 'SetComp', 'DictComp', 'GeneratorExp', 'NamedExpr')
+    if hasattr(ast, x))
+
+
+def get_compiled_kv(filename, content):
+    '''(internal) Look for the kv `content` in the `kv.compiled` disk cache.
+    Return `(key, content_hash, compiled)`, where `compiled` is the data to
+    restore in a :class:`Parser`, or None if it is not in the cache. The key
+    is None if the cache is disabled.
+    '''
+    if 'kv.compiled' not in Cache._disks:
+        return None, None, None
+    if PY2 and isinstance(content, unicode):
+        content_hash = sha1(content.encode('utf-8')).hexdigest()
+    elif PY2:
+        content_hash = sha1(content).hexdigest()
+    else:
+        content_hash = sha1(content.encode('utf-8',
+                                           'surrogatepass')).hexdigest()
+    key = filename or '<string>|' + content_hash
+    stored = Cache.disk_get('kv.compiled', key)
+    if stored is None:
+        return key, content_hash, None
+    meta, data = stored
+    if meta != [content_hash, _kv_compiled_version]:
+        return key, content_hash, None
+    try:
+        return key, content_hash, marshal.loads(data)
+    except (ValueError, EOFError, TypeError):
+        return key, content_hash, None
+
+
+def _init_parse_worker():
+    # the worker processes of BuilderBase.load_files() don't use the disk
+    # cache, its index is kept by the main process
+    Cache._disks.pop('kv.compiled', None)
+
+
+def _parse_worker(item):
+    # parse and compile a kv content in a worker process, without executing
+    # its directives, and return the marshalled data to restore in a Parser,
+    # or None if it failed: the main process parses it again for the error
+    filename, content = item
+    try:
+        parser = Parser(content=content, filename=filename, execute=False)
+        return marshal.dumps(parser._dump())
+    except Exception:
+        return None
+
+
+_canvas_attrs = ('canvas_before', 'canvas_root', 'canvas_after')
+
+
+def _get_canvas(widget, attr):
+    canvas = widget.canvas
+    if attr == 'canvas_before':
+        return canvas.before
+    if attr == 'canvas_after':
+        return canvas.after
+    return canvas
+
+
+def _rule_id(rule):
+    # the id as used by _apply_rule()
+    return (rule.id or '').split('#', 1)[0].strip()
+
+
+def _canvas_key(rule):
+    # what a canvas rule builds, to compare the reloaded ones
+    if rule is None:
+        return None
+    return tuple((x.name, tuple((p.name, p.value)
+                                for p in x.properties.values()))
+                 for x in rule.children)
+
+
+def _has_clear(rule):
+    return rule is not None and any(x.name == 'Clear' for x in rule.children)
+
+
+def _diff_rule(old, new):
+    # what changed between a rule and its reloaded version: the new or
+    # changed properties, the names of the removed ones, whether the event
+    # handlers changed, and the changed canvas blocks
+    props = old.properties
+    changed = [x for name, x in new.properties.items()
+               if name not in props or
+               (props[name].value, props[name].mode) != (x.value, x.mode)]
+    removed = [name for name in props if name not in new.properties]
+    handlers = ([(x.name, x.value) for x in old.handlers] !=
+                [(x.name, x.value) for x in new.handlers])
+    canvas = [attr for attr in _canvas_attrs if
+              _canvas_key(getattr(old, attr)) !=
+              _canvas_key(getattr(new, attr))]
+    return changed, removed, handlers, canvas
+
+
+def _unbind_live(uid, bounds):
+    # remove the bindings of a reloaded property or canvas of a widget
+    if not bounds:
+        return
+    handlers = _handlers.get(uid)
+    if handlers is not None:
+        ids = set(id(x) for x in bounds)
+        handlers[:] = [x for x in handlers if id(x) not in ids]
+    for bound in bounds:
+        _unbind_bound(bound)
+        del bound[:]
+
+
+def scan_rule_names(content):
+    '''(internal) Read the rule headers of the kv `content` without parsing it,
+    for :meth:`BuilderBase.load_file` with `lazy=True`. Return the lowercased
+    names of the rules (classes, dynamic classes and templates), and the dicts
+    of the dynamic classes and templates with their base classes. Return None
+    if the content has a root widget, or a rule with a class (`<.name>`) or
+    an id (`<#name>`) selector, since they can apply to any widget.
+    '''
+    names = set()
+    dynamic_classes = {}
+    templates = {}
+    for line in content.splitlines():
+        if not line.strip() or line[0] in ' \t#':
+            continue
+        c = line[0]
+        end = line.find({'<': '>', '[': ']'}.get(c, ''))
+        if c not in '<[' or end == -1:
+            return None
+        header = line[1:end]
+        if c == '[':
+            if '@' not in header:
+                return None
+            name, baseclasses = header.split('@', 1)
+            templates[name] = baseclasses
+            names.add(name.lower())
+            continue
+        if header[:1] == '-':
+            header = header[1:]
+        for name in header.split(','):
+            name = name.strip()
+            if '@' in name:
+                name, baseclasses = name.split('@', 1)
+                dynamic_classes[name] = baseclasses
+            elif not name or name[0] in '.#':
+                return None
+            names.add(name.lower())
+    return names, dynamic_classes, templates
+
+
+def expression_names(value, watched_keys=None):
+    '''(internal) Return the names used by the kv expression `value` and by
+    the bases of its `watched_keys`, except `self`, in the order they appear.
+    Return None if the names can't all be resolved before the evaluation
+    (the expression has a lambda or a comprehension).
+
+    .. versionadded:: 1.9.0
+    '''
+    try:
+        tree = ast.parse(value.strip(), mode='eval')
+    except SyntaxError:
+        return None
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, _scope_nodes):
+            return None
+        if isinstance(node, ast.Name) and node.id not in names:
+            names.append(node.id)
+    for keys in watched_keys or []:
+        if keys[0] not in names:
+            names.append(keys[0])
+    names = [x for x in names if x not in ('self', 'None', 'True', 'False')]
+    if any(keyword.iskeyword(x) for x in names):
+        return None
+    return names
+
+
 def get_proxy(widget):
     try:
         return widget.proxy_ref
@@ -1462,7 +1955,14 @@ def get_proxy(widget):
 
 def custom_callback(__kvlang__, idmap, *largs, **kwargs):
     idmap['args'] = largs
-    exec(__kvlang__.co_value, idmap)
+    profile = _profile
+    if profile is None:
+        exec(__kvlang__.co_value, idmap)
+    else:
+        start = default_timer()
+        exec(__kvlang__.co_value, idmap)
+        elapsed = default_timer() - start
+        profile.add(__kvlang__, elapsed, elapsed)
 
 
 def call_fn(args, instance, v):
@@ -1471,10 +1971,31 @@ def call_fn(args, instance, v):
         trace('Builder: call_fn %s, key=%s, value=%r, %r' % (
             element, key, value, rule.value))
     rule.count += 1
-    e_value = eval(value, idmap)
+    profile = _profile
+    if profile is not None:
+        start = default_timer()
+    if idmap is None:
+        # value is a closure of the expression
+        e_value = value()
+    else:
+        e_value = eval(value, idmap)
     if __debug__:
         trace('Builder: call_fn => value=%r' % (e_value, ))
-    setattr(element, key, e_value)
+    if profile is None:
+        setattr(element, key, e_value)
+    else:
+        evaluated = default_timer()
+        setattr(element, key, e_value)
+        profile.add(rule, evaluated - start, default_timer() - start)
+
+
+def compiled_call_fn(args, instance, v):
+    # call_fn for the expressions evaluated with a closure
+    if _profile is not None:
+        return call_fn(args, instance, v)
+    element, key, value, rule, idmap = args
+    rule.count += 1
+    setattr(element, key, value())
 
 
 def delayed_call_fn(args, instance, v):
@@ -1491,6 +2012,32 @@ def delayed_call_fn(args, instance, v):
         _delayed_start = args
 
 
+def _unbind_bound(bound):
+    for f, k, fun, uid in bound:
+        if fun is None:
+            continue
+        try:
+            f.unbind_uid(k, uid)
+        except ReferenceError:
+            pass
+
+
+def _keep_bound(bound, old, i, f):
+    # If `f`, the object reached by the new chain at the index `i` of the old
+    # bindings, is the same object as before and all the attrs from there are
+    # bound (so nothing below it can be stale), the old bindings from `i` are
+    # kept instead of being rebound, and the ones before `i` are unbound.
+    if i >= len(old) or old[i][0] is not getattr(f, 'proxy_ref', f):
+        return False
+    tail = old[i:]
+    for item in tail:
+        if item[2] is None:
+            return False
+    bound.extend(tail)
+    _unbind_bound(old[:i])
+    return True
+
+
 def update_intermediates(base, keys, bound, s, fn, args, instance, value):
     ''' Function that is called when an intermediate property is updated
     and `rebind` of that property is True. In that case, we unbind
@@ -1503,6 +2050,11 @@ def update_intermediates(base, keys, bound, s, fn, args, instance, value):
     to the new values of the attrs `b`, `c``, `d` that are not None and
     `rebind` is True.
 
+    .. versionchanged:: 1.9.0
+        When the new value of `b` leads to the same `c` object as before (and
+        `rebind` is True for all the attrs below it), the bindings of `c` and
+        `d` are kept: only the segment that changed is rebound.
+
     :Parameters:
         `base`
             A (proxied) ref to the base widget, `self` in the example
@@ -1528,26 +2080,28 @@ def update_intermediates(base, keys, bound, s, fn, args, instance, value):
         `fn`
             The function to be called args, `args` on bound callback.
     '''
-    # first remove all the old bound functions from `s` and down.
-    for f, k, fun, uid in bound[s:]:
-        if fun is None:
-            continue
-        try:
-            f.unbind_uid(k, uid)
-        except ReferenceError:
-            pass
+    # first take the old bound functions from `s` and down. They are
+    # unbound once the new ones are bound, except the ones that are still
+    # valid (see _keep_bound).
+    old = bound[s:]
     del bound[s:]
 
     # find the first attr from which we need to start rebinding.
     f = getattr(*bound[-1][:2])
     if f is None:
+        _unbind_bound(old)
         fn(args, None, None)
         return
     s += 1
     append = bound.append
+    i = 0
 
     # bind all attrs, except last to update_intermediates
     for val in keys[s:-1]:
+        if _keep_bound(bound, old, i, f):
+            fn(args, None, None)
+            return
+
         # if we need to dynamically rebind, bindm otherwise just
         # add the attr to the list
         if isinstance(f, (EventDispatcher, Observable)):
@@ -1564,6 +2118,7 @@ def update_intermediates(base, keys, bound, s, fn, args, instance, value):
         else:
             append([getattr(f, 'proxy_ref', f), val, None, None])
 
+        i += 1
         f = getattr(f, val, None)
         if f is None:
             break
@@ -1572,9 +2127,13 @@ def update_intermediates(base, keys, bound, s, fn, args, instance, value):
     # for the last attr we bind directly to the setting function,
     # because that attr sets the value of the rule.
     if isinstance(f, (EventDispatcher, Observable)):
+        if _keep_bound(bound, old, i, f):
+            fn(args, None, None)
+            return
         uid = f.fast_bind(keys[-1], fn, args)
         if uid:
             append([f.proxy_ref, keys[-1], fn, uid])
+    _unbind_bound(old)
     # when we rebind we have to update the
     # rule with the most recent value, otherwise, the value might be wrong
     # and wouldn't be updated since we might not have tracked it before.
@@ -1583,16 +2142,36 @@ def update_intermediates(base, keys, bound, s, fn, args, instance, value):
 
 
 def create_handler(iself, element, key, value, rule, idmap, delayed=False):
-    idmap = copy(idmap)
-    idmap.update(global_idmap)
-    idmap['self'] = iself.proxy_ref
+    # if possible, evaluate the expression with a closure over the values of
+    # its names instead of eval() in a copy of the idmap
+    values = None
+    closure = rule.get_closure()
+    if closure is not None:
+        factory, names = closure
+        values = resolve_compiled_names(iself, idmap, names)
+    if values is None:
+        idmap = copy(idmap)
+        idmap.update(global_idmap)
+        idmap['self'] = iself.proxy_ref
+        fn_idmap = idmap
+    else:
+        value = factory(*values)
+        # only needed for the watched keys
+        idmap = dict(zip(names, values[1:]))
+        idmap['self'] = values[0]
+        fn_idmap = None
     handler_append = _handlers[iself.uid].append
+    created = 0
 
     # we need a hash for when delayed, so we don't execute duplicate canvas
     # callbacks from the same handler during a sync op
     if delayed:
+        # the last item is the link of _delayed_start
         fn = delayed_call_fn
-        args = [element, key, value, rule, idmap, None]  # see _delayed_start
+        args = [element, key, value, rule, fn_idmap, None]
+    elif fn_idmap is None:
+        fn = compiled_call_fn
+        args = (element, key, value, rule, None)
     else:
         fn = call_fn
         args = (element, key, value, rule, idmap)
@@ -1644,8 +2223,13 @@ def create_handler(iself, element, key, value, rule, idmap, delayed=False):
                     was_bound = True
             if was_bound:
                 handler_append(bound)
+                created += 1
 
     try:
+        if _profile is not None:
+            return _profile_evaluate(rule, value, fn_idmap, created)
+        if fn_idmap is None:
+            return value()
         return eval(value, idmap)
     except Exception as e:
         tb = sys.exc_info()[2]
@@ -1654,6 +2238,74 @@ def create_handler(iself, element, key, value, rule, idmap, delayed=False):
                                cause=tb)
 
 
+def _profile_evaluate(rule, value, idmap, handlers):
+    # first evaluation of a bound expression while profiling
+    profile = _profile
+    start = default_timer()
+    if idmap is None:
+        e_value = value()
+    else:
+        e_value = eval(value, idmap)
+    elapsed = default_timer() - start
+    profile.handlers += handlers
+    profile.add(rule, elapsed, elapsed, handlers)
+    return e_value
+
+
+def resolve_compiled_names(iself, idmap, names):
+    '''(internal) Return the values of `self` and of `names` as an
+    expression bound by :func:`create_handler` would see them, or None if one
+    of them is unknown.
+    '''
+    values = [iself.proxy_ref]
+    append = values.append
+    for name in names:
+        if name in global_idmap:
+            append(global_idmap[name])
+        elif name in idmap:
+            append(idmap[name])
+        elif hasattr(builtins, name):
+            append(getattr(builtins, name))
+        else:
+            return None
+    return values
+
+
+def create_compiled_handler(iself, element, key, rule, delayed, value,
+                            watched):
+    '''(internal) Used by the compiled kv modules, the counterpart of
+    :func:`create_handler` when the names are already resolved: `value` is a
+    closure of the expression, and `watched` a list of `(object, attr)` to
+    bind to.
+    '''
+    if delayed:
+        fn = delayed_call_fn
+        args = [element, key, value, rule, None, None]  # see _delayed_start
+    else:
+        fn = compiled_call_fn
+        args = (element, key, value, rule, None)
+    handler_append = _handlers[iself.uid].append
+    created = 0
+
+    for f, attr in watched:
+        f = getattr(f, 'proxy_ref', f)
+        if isinstance(f, (EventDispatcher, Observable)):
+            uid = f.fast_bind(attr, fn, args)
+            if uid:
+                handler_append([[f.proxy_ref, attr, fn, uid]])
+                created += 1
+
+    try:
+        if _profile is not None:
+            return _profile_evaluate(rule, value, None, created)
+        return value()
+    except Exception as e:
+        tb = sys.exc_info()[2]
+        raise BuilderException(rule.ctx, rule.line,
+                               '{}: {}'.format(e.__class__.__name__, e),
+                               cause=tb)
+
+
 class ParserSelector(object):
 
     def __init__(self, key):
@@ -1683,24 +2335,36 @@ class ParserSelectorName(ParserSelector):
 
     parents = {}
 
-    def get_bases(self, cls):
+    @staticmethod
+    def get_bases(cls):
         for base in cls.__bases__:
             if base.__name__ == 'object':
                 break
             yield base
             if base.__name__ == 'Widget':
                 break
-            for cbase in self.get_bases(base):
+            for cbase in ParserSelectorName.get_bases(base):
                 yield cbase
 
-    def match(self, widget):
+    @staticmethod
+    def get_names(cls):
+        '''Return the lowercased names of `cls` and of its bases (up to
+        `Widget`) that a name selector can match, in MRO walk order and
+        without duplicates.
+        '''
         parents = ParserSelectorName.parents
-        cls = widget.__class__
-        if not cls in parents:
-            classes = [x.__name__.lower() for x in
-                       [cls] + list(self.get_bases(cls))]
+        classes = parents.get(cls)
+        if classes is None:
+            classes = []
+            for x in [cls] + list(ParserSelectorName.get_bases(cls)):
+                name = x.__name__.lower()
+                if name not in classes:
+                    classes.append(name)
             parents[cls] = classes
-        return self.key in parents[cls]
+        return classes
+
+    def match(self, widget):
+        return self.key in ParserSelectorName.get_names(widget.__class__)
 
 
 class BuilderBase(object):
@@ -1711,7 +2375,34 @@ class BuilderBase(object):
     that you can use to load other kv files in addition to the default ones.
     '''
 
-    _match_cache = {}
+    #: If True, when the watched keys of a widget property expression change,
+    #: the expression is evaluated again only once, at the next
+    #: :meth:`sync` (before the next frame), like the expressions of the
+    #: canvas instructions. Several changes in the same frame then lead to a
+    #: single evaluation, but the property is not updated right away.
+    #: Defaults to False, it only affects the rules applied after the change.
+    #:
+    #: .. versionadded:: 1.9.0
+    deferred = False
+
+    #: Maximum number of passes done by :meth:`sync` over the calls scheduled
+    #: while it runs. Deferred expressions which trigger each other would
+    #: otherwise keep it running forever: when the limit is reached, the
+    #: remaining calls are left for the next :meth:`sync`. Defaults to 10.
+    #:
+    #: .. versionadded:: 1.9.0
+    max_iteration = 10
+
+    #: If True, the Builder remembers how the rules were applied to each
+    #: widget (the ids, bindings, event handlers and canvas instructions), so
+    #: that :meth:`reload_file` can update the existing widgets in place.
+    #: Each canvas block of a rule is then built in its own
+    #: :class:`~kivy.graphics.InstructionGroup`. It costs memory and time, and
+    #: is meant for development. Defaults to False, it only affects the
+    #: widgets created after the change.
+    #:
+    #: .. versionadded:: 1.9.0
+    live_reload = False
 
     def __init__(self):
         super(BuilderBase, self).__init__()
@@ -1720,6 +2411,16 @@ class BuilderBase(object):
         self.templates = {}
         self.rules = []
         self.rulectx = {}
+        self._match_cache = {}
+        self._reset_rule_index()
+        # filename -> [registration, position in rules, names, kwargs] of the
+        # files loaded with lazy=True, and lowercased name -> filenames
+        self._lazy_files = {}
+        self._lazy_names = {}
+        self._lazy_count = 0
+        # filename -> root rule, and widget uid -> [_LiveRule, ...]
+        self._root_rules = {}
+        self._live = defaultdict(list)
 
     def load_file(self, filename, **kwargs):
         '''Insert a file into the language builder and return the root widget
@@ -1729,24 +2430,170 @@ class BuilderBase(object):
             `rulesonly`: bool, defaults to False
                 If True, the Builder will raise an exception if you have a root
                 widget inside the definition.
+            `lazy`: bool, defaults to False
+                If True, the file is only parsed when a widget needs its
+                rules: when the first widget of a class (or subclass) that it
+                has rules for is created, or when one of its templates is
+                used. See :ref:`Lazy loading <lazy_loading>`. Nothing is
+                returned.
+
+        .. versionchanged:: 1.9.0
+            `lazy` was added.
         '''
+        filename, data = self._read_file(filename)
+        if kwargs.pop('lazy', False):
+            return self._load_lazily(filename, data, kwargs)
+        kwargs['filename'] = filename
+        return self.load_string(data, **kwargs)
+
+    def load_files(self, filenames, processes=None, **kwargs):
+        '''Insert several files into the language builder, and return the list
+        of their root widgets (None for the files without root widget).
+
+        The files that are not in the `kv.compiled` cache (see
+        :ref:`Compiled cache <compiled_cache>`) are parsed and compiled in
+        parallel, in a pool of processes. The results are then inserted in
+        the order of `filenames`, exactly as with a :meth:`load_file` for
+        each of them: the directives are executed, and the rules are
+        added, in that order.
+
+        .. versionadded:: 1.9.0
+
+        :Parameters:
+            `filenames`: list
+                Names of the files.
+            `processes`: int, defaults to None
+                Maximum number of processes, defaults to the number of CPUs.
+                With 1, or if there is only one file to parse, or if the
+                processes can't be used on the platform, the files are
+                parsed in the current process.
+
+        The other keyword arguments are the ones of :meth:`load_file`.
+        '''
+        if kwargs.get('lazy'):
+            return [self.load_file(x, **kwargs) for x in filenames]
+
+        import multiprocessing
+        files = [self._read_file(x) for x in filenames]
+        cached = [get_compiled_kv(fn, content) for fn, content in files]
+        missing = [i for i, x in enumerate(cached) if x[2] is None]
+        if processes is None:
+            try:
+                processes = multiprocessing.cpu_count()
+            except NotImplementedError:
+                processes = 1
+        processes = min(processes, len(missing))
+
+        results = None
+        if processes > 1:
+            try:
+                pool = multiprocessing.Pool(processes, _init_parse_worker)
+            except (ImportError, OSError, NotImplementedError) as e:
+                Logger.warning('Lang: unable to parse in processes: %s' % e)
+            else:
+                try:
+                    results = pool.map(_parse_worker,
+                                       [files[i] for i in missing])
+                finally:
+                    pool.terminate()
+                    pool.join()
+
+        compiled = [x[2] for x in cached]
+        if results is not None:
+            for i, data in zip(missing, results):
+                if data is None:
+                    continue
+                key, content_hash = cached[i][:2]
+                if key is not None:
+                    Cache.disk_append(
+                        'kv.compiled', key, data,
+                        meta=[content_hash, _kv_compiled_version])
+                compiled[i] = marshal.loads(data)
+
+        roots = []
+        for (fn, content), data in zip(files, compiled):
+            kw = dict(kwargs, filename=fn)
+            if data is None:
+                roots.append(self.load_string(content, **kw))
+            else:
+                roots.append(self.load_compiled(
+                    data, sourcecode=content.splitlines(), **kw))
+        return roots
+
+    def _read_file(self, filename):
         filename = resource_find(filename) or filename
         if __debug__:
             trace('Builder: load file %s' % filename)
         with open(filename, 'r') as fd:
-            kwargs['filename'] = filename
             data = fd.read()
 
-            # remove bom ?
-            if PY2:
-                if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
-                    raise ValueError('Unsupported UTF16 for kv files.')
-                if data.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
-                    raise ValueError('Unsupported UTF32 for kv files.')
-                if data.startswith(codecs.BOM_UTF8):
-                    data = data[len(codecs.BOM_UTF8):]
+        # remove bom ?
+        if PY2:
+            if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                raise ValueError('Unsupported UTF16 for kv files.')
+            if data.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+                raise ValueError('Unsupported UTF32 for kv files.')
+            if data.startswith(codecs.BOM_UTF8):
+                data = data[len(codecs.BOM_UTF8):]
+        return filename, data
+
+    def _load_lazily(self, filename, data, kwargs):
+        scan = scan_rule_names(data)
+        if scan is None:
+            # a root widget, or selectors not naming a class
+            Logger.debug('Lang: {} cannot be loaded lazily'.format(filename))
+            kwargs['filename'] = filename
+            kwargs['rulesonly'] = True
+            self.load_string(data, **kwargs)
+            return
+        if filename in self.files or filename in self._lazy_files:
+            Logger.warning(
+                'Lang: The file {} is loaded multiples times, '
+                'you might have unwanted behaviors.'.format(filename))
+            return
 
-            return self.load_string(data, **kwargs)
+        names, dynamic_classes, templates = scan
+        kwargs['filename'] = filename
+        kwargs['rulesonly'] = True
+        self._lazy_count += 1
+        self._lazy_files[filename] = [
+            self._lazy_count, len(self.rules), names, kwargs]
+        for name in names:
+            self._lazy_names.setdefault(name, []).append(filename)
+        # the widgets created before have no rules of the file
+        self._invalidate_matchcache([ParserSelectorName(x) for x in names])
+
+        # the Factory can create the classes and templates right away, their
+        # rules are loaded with the first widget
+        for name, baseclasses in iteritems(dynamic_classes):
+            Factory.register(name, baseclasses=baseclasses, filename=filename,
+                             warn=True)
+        for name in templates:
+            Factory.register(name, cls=partial(self.template, name),
+                             is_template=True, warn=True)
+
+    def _forget_lazy(self, filename):
+        # remove a pending lazy file, and return its entry
+        lazy = self._lazy_files.pop(filename, None)
+        if lazy is not None:
+            for name in lazy[2]:
+                filenames = self._lazy_names.get(name)
+                if filenames is not None and filename in filenames:
+                    filenames.remove(filename)
+                    if not filenames:
+                        del self._lazy_names[name]
+        return lazy
+
+    def _load_lazy(self, name):
+        # load the pending files having rules for the lowercased name
+        for filename in list(self._lazy_names.get(name, ())):
+            lazy = self._forget_lazy(filename)
+            if lazy is None:
+                continue
+            if __debug__:
+                trace('Builder: load lazily %s for <%s>' % (filename, name))
+            filename, data = self._read_file(filename)
+            self._load(lazy[3], lazy=lazy, content=data)
 
     def unload_file(self, filename):
         '''Unload all rules associated with a previously imported file.
@@ -1757,11 +2604,24 @@ class BuilderBase(object):
 
             This will not remove rules or templates already applied/used on
             current widgets. It will only effect the next widgets creation or
-            template invocation.
+            template invocation. See :meth:`reload_file` to update them.
         '''
+        # forget it if it was not loaded yet
+        self._forget_lazy(filename)
+
         # remove rules and templates
-        self.rules = [x for x in self.rules if x[1].ctx.filename != filename]
-        self._clear_matchcache()
+        removed = [x for x in self.rules if x[1].ctx.filename == filename]
+        if removed:
+            # the lazy files keep their place between the remaining rules
+            positions = [i for i, x in enumerate(self.rules)
+                         if x[1].ctx.filename == filename]
+            for lazy in self._lazy_files.values():
+                lazy[1] -= len([i for i in positions if i < lazy[1]])
+            self.rules = [x for x in self.rules
+                          if x[1].ctx.filename != filename]
+            self._reset_rule_index()
+            self._index_rules(self.rules)
+            self._invalidate_matchcache([x[0] for x in removed])
         templates = {}
         for x, y in self.templates.items():
             if y[2] != filename:
@@ -1769,10 +2629,104 @@ class BuilderBase(object):
         self.templates = templates
         if filename in self.files:
             self.files.remove(filename)
+        self._root_rules.pop(filename, None)
 
         # unregister all the dynamic classes
         Factory.unregister_from_filename(filename)
 
+    def reload_file(self, filename):
+        '''Load again a file previously loaded, and update the widgets already
+        created with its rules. See :meth:`reload_string`.
+
+        .. versionadded:: 1.9.0
+        '''
+        filename, data = self._read_file(filename)
+        return self.reload_string(data, filename=filename)
+
+    def reload_string(self, string, **kwargs):
+        '''Replace the rules previously loaded from `filename` with the rules of
+        the kv `string`, and update the widgets already created with them.
+
+        The new rules are compared to the old ones. If :attr:`live_reload` was
+        True when the widgets were created, only the changed properties,
+        event handlers and canvas blocks are applied again to them: the
+        bindings of the old ones are removed and the new ones are evaluated
+        and bound. The root widget of the file, if any, is updated the same
+        way. The other rules, properties and widgets are not touched.
+
+        Return True if the widgets were all updated, False if some of them
+        must be created again to see the changes: when the tree of children
+        of a rule, an id, a selector, a dynamic class or a template changed,
+        or when a canvas block was added or uses `Clear`. The new rules are
+        used for the next widgets in any case.
+
+        .. versionadded:: 1.9.0
+
+        :Parameters:
+            `filename`: str
+                Name of the file previously loaded.
+        '''
+        fn = kwargs.get('filename', None)
+        # run the waiting expressions of the old rules first
+        self.sync()
+        lazy = self._forget_lazy(fn)
+        if lazy is not None:
+            # not used yet, nothing to update
+            self._load(lazy[3], lazy=lazy, content=string)
+            return True
+
+        parser = Parser(content=string, filename=fn)
+        indices = [i for i, x in enumerate(self.rules)
+                   if x[1].ctx.filename == fn]
+        pairs = self._pair_reloaded_rules(fn, indices, parser)
+        if pairs is None:
+            # the file doesn't declare the same things anymore
+            root = parser.root
+            parser.root = None
+            self.unload_file(fn)
+            kwargs['rulesonly'] = False
+            self._load(kwargs, parser=parser)
+            if root is not None:
+                self._root_rules[fn] = root
+            return False
+
+        # map the widget rules of the old tree to the new one
+        updated = True
+        mapping = {}
+        for old, new in pairs:
+            if not self._map_reloaded_rule(old, new, mapping):
+                updated = False
+
+        # replace the rules at the same place
+        selectors = [self.rules[i][0] for i in indices]
+        for i, item in zip(indices, parser.rules):
+            self.rules[i] = item
+        self._reset_rule_index()
+        self._index_rules(self.rules)
+        self._invalidate_matchcache(
+            selectors + [x[0] for x in parser.rules])
+        for name, cls, template in parser.templates:
+            self.templates[name] = (cls, template, fn)
+        if parser.root is not None:
+            self._root_rules[fn] = parser.root
+
+        # and update the widgets
+        diffs = {}
+        for uid, lives in list(self._live.items()):
+            for live in lives[:]:
+                new = mapping.get(live.rule)
+                if new is None:
+                    continue
+                diff = diffs.get(new)
+                if diff is None:
+                    diff = diffs[new] = _diff_rule(live.rule, new)
+                try:
+                    self._update_live(live, new, diff)
+                except ReferenceError:
+                    # the widget is gone
+                    lives.remove(live)
+        return updated
+
     def load_string(self, string, **kwargs):
         '''Insert a string into the Language Builder and return the root widget
         (if defined) of the kv string.
@@ -1782,6 +2736,28 @@ class BuilderBase(object):
                 If True, the Builder will raise an exception if you have a root
                 widget inside the definition.
         '''
+        return self._load(kwargs, content=string)
+
+    def load_compiled(self, compiled, **kwargs):
+        '''Insert the rules of a compiled kv module into the Language Builder
+        and return the root widget (if defined). This is called by the `load()`
+        function of the modules generated by :mod:`~kivy.tools.kvcompiler`.
+
+        .. versionadded:: 1.9.0
+
+        :Parameters:
+            `filename`: str, defaults to None
+                Name of the original kv file.
+            `sourcecode`: list, defaults to []
+                Lines of the original kv file, used in the error messages.
+            `rulesonly`: bool, defaults to False
+                If True, the Builder will raise an exception if you have a root
+                widget inside the definition.
+        '''
+        return self._load(kwargs, compiled=compiled,
+                          sourcecode=kwargs.pop('sourcecode', []))
+
+    def _load(self, kwargs, lazy=None, parser=None, **parser_kwargs):
         kwargs.setdefault('rulesonly', False)
         self._current_filename = fn = kwargs.get('filename', None)
 
@@ -1793,21 +2769,43 @@ class BuilderBase(object):
 
         try:
             # parse the string
-            parser = Parser(content=string, filename=fn)
+            if parser is None:
+                parser = Parser(filename=fn, **parser_kwargs)
 
             # merge rules with our rules
-            self.rules.extend(parser.rules)
-            self._clear_matchcache()
+            if lazy is None:
+                self.rules.extend(parser.rules)
+                self._index_rules(parser.rules)
+            else:
+                # a lazy file takes the place it would have had if it was
+                # loaded right away, before the files loaded after it
+                registration, position = lazy[:2]
+                self.rules[position:position] = parser.rules
+                for other in self._lazy_files.values():
+                    if other[0] > registration:
+                        other[1] += len(parser.rules)
+                self._reset_rule_index()
+                self._index_rules(self.rules)
+            self._invalidate_matchcache([x[0] for x in parser.rules])
 
             # add the template found by the parser into ours
             for name, cls, template in parser.templates:
                 self.templates[name] = (cls, template, fn)
+                if lazy is not None and Factory.classes.get(name):
+                    # already registered when the file was loaded lazily
+                    continue
                 Factory.register(name,
                                  cls=partial(self.template, name),
                                  is_template=True, warn=True)
 
             # register all the dynamic classes
             for name, baseclasses in iteritems(parser.dynamic_classes):
+                item = Factory.classes.get(name)
+                if (lazy is not None and item is not None and
+                        item['filename'] == fn and
+                        item['baseclasses'] == baseclasses):
+                    # already registered when the file was loaded lazily
+                    continue
                 Factory.register(name, baseclasses=baseclasses, filename=fn,
                                  warn=True)
 
@@ -1824,6 +2822,8 @@ class BuilderBase(object):
                 self.files.append(fn)
 
             if parser.root:
+                if fn:
+                    self._root_rules[fn] = parser.root
                 widget = Factory.get(parser.root.name)()
                 self._apply_rule(widget, parser.root, parser.root)
                 return widget
@@ -1841,6 +2841,8 @@ class BuilderBase(object):
         # Prevent naming clash with whatever the user might be putting into the
         # ctx as key.
         name = args[0]
+        if name not in self.templates and self._lazy_names:
+            self._load_lazy(name.lower())
         if name not in self.templates:
             raise Exception('Unknown <%s> template name' % name)
         baseclasses, rule, fn = self.templates[name]
@@ -1872,12 +2874,69 @@ class BuilderBase(object):
             self._apply_rule(widget, rule, rule)
 
     def _clear_matchcache(self):
-        BuilderBase._match_cache = {}
+        self._match_cache = {}
+
+    def _invalidate_matchcache(self, selectors):
+        # only forget the cached matches that one of the selectors could
+        # change: widgets whose class (or base), class name or id is named by
+        # a selector. Unknown selector types invalidate everything.
+        names = set()
+        classes = set()
+        ids = set()
+        for selector in selectors:
+            cls = type(selector)
+            if cls is ParserSelectorName:
+                names.add(selector.key)
+            elif cls is ParserSelectorClass:
+                classes.add(selector.key)
+            elif cls is ParserSelectorId:
+                ids.add(selector.key)
+            else:
+                self._clear_matchcache()
+                return
+        if not (names or classes or ids):
+            return
+        cache = self._match_cache
+        get_names = ParserSelectorName.get_names
+        for k in list(cache.keys()):
+            wcls, wid, wclasses = k
+            if ((wid and wid.lower() in ids) or
+                    (classes and classes.intersection(wclasses)) or
+                    (names and names.intersection(get_names(wcls)))):
+                del cache[k]
+
+    def _reset_rule_index(self):
+        # selector key -> [(order, rule), ...], one dict per selector type.
+        # Selectors of any other type are kept in a list and matched one by
+        # one.
+        self._rule_index = {
+            ParserSelectorName: {},
+            ParserSelectorClass: {},
+            ParserSelectorId: {}}
+        self._rule_others = []
+        self._rule_order = 0
+
+    def _index_rules(self, rules):
+        index = self._rule_index
+        order = self._rule_order
+        for selector, rule in rules:
+            keys = index.get(type(selector))
+            if keys is None:
+                self._rule_others.append((order, selector, rule))
+            else:
+                keys.setdefault(selector.key, []).append((order, rule))
+            order += 1
+        self._rule_order = order
 
     def _apply_rule(self, widget, rule, rootrule, template_ctx=None):
         # widget: the current instantiated widget
         # rule: the current rule
         # rootrule: the current root rule (for children of a rule)
+        profile = _profile
+        if profile is not None:
+            applied = rule
+            start = default_timer()
+            handlers = profile.handlers
 
         # will collect reference to all the id in children
         assert(rule not in self.rulectx)
@@ -1914,19 +2973,29 @@ class BuilderBase(object):
         # the rule if not, they will be created as ObjectProperty.
         rule.create_missing(widget)
 
+        live = None
+        if self.live_reload:
+            live = _LiveRule(rule, widget.proxy_ref, rctx['ids'])
+            self._live[widget.uid].append(live)
+
         # build the widget canvas
-        if rule.canvas_before:
-            with widget.canvas.before:
-                self._build_canvas(widget.canvas.before, widget,
-                                   rule.canvas_before, rootrule)
-        if rule.canvas_root:
-            with widget.canvas:
-                self._build_canvas(widget.canvas, widget,
-                                   rule.canvas_root, rootrule)
-        if rule.canvas_after:
-            with widget.canvas.after:
-                self._build_canvas(widget.canvas.after, widget,
-                                   rule.canvas_after, rootrule)
+        if live is not None:
+            for attr in ('canvas_before', 'canvas_root', 'canvas_after'):
+                if getattr(rule, attr) is not None:
+                    self._build_live_canvas(live, attr)
+        else:
+            if rule.canvas_before:
+                with widget.canvas.before:
+                    self._build_canvas(widget.canvas.before, widget,
+                                       rule.canvas_before, rctx['ids'])
+            if rule.canvas_root:
+                with widget.canvas:
+                    self._build_canvas(widget.canvas, widget,
+                                       rule.canvas_root, rctx['ids'])
+            if rule.canvas_after:
+                with widget.canvas.after:
+                    self._build_canvas(widget.canvas.after, widget,
+                                       rule.canvas_after, rctx['ids'])
 
         # create children tree
         Factory_get = Factory.get
@@ -1988,27 +3057,42 @@ class BuilderBase(object):
         # append the properties and handlers to our final resolution task
         if rule.properties:
             rctx['set'].append((widget.proxy_ref,
-                                list(rule.properties.values())))
+                                list(rule.properties.values()), live))
         if rule.handlers:
-            rctx['hdl'].append((widget.proxy_ref, rule.handlers))
+            rctx['hdl'].append((widget.proxy_ref, rule.handlers, live))
 
         # if we are applying another rule that the root one, then it's done for
         # us!
         if rootrule is not rule:
             del self.rulectx[rule]
+            if profile is not None:
+                elapsed = default_timer() - start
+                profile.add(applied, elapsed, elapsed,
+                            profile.handlers - handlers)
             return
 
         # normally, we can apply a list of properties with a proper context
         try:
             rule = None
-            for widget_set, rules in reversed(rctx['set']):
+            for widget_set, rules, live in reversed(rctx['set']):
                 for rule in rules:
                     assert(isinstance(rule, ParserRuleProperty))
                     key = rule.name
                     value = rule.co_value
+                    if live is not None:
+                        bounds = _handlers[widget_set.uid]
+                        n = len(bounds)
                     if type(value) is CodeType:
-                        value = create_handler(widget_set, widget_set, key,
-                                               value, rule, rctx['ids'])
+                        if rule.binder is None:
+                            value = create_handler(widget_set, widget_set,
+                                                   key, value, rule,
+                                                   rctx['ids'], self.deferred)
+                        else:
+                            value = rule.binder(widget_set, rctx['ids'],
+                                                widget_set, key, rule,
+                                                self.deferred)
+                    if live is not None:
+                        live.properties[key] = bounds[n:]
                     setattr(widget_set, key, value)
         except Exception as e:
             if rule is not None:
@@ -2021,7 +3105,7 @@ class BuilderBase(object):
         # build handlers
         try:
             crule = None
-            for widget_set, rules in rctx['hdl']:
+            for widget_set, rules, live in rctx['hdl']:
                 for crule in rules:
                     assert(isinstance(crule, ParserRuleProperty))
                     assert(crule.name.startswith('on_'))
@@ -2031,9 +3115,14 @@ class BuilderBase(object):
                     idmap = copy(global_idmap)
                     idmap.update(rctx['ids'])
                     idmap['self'] = widget_set.proxy_ref
-                    if not widget_set.fast_bind(key, custom_callback, crule,
-                                                idmap):
+                    uid = widget_set.fast_bind(key, custom_callback, crule,
+                                               idmap)
+                    if not uid:
                         raise AttributeError(key)
+                    if live is not None:
+                        live.handlers.append((key, uid))
+                    if profile is not None:
+                        profile.handlers += 1
                     #hack for on_parent
                     if crule.name == 'on_parent':
                         Factory.Widget.parent.dispatch(widget_set.__self__)
@@ -2047,20 +3136,60 @@ class BuilderBase(object):
 
         # rule finished, forget it
         del self.rulectx[rootrule]
+        if profile is not None:
+            elapsed = default_timer() - start
+            profile.add(applied, elapsed, elapsed,
+                        profile.handlers - handlers)
 
     def match(self, widget):
         '''Return a list of :class:`ParserRule` objects matching the widget.
+
+        .. versionchanged:: 1.9.0
+            The rules are indexed by class name, class (``.cls``) and id, so
+            only the rules that can apply to the widget are looked at instead
+            of the whole :attr:`rules` list.
         '''
-        cache = BuilderBase._match_cache
-        k = (widget.__class__, widget.id, tuple(widget.cls))
-        if k in cache:
-            return cache[k]
-        rules = []
-        for selector, rule in self.rules:
+        cache = self._match_cache
+        cls = widget.__class__
+        wid = widget.id
+        k = (cls, wid, tuple(widget.cls))
+        rules = cache.get(k)
+        if rules is not None:
+            return rules
+
+        # load first the lazy files having rules for the class
+        if self._lazy_names:
+            for name in ParserSelectorName.get_names(cls):
+                if name in self._lazy_names:
+                    self._load_lazy(name)
+
+        index = self._rule_index
+        matched = []
+        names = index[ParserSelectorName]
+        if names:
+            for name in ParserSelectorName.get_names(cls):
+                if name in names:
+                    matched.extend(names[name])
+        classes = index[ParserSelectorClass]
+        if classes:
+            for name in set(k[2]):
+                if name in classes:
+                    matched.extend(classes[name])
+        ids = index[ParserSelectorId]
+        if ids and wid:
+            matched.extend(ids.get(wid.lower(), ()))
+        for order, selector, rule in self._rule_others:
             if selector.match(widget):
-                if rule.avoid_previous_rules:
-                    del rules[:]
-                rules.append(rule)
+                matched.append((order, rule))
+
+        # restore the loading order, and drop everything before the last rule
+        # that asked for it
+        matched.sort(key=itemgetter(0))
+        rules = [rule for order, rule in matched]
+        for i in range(len(rules) - 1, -1, -1):
+            if rules[i].avoid_previous_rules:
+                del rules[:i]
+                break
         cache[k] = rules
         return rules
 
@@ -2071,21 +3200,30 @@ class BuilderBase(object):
         .. versionadded:: 1.7.0
         '''
         global _delayed_start
-        next_args = _delayed_start
-        if next_args is None:
-            return
-
-        while next_args is not StopIteration:
-            # is this try/except still needed? yes, in case widget died in this
-            # frame after the call was scheduled
-            try:
-                call_fn(next_args[:-1], None, None)
-            except ReferenceError:
-                pass
-            args = next_args
-            next_args = args[-1]
-            args[-1] = None
-        _delayed_start = None
+        # the calls can schedule new ones (deferred widget properties used by
+        # other expressions), which are executed in the same sync
+        count = self.max_iteration
+        while _delayed_start is not None:
+            count -= 1
+            if count == -1:
+                Logger.critical(
+                    'Builder: Warning, too much iteration done in the sync.'
+                    ' Check the kv expressions depending on each other, or'
+                    ' increase the Builder.max_iteration attribute')
+                break
+            next_args = _delayed_start
+            _delayed_start = None
+
+            while next_args is not StopIteration:
+                args = next_args
+                next_args = args[-1]
+                args[-1] = None
+                # is this try/except still needed? yes, in case widget died in
+                # this frame after the call was scheduled
+                try:
+                    call_fn(args[:-1], None, None)
+                except ReferenceError:
+                    pass
 
     def unbind_widget(self, uid):
         '''(internal) Unbind all the handlers created by the rules of the
@@ -2095,6 +3233,7 @@ class BuilderBase(object):
 
         .. versionadded:: 1.7.2
         '''
+        self._live.pop(uid, None)
         if uid not in _handlers:
             return
         for callbacks in _handlers[uid]:
@@ -2108,35 +3247,333 @@ class BuilderBase(object):
                     pass
         del _handlers[uid]
 
-    def _build_canvas(self, canvas, widget, rule, rootrule):
+    def start_profiling(self, reset=True):
+        '''Start recording, for each kv rule, property expression and event
+        handler, how many times it is applied or evaluated, the time spent
+        and the number of handlers created. See :meth:`get_stats`.
+
+        .. versionadded:: 1.9.0
+
+        :Parameters:
+            `reset`: bool, defaults to True
+                If False, add to the stats of the previous profiling instead
+                of starting new ones.
+        '''
+        global _profile, _profile_data
+        if reset or _profile_data is None:
+            _profile_data = _KvProfile()
+        _profile = _profile_data
+
+    def stop_profiling(self):
+        '''Stop recording the stats started by :meth:`start_profiling`. They
+        are still available in :meth:`get_stats`.
+
+        .. versionadded:: 1.9.0
+        '''
+        global _profile
+        _profile = None
+
+    def get_stats(self, sort='time', limit=None):
+        '''Return the stats recorded since :meth:`start_profiling`, as a list
+        of dicts sorted by decreasing `sort` value. Each dict has the keys:
+
+        - `kind`: 'rule' for the application of a rule (or of a child widget
+          in a rule), 'property' for a property expression, or 'handler' for
+          an event handler (`on_...`).
+        - `name`: name of the rule or property.
+        - `value`: the expression, None for a rule.
+        - `filename`, `line`: where it is defined.
+        - `count`: number of applications or evaluations.
+        - `time`: time in seconds spent in them, including the children for
+          a rule. For a property, only the evaluation of the expression.
+        - `total_time`: same as `time`, but also including the setting of the
+          property (and so, everything bound to it).
+        - `handlers`: number of handlers created (bound properties and
+          events), including the children for a rule.
+
+        .. versionadded:: 1.9.0
+
+        :Parameters:
+            `sort`: str, defaults to 'time'
+                One of 'count', 'time', 'total_time' or 'handlers'.
+            `limit`: int, defaults to None
+                Return only the first `limit` entries.
+        '''
+        if sort not in ('count', 'time', 'total_time', 'handlers'):
+            raise ValueError('Invalid sort key {!r}'.format(sort))
+        if _profile_data is None:
+            return []
+        stats = []
+        for key, (count, elapsed, total, handlers) in iteritems(
+                _profile_data.stats):
+            if isinstance(key, ParserRule):
+                kind = 'rule'
+                value = None
+            else:
+                kind = 'handler' if key.mode == 'exec' else 'property'
+                value = key.value
+            stats.append({
+                'kind': kind, 'name': key.name, 'value': value,
+                'filename': key.ctx.filename, 'line': key.line + 1,
+                'count': count, 'time': elapsed, 'total_time': total,
+                'handlers': handlers})
+        stats.sort(key=itemgetter(sort), reverse=True)
+        return stats[:limit]
+
+    def dump_stats(self, filename=None, format='text', sort='time',
+                   limit=None):
+        '''Return the stats of :meth:`get_stats` as a text report, or as JSON
+        if `format` is 'json'. If `filename` is given, they are written in it
+        too.
+
+        .. versionadded:: 1.9.0
+        '''
+        stats = self.get_stats(sort, limit)
+        if format == 'json':
+            result = json.dumps(stats, indent=1)
+        elif format == 'text':
+            lines = ['{:>8} {:>10} {:>10} {:>8}  {}'.format(
+                'count', 'time', 'total', 'handlers', 'kv')]
+            for entry in stats:
+                where = '{}:{}'.format(
+                    os.path.basename(entry['filename'] or '<string>'),
+                    entry['line'])
+                what = entry['name']
+                if entry['value'] is not None:
+                    what = '{}: {}'.format(what, entry['value'])
+                what = what.replace('\n', ' ')
+                if len(what) > 60:
+                    what = what[:57] + '...'
+                lines.append('{:>8} {:>10.6f} {:>10.6f} {:>8}  {} {}'.format(
+                    entry['count'], entry['time'], entry['total_time'],
+                    entry['handlers'], where, what))
+            result = '\n'.join(lines)
+        else:
+            raise ValueError('Invalid format {!r}'.format(format))
+        if filename is not None:
+            with open(filename, 'w') as fd:
+                fd.write(result)
+        return result
+
+    def _build_canvas(self, canvas, widget, rule, idmap, created=None):
+        recipe = rule.recipe
+        if recipe is not None:
+            # the classes could have been registered again in the Factory
+            classes = Factory.classes
+            for name, item, cls, crule, props in recipe:
+                if item is not None and classes.get(name) is not item:
+                    recipe = None
+                    break
+        if recipe is None:
+            recipe = rule.recipe = self._build_canvas_recipe(rule)
+
+        # create_handler() copies the ids when it needs to, and the
+        # closures only read them
+        for name, item, cls, crule, props in recipe:
+            if cls is None:
+                canvas.clear()
+                continue
+            instr = cls()
+            if created is not None:
+                created.append(instr)
+            element = instr.proxy_ref
+            try:
+                for key, value, prule in props:
+                    if prule is not None:
+                        if prule.binder is None:
+                            value = create_handler(
+                                widget, element, key, value, prule, idmap,
+                                True)
+                        else:
+                            value = prule.binder(
+                                widget, idmap, element, key, prule, True)
+                    setattr(instr, key, value)
+            except Exception as e:
+                tb = sys.exc_info()[2]
+                raise BuilderException(
+                    prule.ctx, prule.line,
+                    '{}: {}'.format(e.__class__.__name__, e), cause=tb)
+
+    def _build_canvas_recipe(self, rule):
+        # The recipe of a canvas rule is what _build_canvas() needs to stamp
+        # out its instructions: for each of them, the name, the Factory item
+        # and the class of the instruction, and its properties, as a list of
+        # (key, value, rule) where rule is None for the constant values. It
+        # is built once for all the widgets using the rule.
         global Instruction
         if Instruction is None:
             Instruction = Factory.get('Instruction')
-        idmap = copy(self.rulectx[rootrule]['ids'])
+        recipe = []
+        classes = Factory.classes
         for crule in rule.children:
             name = crule.name
             if name == 'Clear':
-                canvas.clear()
+                recipe.append((name, None, None, crule, ()))
                 continue
-            instr = Factory.get(name)()
-            if not isinstance(instr, Instruction):
+            cls = Factory.get(name)
+            if not isinstance(cls, type) or not issubclass(cls, Instruction):
                 raise BuilderException(
                     crule.ctx, crule.line,
                     'You can add only graphics Instruction in canvas.')
-            try:
-                for prule in crule.properties.values():
+            props = []
+            for prule in crule.properties.values():
+                value = prule.co_value
+                props.append((prule.name, value,
+                              prule if type(value) is CodeType else None))
+            recipe.append((name, classes[name], cls, crule, tuple(props)))
+        return tuple(recipe)
+
+    def _build_live_canvas(self, live, attr):
+        # build a canvas block of a recorded rule in its own InstructionGroup,
+        # that a reload can fill again without moving it in the canvas
+        canvas = _get_canvas(live.widget, attr)
+        with canvas:
+            group = Factory.InstructionGroup()
+        self._fill_live_canvas(live, attr, canvas, group)
+
+    def _fill_live_canvas(self, live, attr, canvas, group):
+        widget = live.widget
+        bounds = _handlers[widget.uid]
+        n = len(bounds)
+        created = []
+        with canvas:
+            self._build_canvas(canvas, widget, getattr(live.rule, attr),
+                               live.ids, created)
+        for instr in created:
+            canvas.remove(instr)
+            group.add(instr)
+        live.canvas[attr] = (group, bounds[n:])
+
+    def _pair_reloaded_rules(self, fn, indices, parser):
+        # return the (old, new) root rules, rules and templates of a reloaded
+        # file, or None if it doesn't declare the same ones anymore
+        if len(indices) != len(parser.rules):
+            return None
+        pairs = []
+        mapping = {}
+        for i, (selector, new) in zip(indices, parser.rules):
+            old_selector, old = self.rules[i]
+            if (type(old_selector) is not type(selector) or
+                    old_selector.key != selector.key or
+                    old.avoid_previous_rules != new.avoid_previous_rules or
+                    mapping.setdefault(old, new) is not new):
+                return None
+            if (old, new) not in pairs:
+                pairs.append((old, new))
+
+        templates = dict((name, (cls, template))
+                         for name, cls, template in parser.templates)
+        old_templates = dict((name, x[:2]) for name, x in
+                             self.templates.items() if x[2] == fn)
+        if set(templates) != set(old_templates):
+            return None
+        for name, (cls, old) in old_templates.items():
+            if templates[name][0] != cls:
+                return None
+            pairs.append((old, templates[name][1]))
+
+        dynamic_classes = dict(
+            (name, x['baseclasses']) for name, x in Factory.classes.items()
+            if x['filename'] == fn and x['baseclasses'] is not None)
+        if dynamic_classes != parser.dynamic_classes:
+            return None
+
+        old = self._root_rules.get(fn)
+        if (old is None) != (parser.root is None):
+            return None
+        if old is not None:
+            pairs.append((old, parser.root))
+        return pairs
+
+    def _map_reloaded_rule(self, old, new, mapping):
+        # map the old rule (and its children) to the new one, return False if
+        # the widgets of the old rule cannot be updated to the new one
+        if (old.name != new.name or _rule_id(old) != _rule_id(new) or
+                len(old.children) != len(new.children)):
+            return False
+        for attr in _canvas_attrs:
+            block = getattr(old, attr)
+            new_block = getattr(new, attr)
+            if _canvas_key(block) == _canvas_key(new_block):
+                continue
+            # a new block would not be at the same place in the canvas, and
+            # Clear removes the instructions of the other rules
+            if block is None or _has_clear(block) or _has_clear(new_block):
+                return False
+        children = {}
+        for child, new_child in zip(old.children, new.children):
+            if not self._map_reloaded_rule(child, new_child, children):
+                return False
+        mapping.update(children)
+        mapping[old] = new
+        return True
+
+    def _update_live(self, live, new, diff):
+        # apply the changes of a reloaded rule to a widget it was applied to
+        changed, removed, handlers, canvas = diff
+        widget = live.widget
+        uid = widget.uid
+        live.rule = new
+        for key in removed:
+            _unbind_live(uid, live.properties.pop(key, ()))
+
+        prule = None
+        try:
+            if changed:
+                new.create_missing(widget)
+            for prule in changed:
+                key = prule.name
+                _unbind_live(uid, live.properties.pop(key, ()))
+                bounds = _handlers[uid]
+                n = len(bounds)
+                value = prule.co_value
+                if type(value) is CodeType:
+                    if prule.binder is None:
+                        value = create_handler(widget, widget, key, value,
+                                               prule, live.ids, self.deferred)
+                    else:
+                        value = prule.binder(widget, live.ids, widget, key,
+                                             prule, self.deferred)
+                live.properties[key] = bounds[n:]
+                setattr(widget, key, value)
+
+            if handlers:
+                for key, handler_uid in live.handlers:
+                    widget.unbind_uid(key, handler_uid)
+                live.handlers = []
+                for prule in new.handlers:
                     key = prule.name
-                    value = prule.co_value
-                    if type(value) is CodeType:
-                        value = create_handler(
-                            widget, instr.proxy_ref,
-                            key, value, prule, idmap, True)
-                    setattr(instr, key, value)
-            except Exception as e:
+                    if not widget.is_event_type(key):
+                        key = key[3:]
+                    idmap = copy(global_idmap)
+                    idmap.update(live.ids)
+                    idmap['self'] = widget.proxy_ref
+                    handler_uid = widget.fast_bind(key, custom_callback,
+                                                   prule, idmap)
+                    if not handler_uid:
+                        raise AttributeError(key)
+                    live.handlers.append((key, handler_uid))
+                    if prule.name == 'on_parent':
+                        Factory.Widget.parent.dispatch(widget.__self__)
+        except ReferenceError:
+            raise
+        except Exception as e:
+            if prule is not None:
                 tb = sys.exc_info()[2]
-                raise BuilderException(
-                    prule.ctx, prule.line,
-                    '{}: {}'.format(e.__class__.__name__, e), cause=tb)
+                raise BuilderException(prule.ctx, prule.line,
+                                       '{}: {}'.format(e.__class__.__name__,
+                                                       e), cause=tb)
+            raise e
+
+        for attr in canvas:
+            group, bounds = live.canvas[attr]
+            _unbind_live(uid, bounds)
+            group.clear()
+            if getattr(new, attr) is None:
+                live.canvas[attr] = (group, [])
+            else:
+                self._fill_live_canvas(live, attr, Factory.Canvas(), group)
+
 
 #: Main instance of a :class:`BuilderBase`.
 Builder = register_context('Builder', BuilderBase)
@@ -2146,6 +3583,8 @@ if 'KIVY_PROFILE_LANG' in environ:
     import atexit
     import cgi
 
+    Builder.start_profiling()
+
     def match_rule(fn, index, rule):
         if rule.ctx.filename != fn:
             return
@@ -2167,6 +3606,7 @@ if 'KIVY_PROFILE_LANG' in environ:
                 yield r
 
     def dump_builder_stats():
+        Builder.dump_stats('builder_stats.json', format='json')
         html = [
             '<!doctype html>'
             '<html><body>',
@@ -2198,6 +3638,6 @@ if 'KIVY_PROFILE_LANG' in environ:
         with open('builder_stats.html', 'w') as fd:
             fd.write(''.join(html))
 
-        print('Profiling written at builder_stats.html')
+        print('Profiling written at builder_stats.html and builder_stats.json')
 
     atexit.register(dump_builder_stats)
@@ -139,6 +139,8 @@ cdef extern from "SDL.h":
         SDL_FIRSTEVENT     = 0,
         SDL_DROPFILE       = 0x1000,
         SDL_QUIT           = 0x100
+        SDL_APP_TERMINATING
+        SDL_APP_LOWMEMORY
         SDL_WINDOWEVENT    = 0x200
         SDL_SYSWMEVENT
         SDL_KEYDOWN        = 0x300
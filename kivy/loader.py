@@ -268,7 +268,7 @@ class LoaderBase(object):
             data = post_callback(data)
 
         self._q_done.appendleft((filename, data))
-        self._trigger_update()
+        Clock.schedule_from_thread(self._trigger_update, block=True)
 
     def _load_local(self, filename, kwargs):
         '''(internal) Loading a local file'''
@@ -18,6 +18,8 @@ loading of modules is managed by the config file. Currently, we include:
       widget properties.
     * :class:`~kivy.modules.webdebugger`: Realtime examination of your app
       internals via a web browser.
+    * :class:`~kivy.modules.clockprofiler`: Record the time spent in the clock
+      callbacks.
 
 Modules are automatically loaded from the Kivy path and User path:
 
@@ -0,0 +1,52 @@
+'''
+Clock profiler
+==============
+
+.. versionadded:: 1.9.0
+
+The Clock profiler module records the time spent in each callback scheduled
+with the :class:`~kivy.clock.Clock` during the whole run of the application.
+When the application stops, the most expensive callbacks are logged, and the
+timeline can be written in the Chrome trace event format, to be examined in
+`chrome://tracing`.
+
+Usage
+-----
+
+For normal module usage, please see the :mod:`~kivy.modules` documentation.
+
+To write the timeline to `trace.json`::
+
+    python main.py -m clockprofiler:trace=trace.json
+
+Available options:
+
+    `trace`: string, defaults to ''
+        Filename of the Chrome trace file to write when the application
+        stops. If empty, only the statistics are logged.
+    `limit`: int, defaults to 20
+        Number of callbacks to log.
+
+See :ref:`clock-profiling` for more information.
+'''
+
+__all__ = ('start', 'stop')
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+
+def start(win, ctx):
+    ctx.trace_filename = ctx.config.get('trace', '')
+    Clock.start_profiling(trace=bool(ctx.trace_filename))
+
+
+def stop(win, ctx):
+    profiler = Clock.stop_profiling()
+    if profiler is None:
+        return
+    profiler.print_stats(int(ctx.config.get('limit', 20)))
+    if ctx.trace_filename:
+        profiler.export_trace(ctx.trace_filename)
+        Logger.info('ClockProfiler: Timeline written to %s' %
+                    ctx.trace_filename)
@@ -6,6 +6,7 @@ The Monitor module is a toolbar that shows the activity of your current
 application :
 
 * FPS
+* Memory used by the :mod:`~kivy.cache` and its hit rate
 * Graph of input events
 
 Usage
@@ -20,14 +21,27 @@ __all__ = ('start', 'stop')
 from kivy.uix.label import Label
 from kivy.graphics import Rectangle, Color
 from kivy.clock import Clock
+from kivy.cache import Cache
 from functools import partial
 
 _statsinput = 0
 _maxinput = -1
 
 
+def get_cache_usage():
+    nbytes = hits = misses = 0
+    for category in list(Cache._categories):
+        stats = Cache.get_stats(category)
+        nbytes += stats['bytes']
+        hits += stats['hits']
+        misses += stats['misses']
+    hit_rate = 100. * hits / (hits + misses) if hits + misses else 100.
+    return nbytes / 1048576., hit_rate
+
+
 def update_fps(ctx, *largs):
-    ctx.label.text = 'FPS: %f' % Clock.get_fps()
+    ctx.label.text = 'FPS: %f - Cache: %.1f MB, %d%% hits' % (
+        (Clock.get_fps(), ) + get_cache_usage())
     ctx.rectangle.texture = ctx.label.texture
     ctx.rectangle.size = ctx.label.texture_size
 
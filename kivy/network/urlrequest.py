@@ -206,20 +206,28 @@ class UrlRequest(Thread):
             q(('success', resp, result))
 
         # using trigger can result in a missed on_success event
-        self._trigger_result()
+        self._schedule_result()
 
         # clean ourself when the queue is empty
         while len(self._queue):
             sleep(.1)
-            self._trigger_result()
+            self._schedule_result()
 
         # ok, authorize the GC to clean us.
         if self in g_requests:
             g_requests.remove(self)
 
+    def _schedule_result(self):
+        # the results stay in the queue until they are dispatched, and run()
+        # schedules the dispatch again until the queue is empty. So wait only
+        # a bit if the clock queue is full: the kivy thread may be in wait(),
+        # which dispatches the results without ticking the clock.
+        Clock.schedule_from_thread(self._trigger_result, block=True,
+                                   timeout=.1)
+
     def _fetch_url(self, url, body, headers, q):
         # Parse and fetch the current url
-        trigger = self._trigger_result
+        trigger = self._schedule_result
         chunk_size = self._chunk_size
         report_progress = self.on_progress is not None
         timeout = self._timeout
@@ -1,4 +1,5 @@
-from kivy._event cimport EventDispatcher, EventObservers
+from kivy._event cimport (EventDispatcher, EventObservers, PropertyLayout,
+    record_dispatch)
 
 cdef class PropertyStorage:
     cdef object value
@@ -16,11 +17,14 @@ cdef class PropertyStorage:
     cdef object getter
     cdef object setter
     cdef int alias_initial
+    cdef int dispatch_pending
 
 cdef class Property:
     cdef str _name
+    cdef int slot
     cdef int allownone
     cdef int force_dispatch
+    cdef int deferred
     cdef object errorvalue
     cdef object errorhandler
     cdef int errorvalue_set
@@ -53,6 +57,10 @@ cdef class ListProperty(Property):
 cdef class DictProperty(Property):
     cdef public int rebind
 
+cdef class ArrayProperty(Property):
+    cdef readonly object typecode
+    cdef to_array(self, EventDispatcher obj, value)
+
 cdef class ObjectProperty(Property):
     cdef object baseclass
     cdef public int rebind
@@ -198,11 +198,13 @@ __all__ = ('Property',
            'NumericProperty', 'StringProperty', 'ListProperty',
            'ObjectProperty', 'BooleanProperty', 'BoundedNumericProperty',
            'OptionProperty', 'ReferenceListProperty', 'AliasProperty',
-           'DictProperty', 'VariableListProperty', 'ConfigParserProperty')
+           'DictProperty', 'VariableListProperty', 'ConfigParserProperty',
+           'ArrayProperty')
 
 include "graphics/config.pxi"
 
 
+from array import array
 from weakref import ref
 from kivy.compat import string_types
 from kivy.config import ConfigParser
@@ -210,6 +212,57 @@ from functools import partial
 from kivy.clock import Clock
 from kivy.weakmethod import WeakMethod
 
+cdef inline PropertyStorage get_storage(Property prop, EventDispatcher obj):
+    # Return the storage of prop in obj. The storage is in the slot of the
+    # property, unless obj doesn't share the layout of the class that gave the
+    # property its slot: then the slot is looked up by name.
+    cdef list storage = obj.__storage
+    cdef int slot = prop.slot
+    cdef object ps
+    if 0 <= slot < len(storage) and (
+            <PropertyLayout>obj.__layout).properties[slot] is prop:
+        ps = storage[slot]
+        if ps is not None:
+            return ps
+    ps = (<PropertyLayout>obj.__layout).slots.get(prop._name)
+    if ps is None or ps >= len(storage) or storage[ps] is None:
+        raise KeyError(prop._name)
+    return storage[ps]
+
+#: Stored instead of the value of a ListProperty or DictProperty, until the
+#: value is read or written, so that the default value is shared until then
+cdef object shared_default = object()
+
+cdef list deferred_dispatches = []
+cdef object deferred_trigger = None
+
+cdef inline void defer_dispatch(EventDispatcher obj, Property prop) except *:
+    global deferred_trigger
+    deferred_dispatches.append((obj, prop))
+    if deferred_trigger is None:
+        deferred_trigger = Clock.create_trigger(_dispatch_deferred, -1)
+    deferred_trigger()
+
+def _dispatch_deferred(*largs):
+    # dispatch the deferred properties changed since the last frame. The
+    # properties changed by their observers are dispatched in the next pass of
+    # the clock, still before the frame.
+    global deferred_dispatches
+    cdef EventDispatcher obj
+    cdef Property prop
+    cdef PropertyStorage ps
+    cdef list pending = deferred_dispatches
+    deferred_dispatches = []
+    for obj, prop in pending:
+        ps = get_storage(prop, obj)
+        ps.dispatch_pending = 0
+    for obj, prop in pending:
+        ps = get_storage(prop, obj)
+        if ps.observers is None:
+            record_dispatch(obj, prop._name)
+        else:
+            ps.observers.dispatch(obj, ps.value, None, None, 0, prop._name)
+
 cdef float g_dpi = -1
 cdef float g_density = -1
 cdef float g_fontscale = -1
@@ -288,17 +341,26 @@ cdef class Property:
             dispatched to avoid infinite recursion in two-way binds). Be
             careful, this is for advanced use only.
 
+            If the parameters include `deferred`, it should be a boolean. If
+            True, the value is stored immediately, but the observers are
+            called at most once per frame, just before the frame is drawn,
+            with the last value. This is useful for properties changed many
+            times per frame, like a property following a sensor or the
+            touches, when the observers only need the last value.
+
     .. versionchanged:: 1.4.2
         Parameters errorhandler and errorvalue added
 
     .. versionchanged:: 1.9.0
-        Parameter force_dispatch added
+        Parameters force_dispatch and deferred added
     '''
 
     def __cinit__(self):
         self._name = ''
+        self.slot = -1
         self.allownone = 0
         self.force_dispatch = 0
+        self.deferred = 0
         self.defaultvalue = None
         self.errorvalue = None
         self.errorhandler = None
@@ -309,6 +371,7 @@ cdef class Property:
         self.defaultvalue = defaultvalue
         self.allownone = <int>kw.get('allownone', 0)
         self.force_dispatch = <int>kw.get('force_dispatch', 0)
+        self.deferred = <int>kw.get('deferred', 0)
         self.errorvalue = kw.get('errorvalue', None)
         self.errorhandler = kw.get('errorhandler', None)
 
@@ -323,8 +386,8 @@ cdef class Property:
             return self._name
 
     cdef init_storage(self, EventDispatcher obj, PropertyStorage storage):
+        # the observers are created on the first bind
         storage.value = self.convert(obj, self.defaultvalue)
-        storage.observers = EventObservers()
 
     cpdef link(self, EventDispatcher obj, str name):
         '''Link the instance with its real name.
@@ -345,13 +408,24 @@ cdef class Property:
         used in `Widget.__new__`. The link function is also used to create the
         storage space of the property for this specific widget instance.
         '''
-        cdef PropertyStorage d
+        cdef PropertyStorage d = None
+        cdef PropertyLayout layout = obj.__layout
+        cdef list storage = obj.__storage
+        cdef object slot
         if self._name != '' and name != self._name:
-            d = obj.__storage.get(self._name, PropertyStorage())
-        else:
+            slot = layout.slots.get(self._name)
+            if slot is not None and slot < len(storage):
+                d = storage[slot]
+        if d is None:
             d = PropertyStorage()
         self._name = name
-        obj.__storage[name] = d
+        slot = layout.slots.get(name)
+        if slot is None:
+            # created at runtime, or linked to an instance of another class
+            slot = layout.add(name, self)
+        if slot >= len(storage):
+            storage.extend([None] * (slot + 1 - len(storage)))
+        storage[slot] = d
         self.init_storage(obj, d)
 
     cpdef link_deps(self, EventDispatcher obj, str name):
@@ -360,7 +434,9 @@ cdef class Property:
     cpdef bind(self, EventDispatcher obj, observer):
         '''Add a new observer to be called only when the value is changed.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.observers is None:
+            ps.observers = EventObservers()
         ps.observers.bind(WeakMethod(observer), 1)
 
     cpdef fast_bind(self, EventDispatcher obj, observer, tuple largs=(), dict kwargs={}):
@@ -369,29 +445,34 @@ cdef class Property:
         fast_unbind or unbind_uid should be called when unbinding.
         It returns a unique positive uid to be used with unbind_uid.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.observers is None:
+            ps.observers = EventObservers()
         return ps.observers.fast_bind(observer, largs, kwargs, 0)
 
     cpdef unbind(self, EventDispatcher obj, observer):
         '''Remove the observer from our widget observer list.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.observers.unbind(observer, 1, 0)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.observers is not None:
+            ps.observers.unbind(observer, 1, 0)
 
     cpdef fast_unbind(self, EventDispatcher obj, observer, tuple largs=(), dict kwargs={}):
         '''Remove the observer from our widget observer list bound with
         fast_bind. It removes the first match it finds, as opposed to unbind
         which searches for all matches.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.observers.fast_unbind(observer, largs, kwargs)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.observers is not None:
+            ps.observers.fast_unbind(observer, largs, kwargs)
 
     cpdef unbind_uid(self, EventDispatcher obj, object uid):
         '''Remove the observer from our widget observer list bound with
         fast_bind using the uid.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.observers.unbind_uid(uid)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.observers is not None:
+            ps.observers.unbind_uid(uid)
 
     def __set__(self, EventDispatcher obj, val):
         self.set(obj, val)
@@ -407,9 +488,11 @@ cdef class Property:
     cpdef set(self, EventDispatcher obj, value):
         '''Set a new value for the property.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         value = self.convert(obj, value)
         realvalue = ps.value
+        if realvalue is shared_default:
+            realvalue = self.defaultvalue
         if not self.force_dispatch and self.compare_value(realvalue, value):
             return False
 
@@ -434,7 +517,7 @@ cdef class Property:
         '''
         cdef PropertyStorage ps
         try:
-            ps = obj.__storage[self._name]
+            ps = get_storage(self, obj)
         except KeyError:
             raise AttributeError(self._name)
         return ps.value
@@ -479,9 +562,30 @@ cdef class Property:
             # dispatch this property on the button instance
             prop.dispatch(button)
 
+        .. versionchanged:: 1.9.0
+            Within :meth:`~kivy.event.EventDispatcher.batch_dispatch`, the
+            dispatch is delayed until the end of the batch. If the property
+            is `deferred`, the dispatch is delayed until the next frame.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.observers.dispatch(obj, ps.value, None, None, 0)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        if ps.value is shared_default:
+            # the observers get the value of the instance
+            self.get(obj)
+        if self.deferred:
+            if not ps.dispatch_pending:
+                ps.dispatch_pending = 1
+                defer_dispatch(obj, self)
+            return
+        if obj.__batch_depth:
+            if obj.__batch_pending is None:
+                obj.__batch_pending = [self]
+            elif self not in obj.__batch_pending:
+                obj.__batch_pending.append(self)
+            return
+        if ps.observers is None:
+            record_dispatch(obj, self._name)
+        else:
+            ps.observers.dispatch(obj, ps.value, None, None, 0, self._name)
 
 
 cdef class NumericProperty(Property):
@@ -547,7 +651,7 @@ cdef class NumericProperty(Property):
         return self.parse_list(obj, value[:-2], value[-2:])
 
     cdef float parse_list(self, EventDispatcher obj, value, ext):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         ps.numeric_fmt = ext
         return dpi2px(value, ext)
 
@@ -557,7 +661,7 @@ cdef class NumericProperty(Property):
         the value have not been changed at all). Otherwise, it can be one of
         'in', 'pt', 'cm', 'mm'.
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         return ps.numeric_fmt
 
 
@@ -680,8 +784,18 @@ cdef class ListProperty(Property):
 
     cpdef link(self, EventDispatcher obj, str name):
         Property.link(self, obj, name)
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.value = ObservableList(self, obj, ps.value)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        ps.value = shared_default
+
+    cpdef get(self, EventDispatcher obj):
+        cdef PropertyStorage ps
+        try:
+            ps = get_storage(self, obj)
+        except KeyError:
+            raise AttributeError(self._name)
+        if ps.value is shared_default:
+            ps.value = ObservableList(self, obj, self.defaultvalue)
+        return ps.value
 
     cdef check(self, EventDispatcher obj, value):
         if Property.check(self, obj, value):
@@ -787,8 +901,18 @@ cdef class DictProperty(Property):
 
     cpdef link(self, EventDispatcher obj, str name):
         Property.link(self, obj, name)
-        cdef PropertyStorage ps = obj.__storage[self._name]
-        ps.value = ObservableDict(self, obj, ps.value)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        ps.value = shared_default
+
+    cpdef get(self, EventDispatcher obj):
+        cdef PropertyStorage ps
+        try:
+            ps = get_storage(self, obj)
+        except KeyError:
+            raise AttributeError(self._name)
+        if ps.value is shared_default:
+            ps.value = ObservableDict(self, obj, self.defaultvalue)
+        return ps.value
 
     cdef check(self, EventDispatcher obj, value):
         if Property.check(self, obj, value):
@@ -803,6 +927,306 @@ cdef class DictProperty(Property):
         Property.set(self, obj, value)
 
 
+cdef inline void observable_array_dispatch(
+        object self, Py_ssize_t size, Py_ssize_t start, stop=None):
+    # record the changed range [start, stop) and dispatch the property once.
+    # size is the length of the array before the change (-1 to always
+    # dispatch): nothing is done if the change is empty and kept the length.
+    cdef Py_ssize_t n = len(self)
+    cdef Property prop = self.prop
+    if stop is None or stop > n:
+        stop = n
+    if start > stop:
+        start = stop
+    if start == stop and size == n:
+        return
+    dirty = self.dirty
+    if dirty is None:
+        self.dirty = (start, stop)
+    else:
+        self.dirty = (min(dirty[0], start, n), min(max(dirty[1], stop), n))
+    obj = self.obj()
+    if obj is not None:
+        prop.dispatch(obj)
+
+
+cdef inline Py_ssize_t observable_array_index(Py_ssize_t index, Py_ssize_t n):
+    if index < 0:
+        index += n
+    return min(max(index, 0), n)
+
+
+cdef array_fill(arr, value):
+    # append the items of `value` to the array `arr`, with a single copy when
+    # value is a contiguous buffer of the same type
+    cdef object view
+    if isinstance(value, array) and value.typecode != arr.typecode:
+        array.fromlist(arr, value.tolist())
+        return
+    try:
+        view = memoryview(value)
+    except TypeError:
+        view = None
+    if (view is not None and view.format == arr.typecode and
+            view.itemsize == arr.itemsize and view.ndim == 1 and
+            getattr(view, 'c_contiguous', False)):
+        array.frombytes(arr, view.cast('B'))
+        return
+    array.extend(arr, value)
+
+
+class ObservableArray(array):
+    '''Array holding the value of an :class:`ArrayProperty`.
+
+    It's a :class:`array.array`: the items are stored in a contiguous typed
+    buffer, which can be passed without copy to anything supporting the buffer
+    protocol (a :class:`memoryview`, NumPy, or a graphics instruction such as
+    :attr:`~kivy.graphics.vertex_instructions.Mesh.vertices`).
+
+    Every change of the array dispatches the property once, whatever the
+    number of items changed, and extends the `dirty` range with the changed
+    items: `dirty` is the (start, stop) range of the items changed since the
+    last :meth:`pop_dirty`, or None if nothing changed.
+
+    .. versionadded:: 1.9.0
+    '''
+
+    __slots__ = ('prop', 'obj', 'dirty')
+
+    def __new__(cls, prop, obj, typecode, *largs):
+        self = array.__new__(cls, typecode, *largs)
+        self.prop = prop
+        self.obj = ref(obj)
+        self.dirty = None
+        return self
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles are plain arrays, not bound to the property
+        return array, (self.typecode, self.tolist())
+
+    def mark_dirty(self, start=0, stop=None):
+        '''Mark the items from `start` to `stop` (defaults to the end of the
+        array) as changed, and dispatch the property. Use it after changing the
+        items through the buffer, e.g. in a :class:`memoryview` or the array
+        returned by :meth:`as_numpy`.
+        '''
+        observable_array_dispatch(
+            self, -1, observable_array_index(start, len(self)), stop)
+
+    def pop_dirty(self):
+        '''Return the (start, stop) range of the items changed since the last
+        call, or None if nothing changed, and reset it. A consumer can use it
+        to update only the changed slice of its copy of the data.
+        '''
+        dirty = self.dirty
+        self.dirty = None
+        return dirty
+
+    def as_numpy(self):
+        '''Return a NumPy array sharing the buffer of this array (no copy).
+        NumPy is imported on the first call.
+
+        .. note::
+
+            The array cannot be resized while the NumPy array is alive, and
+            changes made through the NumPy array are not dispatched: call
+            :meth:`mark_dirty` after them.
+        '''
+        import numpy
+        return numpy.frombuffer(self, dtype=self.typecode)
+
+    def __setitem__(self, key, value):
+        cdef Py_ssize_t n = len(self)
+        if not isinstance(key, slice):
+            index = observable_array_index(key, n)
+            array.__setitem__(self, key, value)
+            observable_array_dispatch(self, n, index, index + 1)
+            return
+        if not isinstance(value, array) or value.typecode != self.typecode:
+            items = array(self.typecode)
+            array_fill(items, value)
+            value = items
+        array.__setitem__(self, key, value)
+        start, stop, step = key.indices(n)
+        if step == 1 and len(self) == n:
+            observable_array_dispatch(self, n, start, max(start, stop))
+        elif step == 1:
+            # the size changed, every item after start moved
+            observable_array_dispatch(self, n, start)
+        else:
+            items = range(start, stop, step)
+            if len(items):
+                observable_array_dispatch(
+                    self, n, min(items[0], items[-1]),
+                    max(items[0], items[-1]) + 1)
+
+    def __delitem__(self, key):
+        cdef Py_ssize_t n = len(self)
+        if isinstance(key, slice):
+            items = range(*key.indices(n))
+            start = min(items[0], items[-1]) if len(items) else n
+        else:
+            start = observable_array_index(key, n)
+        array.__delitem__(self, key)
+        observable_array_dispatch(self, n, start)
+
+    def __setslice__(self, i, j, value):
+        self.__setitem__(slice(i, j), value)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(i, j))
+
+    def __iadd__(self, value):
+        self.extend(value)
+        return self
+
+    def __imul__(self, value):
+        cdef Py_ssize_t n = len(self)
+        array.__imul__(self, value)
+        observable_array_dispatch(self, n, min(n, len(self)))
+        return self
+
+    def append(self, value):
+        cdef Py_ssize_t n = len(self)
+        array.append(self, value)
+        observable_array_dispatch(self, n, n)
+
+    def extend(self, value):
+        cdef Py_ssize_t n = len(self)
+        array_fill(self, value)
+        observable_array_dispatch(self, n, n)
+
+    def fromlist(self, value):
+        cdef Py_ssize_t n = len(self)
+        array.fromlist(self, value)
+        observable_array_dispatch(self, n, n)
+
+    def frombytes(self, value):
+        cdef Py_ssize_t n = len(self)
+        array.frombytes(self, value)
+        observable_array_dispatch(self, n, n)
+
+    def fromstring(self, value):
+        cdef Py_ssize_t n = len(self)
+        array.fromstring(self, value)
+        observable_array_dispatch(self, n, n)
+
+    def fromfile(self, f, count):
+        cdef Py_ssize_t n = len(self)
+        try:
+            array.fromfile(self, f, count)
+        finally:
+            if len(self) != n:
+                observable_array_dispatch(self, n, n)
+
+    def insert(self, index, value):
+        cdef Py_ssize_t n = len(self)
+        array.insert(self, index, value)
+        observable_array_dispatch(self, n, observable_array_index(index, n))
+
+    def pop(self, index=-1):
+        cdef Py_ssize_t n = len(self)
+        cdef object result = array.pop(self, index)
+        observable_array_dispatch(self, n, observable_array_index(index, n))
+        return result
+
+    def remove(self, value):
+        cdef Py_ssize_t index = self.index(value)
+        array.__delitem__(self, index)
+        observable_array_dispatch(self, -1, index)
+
+    def reverse(self):
+        array.reverse(self)
+        observable_array_dispatch(self, len(self), 0)
+
+    def byteswap(self):
+        array.byteswap(self)
+        observable_array_dispatch(self, len(self), 0)
+
+
+cdef class ArrayProperty(Property):
+    '''Property that represents an array of numbers, stored in a contiguous
+    typed buffer.
+
+    :Parameters:
+        `defaultvalue`: iterable or buffer, defaults to an empty array
+            Specifies the default value of the property.
+        `typecode`: str, defaults to 'f'
+            Type of the items, as a :mod:`array` typecode. The default, 'f',
+            is the C float used by the graphics instructions.
+
+    Unlike a :class:`ListProperty`, which stores Python objects and dispatches
+    for each item assignment, an :class:`ArrayProperty` is made for large
+    numeric data such as the vertices of a
+    :class:`~kivy.graphics.vertex_instructions.Mesh`. The value is an
+    :class:`ObservableArray`, and assigning a whole slice dispatches the
+    property once::
+
+        class Plot(Widget):
+            vertices = ArrayProperty()
+
+        plot.vertices[0:4000] = new_values  # a single dispatch
+
+    The value can be set from any iterable of numbers. A buffer of the same
+    type (an :class:`array.array`, or a one-dimensional contiguous NumPy
+    array with a matching dtype) is copied in a single memory copy on Python
+    3. As with a :class:`ListProperty`, the value stored is always a copy.
+
+    The `dirty` range of the :class:`ObservableArray` tells the consumers which items
+    changed since they last read them (with
+    :meth:`ObservableArray.pop_dirty`), so that they can update only that
+    slice of their copy of the data. Setting a new value marks the whole
+    array as changed.
+
+    .. versionadded:: 1.9.0
+    '''
+    def __init__(self, defaultvalue=None, typecode='f', **kw):
+        self.typecode = typecode
+        value = array(typecode)
+        if defaultvalue is not None:
+            array_fill(value, defaultvalue)
+        super(ArrayProperty, self).__init__(value, **kw)
+
+    cpdef link(self, EventDispatcher obj, str name):
+        Property.link(self, obj, name)
+        cdef PropertyStorage ps = get_storage(self, obj)
+        ps.value = shared_default
+
+    cpdef get(self, EventDispatcher obj):
+        cdef PropertyStorage ps
+        try:
+            ps = get_storage(self, obj)
+        except KeyError:
+            raise AttributeError(self._name)
+        if ps.value is shared_default:
+            ps.value = self.to_array(obj, self.defaultvalue)
+        return ps.value
+
+    cdef check(self, EventDispatcher obj, value):
+        if Property.check(self, obj, value):
+            return True
+        if type(value) is not ObservableArray:
+            raise ValueError('%s.%s accept only ObservableArray' % (
+                obj.__class__.__name__,
+                self.name))
+
+    cdef to_array(self, EventDispatcher obj, value):
+        result = ObservableArray(self, obj, self.typecode)
+        try:
+            array_fill(result, value)
+        except TypeError:
+            raise ValueError('%s.%s accept only an iterable of numbers '
+                             'of type %r' % (obj.__class__.__name__,
+                                             self.name, self.typecode))
+        result.dirty = (0, len(result))
+        return result
+
+    cpdef set(self, EventDispatcher obj, value):
+        if value is not None:
+            value = self.to_array(obj, value)
+        Property.set(self, obj, value)
+
+
 cdef class ObjectProperty(Property):
     '''Property that represents a Python object.
 
@@ -952,7 +1376,7 @@ cdef class BoundedNumericProperty(Property):
 
         .. versionadded:: 1.1.0
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if value is None:
             ps.bnum_use_min = 0
         elif type(value) is float:
@@ -975,7 +1399,7 @@ cdef class BoundedNumericProperty(Property):
 
         .. versionadded:: 1.1.0
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if ps.bnum_use_min == 1:
             return ps.bnum_min
         elif ps.bnum_use_min == 2:
@@ -992,7 +1416,7 @@ cdef class BoundedNumericProperty(Property):
 
         .. versionadded:: 1.1.0
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if value is None:
             ps.bnum_use_max = 0
         elif type(value) is float:
@@ -1009,7 +1433,7 @@ cdef class BoundedNumericProperty(Property):
 
         .. versionadded:: 1.1.0
         '''
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if ps.bnum_use_max == 1:
             return ps.bnum_max
         if ps.bnum_use_max == 2:
@@ -1018,7 +1442,7 @@ cdef class BoundedNumericProperty(Property):
     cdef check(self, EventDispatcher obj, value):
         if Property.check(self, obj, value):
             return True
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if ps.bnum_use_min == 1:
             _min = ps.bnum_min
             if value < _min:
@@ -1103,7 +1527,7 @@ cdef class OptionProperty(Property):
     cdef check(self, EventDispatcher obj, value):
         if Property.check(self, obj, value):
             return True
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if value not in ps.options:
             raise ValueError('%s.%s is set to an invalid option %r. '
                              'Must be one of: %s' % (
@@ -1163,7 +1587,7 @@ cdef class ReferenceListProperty(Property):
 
     cpdef link(self, EventDispatcher obj, str name):
         Property.link(self, obj, name)
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         ps.value = ObservableReferenceList(self, obj, ps.value)
 
     cpdef link_deps(self, EventDispatcher obj, str name):
@@ -1173,7 +1597,7 @@ cdef class ReferenceListProperty(Property):
             prop.fast_bind(obj, self.trigger_change)
 
     cpdef trigger_change(self, EventDispatcher obj, value):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if ps.stop_event:
             return
         p = ps.properties
@@ -1197,7 +1621,7 @@ cdef class ReferenceListProperty(Property):
         return list(value)
 
     cdef check(self, EventDispatcher obj, value):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if len(value) != len(ps.properties):
             raise ValueError('%s.%s value length is immutable' % (
                 obj.__class__.__name__,
@@ -1206,7 +1630,7 @@ cdef class ReferenceListProperty(Property):
     cpdef set(self, EventDispatcher obj, _value):
         cdef int idx
         cdef list value
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         value = self.convert(obj, _value)
         if not self.force_dispatch and self.compare_value(ps.value, value):
             return False
@@ -1229,7 +1653,7 @@ cdef class ReferenceListProperty(Property):
         return True
 
     cpdef setitem(self, EventDispatcher obj, key, value):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         cdef bint res = False
 
         ps.stop_event = 1
@@ -1247,7 +1671,7 @@ cdef class ReferenceListProperty(Property):
             self.dispatch(obj)
 
     cpdef get(self, EventDispatcher obj):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         cdef tuple p = ps.properties
         try:
             ps.value.__setslice__(0, len(p),
@@ -1326,7 +1750,7 @@ cdef class AliasProperty(Property):
             oprop.fast_bind(obj, self.trigger_change)
 
     cpdef trigger_change(self, EventDispatcher obj, value):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         ps.alias_initial = 1
         dvalue = self.get(obj)
         if ps.value != dvalue:
@@ -1337,7 +1761,7 @@ cdef class AliasProperty(Property):
         return True
 
     cpdef get(self, EventDispatcher obj):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if self.use_cache:
             if ps.alias_initial:
                 ps.value = ps.getter(obj)
@@ -1346,7 +1770,7 @@ cdef class AliasProperty(Property):
         return ps.getter(obj)
 
     cpdef set(self, EventDispatcher obj, value):
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if ps.setter(obj, value):
             ps.value = self.get(obj)
             self.dispatch(obj)
@@ -1396,7 +1820,7 @@ cdef class VariableListProperty(Property):
 
     cpdef link(self, EventDispatcher obj, str name):
         Property.link(self, obj, name)
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         ps.value = ObservableList(self, obj, ps.value)
 
     cdef check(self, EventDispatcher obj, value):
@@ -1652,7 +2076,7 @@ cdef class ConfigParserProperty(Property):
             self.config.adddefaultsection(self.section)
             self.config.setdefault(self.section, self.key, self.defaultvalue)
 
-            ps = obj.__storage[self._name]
+            ps = get_storage(self, obj)
             ps.value = self._parse_str(self.config.get(self.section, self.key))
             # in case the value changed, save it
             self.config.set(self.section, self.key, ps.value)
@@ -1708,7 +2132,7 @@ cdef class ConfigParserProperty(Property):
         # Takes the a python object of the type used by this property
         # (see :attr:`val_type`), and saves it as a string in the config parser
         # (if available) and sets itself to this value.
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         cdef object orig_value = value
 
         value = self._parse_str(value)
@@ -1772,7 +2196,7 @@ cdef class ConfigParserProperty(Property):
         '''
         cdef EventDispatcher obj = self.obj()
         cdef object value
-        cdef PropertyStorage ps = obj.__storage[self._name]
+        cdef PropertyStorage ps = get_storage(self, obj)
         if self.config is config:
             return
 
@@ -121,7 +121,6 @@ The storage API emulates the container type for the synchronous API::
 
 from kivy.clock import Clock
 from kivy.event import EventDispatcher
-from functools import partial
 
 
 class AbstractStore(EventDispatcher):
@@ -400,4 +399,5 @@ class AbstractStore(EventDispatcher):
 
     def _schedule(self, cb, **kwargs):
         # XXX not entirely sure about the best value (0 or -1).
-        Clock.schedule_once(partial(cb, **kwargs), 0)
+        # the clock passes the delta time as first argument, drop it.
+        Clock.schedule_once(lambda dt: cb(**kwargs), 0)
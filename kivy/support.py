@@ -4,10 +4,51 @@ Support
 
 Activate other frameworks/toolkits inside the kivy event loop.
 
+Asyncio
+-------
+
+.. versionadded:: 1.9.0
+
+Kivy can share the main thread with an :mod:`asyncio` event loop in two ways:
+
+* :func:`install_asyncio_loop` lets Kivy own the main loop, and runs one
+  iteration of the asyncio loop before each frame, like
+  :func:`install_twisted_reactor` does for twisted.
+* :func:`asyncio_runTouchApp` lets asyncio own the main loop, and schedules
+  the Kivy frames as asyncio callbacks::
+
+    import asyncio
+    from kivy.support import asyncio_runTouchApp, async_sleep
+
+    async def blink(label):
+        while True:
+            label.text = 'on'
+            await async_sleep(.5)
+            label.text = 'off'
+            await async_sleep(.5)
+
+    loop = asyncio.get_event_loop()
+    label = Label()
+    loop.create_task(blink(label))
+    loop.run_until_complete(asyncio_runTouchApp(label))
+
+In both modes, :func:`async_sleep`, :func:`async_urlrequest`,
+:func:`async_load_image` and :func:`async_store` return asyncio futures that
+coroutines can wait for, instead of binding callbacks.
+
+.. note::
+    :class:`~kivy.network.urlrequest.UrlRequest` and
+    :class:`~kivy.loader.Loader` still do their blocking work in their own
+    threads, but the results are delivered to the coroutine in the main
+    thread, so the application code doesn't need to deal with threads.
+
 '''
 
 __all__ = ('install_gobject_iteration', 'install_twisted_reactor',
-           'uninstall_twisted_reactor', 'install_android')
+           'uninstall_twisted_reactor', 'install_android',
+           'install_asyncio_loop', 'uninstall_asyncio_loop',
+           'asyncio_runTouchApp', 'async_sleep', 'async_urlrequest',
+           'async_load_image', 'async_store')
 
 
 def install_gobject_iteration():
@@ -259,3 +300,366 @@ def uninstall_twisted_reactor():
     EventLoop.unbind(on_stop=_twisted_reactor_stopper)
 
     del twisted._kivy_twisted_reactor_installed
+
+
+# -----------------------------------------------------------------------------
+# Asyncio support
+# -----------------------------------------------------------------------------
+
+_asyncio_loop = None
+_asyncio_loop_iteration = None
+
+
+def install_asyncio_loop(loop=None):
+    '''Run one iteration of an asyncio event loop before each frame, so
+    that coroutines and Kivy can run in the same thread while Kivy owns the
+    main loop.
+
+    :Parameters:
+        `loop`: asyncio event loop, defaults to None
+            The loop to iterate. If None, the result of
+            :func:`asyncio.get_event_loop` is used.
+
+    Returns the installed loop.
+
+    .. versionadded:: 1.9.0
+    '''
+    import asyncio
+    from kivy.clock import Clock
+    from kivy.logger import Logger
+
+    global _asyncio_loop, _asyncio_loop_iteration
+
+    if loop is None:
+        loop = asyncio.get_event_loop()
+
+    # prevent installing more than once
+    if _asyncio_loop is not None:
+        if _asyncio_loop is not loop:
+            raise RuntimeError('Another asyncio loop is already installed')
+        return loop
+
+    # process all the callbacks ready at this frame, without waiting
+    def asyncio_iteration(*largs):
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+    Logger.info('Support: Install asyncio loop iteration')
+    _asyncio_loop = loop
+    _asyncio_loop_iteration = asyncio_iteration
+    Clock.schedule_interval(asyncio_iteration, 0)
+    return loop
+
+
+def uninstall_asyncio_loop():
+    '''Stop running the asyncio loop installed by
+    :func:`install_asyncio_loop`. The loop itself is not closed.
+
+    .. versionadded:: 1.9.0
+    '''
+    from kivy.clock import Clock
+
+    global _asyncio_loop, _asyncio_loop_iteration
+
+    if _asyncio_loop is None:
+        return
+    Clock.unschedule(_asyncio_loop_iteration)
+    _asyncio_loop = None
+    _asyncio_loop_iteration = None
+
+
+def asyncio_runTouchApp(widget=None, loop=None):
+    '''Asyncio version of :func:`~kivy.base.runTouchApp`: the application
+    is started in slave mode, and its frames are scheduled as callbacks of the
+    asyncio loop, which must then be run by the caller.
+
+    Returns a future that is resolved when the application stops, for use with
+    `loop.run_until_complete()`.
+
+    The clock doesn't sleep inside :meth:`~kivy.clock.ClockBase.tick` in this
+    mode: the `maxfps` limit and the idle mode (see :ref:`clock-idle`) are
+    implemented by delaying the next frame in the asyncio loop instead, so
+    that the coroutines keep running between frames. When an event is
+    scheduled or the clock is woken up (see
+    :meth:`~kivy.clock.ClockBase.wakeup`) during an idle delay, the next frame
+    is done right away.
+
+    .. versionadded:: 1.9.0
+    '''
+    import asyncio
+    from threading import current_thread
+    from kivy.base import EventLoop, ExceptionManager, runTouchApp, \
+        stopTouchApp
+    from kivy.clock import Clock
+
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    future = _create_future(loop)
+
+    max_fps = Clock._max_fps
+    idle_timeout = Clock.idle_timeout
+    Clock._max_fps = 0
+    Clock.idle_timeout = 0
+    thread = current_thread()
+    # the handle of the next frame while it's delayed by the idle mode
+    idle = {'handle': None}
+
+    def restore_clock():
+        Clock._max_fps = max_fps
+        Clock.idle_timeout = idle_timeout
+        Clock._wakeup_hook = None
+
+    def finish(exception=None):
+        restore_clock()
+        if future.done():
+            return
+        if exception is None:
+            future.set_result(None)
+        else:
+            future.set_exception(exception)
+
+    def fps_delay():
+        if max_fps > 0:
+            return max(0, 1. / max_fps - (Clock.time() - Clock._last_tick))
+        return 0
+
+    def idle_delay():
+        delay = 0
+        if idle_timeout > 0:
+            window = EventLoop.window
+            if not Clock._wake_event.is_set() and not (
+                    window and window.canvas.needs_redraw):
+                delay = Clock.get_next_event_timeout()
+                if delay is None or delay > idle_timeout:
+                    delay = idle_timeout
+            Clock._wake_event.clear()
+        return delay
+
+    def frame():
+        if future.done():
+            return
+        window = EventLoop.window
+        step = getattr(window, '_mainloop', EventLoop.idle)
+        try:
+            step()
+        except BaseException as inst:
+            # use exception manager first
+            r = ExceptionManager.handle_exception(inst)
+            if r == ExceptionManager.RAISE:
+                stopTouchApp()
+                finish(inst)
+                return
+
+        if EventLoop.quit or EventLoop.status != 'started':
+            EventLoop.exit()
+            finish()
+            return
+        delay = fps_delay()
+        wait = idle_delay()
+        if wait > delay:
+            idle['handle'] = loop.call_later(wait, frame)
+        else:
+            loop.call_later(delay, frame)
+
+    def wake_frame():
+        # do the frame delayed by the idle mode now, within the maxfps limit
+        handle = idle['handle']
+        if handle is not None:
+            idle['handle'] = None
+            handle.cancel()
+            loop.call_later(fps_delay(), frame)
+
+    def on_wakeup():
+        # the clock is woken up, or something is scheduled, possibly from
+        # another thread
+        if idle['handle'] is None:
+            return
+        if current_thread() is thread:
+            wake_frame()
+        else:
+            loop.call_soon_threadsafe(wake_frame)
+
+    def on_cancel(future):
+        if future.cancelled():
+            stopTouchApp()
+            restore_clock()
+
+    try:
+        runTouchApp(widget, slave=True)
+        if EventLoop.window:
+            EventLoop.window.dispatch('on_resize', *EventLoop.window.size)
+    except BaseException as inst:
+        finish(inst)
+        return future
+
+    future.add_done_callback(on_cancel)
+    if idle_timeout > 0:
+        Clock._wakeup_hook = on_wakeup
+    loop.call_soon(frame)
+    return future
+
+
+def _create_future(loop):
+    # loop.create_future() is missing before python 3.5.2, and the loop
+    # argument of Future() is gone since python 3.10
+    create_future = getattr(loop, 'create_future', None)
+    if create_future is not None:
+        return create_future()
+    import asyncio
+    return asyncio.Future(loop=loop)
+
+
+class _AsyncCallback(object):
+    # Resolve an asyncio future from Kivy callbacks. The Clock and UrlRequest
+    # only keep weak references to the callbacks, so the instance is kept
+    # alive by the future until it is done.
+
+    def __init__(self, loop=None):
+        import asyncio
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self.future = future = _create_future(loop)
+        future.add_done_callback(self.on_done)
+
+    def on_done(self, future):
+        pass
+
+    def set_result(self, result):
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def set_exception(self, exception):
+        if not self.future.done():
+            self.future.set_exception(exception)
+
+
+class _AsyncSleep(_AsyncCallback):
+
+    def __init__(self, timeout, loop=None):
+        from kivy.clock import Clock
+        super(_AsyncSleep, self).__init__(loop)
+        self.event = Clock.schedule_once(self.on_timeout, timeout)
+
+    def on_timeout(self, dt):
+        self.set_result(dt)
+
+    def on_done(self, future):
+        if future.cancelled():
+            self.event.cancel()
+
+
+def async_sleep(timeout, loop=None):
+    '''Return a future resolved with the elapsed time after `timeout`
+    seconds, as measured by the :class:`~kivy.clock.Clock`. The semantics of
+    `timeout` are the same as in :meth:`~kivy.clock.ClockBase.schedule_once`:
+    0 waits for the next frame, and -1 for the end of the current one.
+
+    .. versionadded:: 1.9.0
+    '''
+    return _AsyncSleep(timeout, loop).future
+
+
+class _AsyncUrlRequest(_AsyncCallback):
+
+    def __init__(self, url, loop=None, **kwargs):
+        from kivy.network.urlrequest import UrlRequest
+        super(_AsyncUrlRequest, self).__init__(loop)
+        for name in ('on_success', 'on_redirect', 'on_failure', 'on_error'):
+            if name in kwargs:
+                raise ValueError('%s is handled by the future' % name)
+        self.request = UrlRequest(
+            url, on_success=self.on_success, on_redirect=self.on_success,
+            on_failure=self.on_failure, on_error=self.on_error, **kwargs)
+
+    def on_success(self, request, result):
+        self.set_result(request)
+
+    def on_failure(self, request, result):
+        self.set_exception(IOError('Request to %r failed with status %r' % (
+            request.url, request.resp_status)))
+
+    def on_error(self, request, error):
+        if not isinstance(error, BaseException):
+            error = IOError(error)
+        self.set_exception(error)
+
+
+def async_urlrequest(url, loop=None, **kwargs):
+    '''Start a :class:`~kivy.network.urlrequest.UrlRequest` and return a
+    future resolved with the request when it succeeds. The result is then in
+    `request.result`. The future raises the error if the request fails, or an
+    :class:`IOError` if the server returns an error status.
+
+    The other keyword arguments are passed to
+    :class:`~kivy.network.urlrequest.UrlRequest`, except the `on_success`,
+    `on_redirect`, `on_failure` and `on_error` callbacks.
+
+    .. versionadded:: 1.9.0
+    '''
+    return _AsyncUrlRequest(url, loop, **kwargs).future
+
+
+class _AsyncLoadImage(_AsyncCallback):
+
+    def __init__(self, filename, loop=None, **kwargs):
+        from kivy.loader import Loader
+        super(_AsyncLoadImage, self).__init__(loop)
+        self.proxy = proxy = Loader.image(filename, **kwargs)
+        if proxy.loaded:
+            self.set_result(proxy)
+        else:
+            proxy.bind(on_load=self.on_load)
+
+    def on_load(self, proxy):
+        self.set_result(proxy)
+
+    def on_done(self, future):
+        self.proxy.unbind(on_load=self.on_load)
+
+
+def async_load_image(filename, loop=None, **kwargs):
+    '''Load an image with :meth:`Loader.image() <kivy.loader.LoaderBase.image>`
+    and return a future resolved with the
+    :class:`~kivy.loader.ProxyImage` once the image is loaded. The keyword
+    arguments are passed to :meth:`~kivy.loader.LoaderBase.image`.
+
+    .. versionadded:: 1.9.0
+    '''
+    return _AsyncLoadImage(filename, loop, **kwargs).future
+
+
+class _AsyncStore(_AsyncCallback):
+
+    def __init__(self, store, method, *args, **kwargs):
+        loop = kwargs.pop('loop', None)
+        super(_AsyncStore, self).__init__(loop)
+        self.entries = []
+        async_method = getattr(store, 'async_' + method)
+        if method == 'find':
+            async_method(self.on_find, *args, **kwargs)
+        else:
+            async_method(self.on_result, *args, **kwargs)
+
+    def on_result(self, store, *largs):
+        self.set_result(largs[-1] if largs else None)
+
+    def on_find(self, store, filters, key, entry):
+        if key is None:
+            self.set_result(self.entries)
+        else:
+            self.entries.append((key, entry))
+
+
+def async_store(store, method, *args, **kwargs):
+    '''Call the asynchronous version of a :mod:`~kivy.storage` method and
+    return a future resolved with its result. For example::
+
+        value = await async_store(store, 'get', 'tito')
+        await async_store(store, 'put', 'tito', age=28)
+
+    The `find` method is resolved with the list of `(key, entry)` found.
+    A `loop` keyword argument can be passed to select the asyncio loop.
+
+    .. versionadded:: 1.9.0
+    '''
+    return _AsyncStore(store, method, *args, **kwargs).future
@@ -0,0 +1,256 @@
+'''
+Cache tests
+===========
+'''
+
+import unittest
+
+
+class CacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.clock import Clock
+        self.last_tick = Clock._last_tick
+
+    def tearDown(self):
+        from kivy.cache import Cache
+        from kivy.clock import Clock
+        Clock._last_tick = self.last_tick
+        for category in ('test.limit', 'test.timeout', 'test.bytes',
+                         'test.disk'):
+            Cache._categories.pop(category, None)
+            Cache._objects.pop(category, None)
+            Cache._expiry.pop(category, None)
+            Cache._disks.pop(category, None)
+
+    def set_time(self, t):
+        from kivy.clock import Clock
+        Clock._last_tick = t
+
+    def test_limit(self):
+        from kivy.cache import Cache
+        Cache.register('test.limit', limit=3)
+        for i in range(10):
+            Cache.append('test.limit', i, str(i))
+        self.assertEqual(list(Cache._objects['test.limit']), [7, 8, 9])
+        self.assertEqual(Cache.get('test.limit', 0), None)
+        self.assertEqual(Cache.get('test.limit', 9), '9')
+
+    def test_lru(self):
+        from kivy.cache import Cache
+        Cache.register('test.limit', limit=3)
+        Cache.append('test.limit', 'a', 1)
+        Cache.append('test.limit', 'b', 2)
+        Cache.append('test.limit', 'c', 3)
+        # a is now the most recently used
+        self.assertEqual(Cache.get('test.limit', 'a'), 1)
+        Cache.append('test.limit', 'd', 4)
+        self.assertEqual(Cache.get('test.limit', 'b'), None)
+        self.assertEqual(Cache.get('test.limit', 'a'), 1)
+        # replacing an object doesn't evict anything
+        Cache.append('test.limit', 'a', 5)
+        self.assertEqual(sorted(Cache._objects['test.limit']), ['a', 'c', 'd'])
+        self.assertEqual(Cache.get('test.limit', 'a'), 5)
+
+    def test_timeout(self):
+        from kivy.cache import Cache
+        Cache.register('test.timeout', timeout=5)
+        self.set_time(100)
+        Cache.append('test.timeout', 'a', 1)
+        Cache.append('test.timeout', 'b', 2)
+        Cache.append('test.timeout', 'c', 3, timeout=20)
+        self.set_time(104)
+        self.assertEqual(Cache.get('test.timeout', 'a'), 1)
+        self.set_time(106)
+        Cache._purge_by_timeout(1)
+        self.assertEqual(sorted(Cache._objects['test.timeout']), ['a', 'c'])
+        self.set_time(110)
+        Cache._purge_by_timeout(1)
+        self.assertEqual(list(Cache._objects['test.timeout']), ['c'])
+        self.set_time(121)
+        Cache._purge_by_timeout(1)
+        self.assertEqual(list(Cache._objects['test.timeout']), [])
+        self.assertEqual(Cache._expiry['test.timeout'], [])
+
+    def test_timeout_replaced(self):
+        from kivy.cache import Cache
+        Cache.register('test.timeout', timeout=5)
+        self.set_time(100)
+        Cache.append('test.timeout', 'a', 1)
+        self.set_time(104)
+        Cache.append('test.timeout', 'a', 2)
+        self.set_time(106)
+        Cache._purge_by_timeout(1)
+        self.assertEqual(Cache.get('test.timeout', 'a'), 2)
+        Cache.remove('test.timeout', 'a')
+        self.set_time(120)
+        Cache._purge_by_timeout(1)
+        self.assertEqual(Cache._expiry['test.timeout'], [])
+
+    def test_max_bytes(self):
+        from kivy.cache import Cache
+        Cache.register('test.bytes', max_bytes=100, sizeof=len)
+        Cache.append('test.bytes', 'a', 'a' * 40)
+        Cache.append('test.bytes', 'b', 'b' * 40)
+        self.assertEqual(Cache.get_stats('test.bytes')['bytes'], 80)
+        Cache.get('test.bytes', 'a')
+        Cache.append('test.bytes', 'c', 'c' * 30)
+        self.assertEqual(sorted(Cache._objects['test.bytes']), ['a', 'c'])
+        self.assertEqual(Cache.get_stats('test.bytes')['bytes'], 70)
+        # too big to be cached at all
+        Cache.append('test.bytes', 'd', 'd' * 200)
+        self.assertEqual(Cache.get('test.bytes', 'd'), None)
+        Cache.remove('test.bytes', 'a')
+        self.assertEqual(Cache.get_stats('test.bytes')['bytes'], 30)
+        Cache.remove('test.bytes')
+        self.assertEqual(Cache.get_stats('test.bytes')['bytes'], 0)
+
+    def test_stats(self):
+        from kivy.cache import Cache
+        Cache.register('test.limit', limit=1, timeout=5)
+        self.set_time(100)
+        Cache.append('test.limit', 'a', 1)
+        Cache.get('test.limit', 'a')
+        Cache.get('test.limit', 'b')
+        Cache.append('test.limit', 'b', 2)
+        self.set_time(106)
+        Cache._purge_by_timeout(1)
+        stats = Cache.get_stats('test.limit')
+        self.assertEqual(stats['count'], 0)
+        self.assertEqual(stats['bytes'], 0)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['expirations'], 1)
+
+    def test_trim(self):
+        from kivy.cache import Cache
+        Cache.register('test.bytes', sizeof=len)
+        for key in 'abcd':
+            Cache.append('test.bytes', key, key * 10)
+        Cache.append('test.bytes', 'e', 'e' * 60)
+        Cache.get('test.bytes', 'a')
+        # 5 objects for 100 bytes, keep 2 objects and 50 bytes
+        self.assertEqual(Cache.trim('test.bytes', .5), 90)
+        self.assertEqual(list(Cache._objects['test.bytes']), ['a'])
+        self.assertEqual(Cache.trim('test.bytes', 0), 10)
+        self.assertEqual(len(Cache._objects['test.bytes']), 0)
+
+    def test_release_memory(self):
+        from kivy.cache import Cache
+        fractions = []
+
+        def handler(fraction):
+            fractions.append(fraction)
+            return 5
+
+        Cache.register('test.bytes', sizeof=len)
+        Cache.append('test.bytes', 'a', 'a' * 10)
+        Cache.register_memory_handler(handler)
+        try:
+            self.assertTrue(Cache.release_memory(0) >= 15)
+        finally:
+            Cache.unregister_memory_handler(handler)
+        self.assertEqual(fractions, [0])
+        self.assertEqual(len(Cache._objects['test.bytes']), 0)
+
+    def test_sizeof_imagedata(self):
+        from kivy.cache import Cache
+        from kivy.core.image import ImageData
+        imagedata = ImageData(4, 2, 'rgba', b'\x00' * 32)
+        self.assertEqual(Cache.sizeof(imagedata), 32)
+        imagedata.release_data()
+        self.assertEqual(Cache.sizeof(imagedata), 0)
+
+
+class CacheDiskTestCase(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        from kivy.cache import Cache
+        self.directory = tempfile.mkdtemp()
+        Cache.register('test.disk')
+
+    def tearDown(self):
+        import shutil
+        from kivy.cache import Cache
+        for category in ('test.disk', ):
+            Cache._categories.pop(category, None)
+            Cache._objects.pop(category, None)
+            Cache._expiry.pop(category, None)
+            Cache._disks.pop(category, None)
+        shutil.rmtree(self.directory)
+
+    def register_disk(self, **kwargs):
+        from os.path import join
+        from kivy.cache import Cache
+        Cache.register_disk('test.disk', directory=join(
+            self.directory, 'cache'), **kwargs)
+
+    def test_disk(self):
+        from kivy.cache import Cache
+        self.register_disk()
+        self.assertEqual(Cache.disk_get('test.disk', 'a'), None)
+        self.assertTrue(Cache.disk_append(
+            'test.disk', 'a', b'abcdef', meta={'size': 6}))
+        meta, data = Cache.disk_get('test.disk', 'a')
+        self.assertEqual(meta, {'size': 6})
+        self.assertEqual(bytes(data), b'abcdef')
+        stats = Cache.get_stats('test.disk')
+        self.assertEqual(stats['disk_hits'], 1)
+        self.assertEqual(stats['disk_misses'], 1)
+
+        # a new disk tier finds the files of the previous run
+        self.register_disk(compress=True)
+        meta, data = Cache.disk_get('test.disk', 'a')
+        self.assertEqual(bytes(data), b'abcdef')
+        Cache.disk_append('test.disk', 'b', b'x' * 1000)
+        meta, data = Cache.disk_get('test.disk', 'b')
+        self.assertEqual(bytes(data), b'x' * 1000)
+        Cache.disk_remove('test.disk', 'a')
+        self.assertEqual(Cache.disk_get('test.disk', 'a'), None)
+        Cache.disk_remove('test.disk')
+        self.assertEqual(Cache.disk_get('test.disk', 'b'), None)
+        self.assertEqual(Cache.get_stats('test.disk')['disk_bytes'], 0)
+
+    def test_disk_source(self):
+        from os.path import join
+        from kivy.cache import Cache
+        self.register_disk()
+        source = join(self.directory, 'source.txt')
+        with open(source, 'wb') as fd:
+            fd.write(b'source')
+        Cache.disk_append('test.disk', 'a', b'data', source=source)
+        self.assertEqual(bytes(Cache.disk_get(
+            'test.disk', 'a', source=source)[1]), b'data')
+        with open(source, 'wb') as fd:
+            fd.write(b'modified source')
+        self.assertEqual(Cache.disk_get('test.disk', 'a', source=source),
+                         None)
+
+    def test_disk_max_bytes(self):
+        from kivy.cache import Cache
+        self.register_disk(max_bytes=500)
+        Cache.disk_append('test.disk', 'a', b'a' * 100)
+        Cache.disk_append('test.disk', 'b', b'b' * 100)
+        Cache.disk_get('test.disk', 'a')
+        Cache.disk_append('test.disk', 'c', b'c' * 100)
+        self.assertNotEqual(Cache.disk_get('test.disk', 'a'), None)
+        self.assertEqual(Cache.disk_get('test.disk', 'b'), None)
+        self.assertNotEqual(Cache.disk_get('test.disk', 'c'), None)
+        self.assertFalse(Cache.disk_append('test.disk', 'd', b'd' * 600))
+        self.assertTrue(Cache.get_stats('test.disk')['disk_bytes'] <= 500)
+
+    def test_disk_corrupted(self):
+        from os.path import exists, join
+        from kivy.cache import Cache
+        self.register_disk(compress=True)
+        Cache.disk_append('test.disk', 'a', b'a' * 100)
+        disk = Cache._disks['test.disk']
+        path = join(disk.directory, disk.get_filename('a'))
+        with open(path, 'r+b') as fd:
+            fd.seek(-4, 2)
+            fd.write(b'\xff' * 4)
+        # the invalid file is a miss, and is removed
+        self.assertEqual(Cache.disk_get('test.disk', 'a'), None)
+        self.assertFalse(exists(path))
@@ -13,6 +13,10 @@ def callback(dt):
     counter += 1
 
 
+def job():
+    callback(0)
+
+
 class ClockTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -73,3 +77,417 @@ class ClockTestCase(unittest.TestCase):
         Clock.unschedule(callback)
         Clock.tick()
         self.assertEqual(counter, 0)
+
+
+class ClockBaseHeapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.clock import ClockBaseHeap
+        global counter
+        counter = 0
+        self.clock = ClockBaseHeap()
+
+    def test_schedule_once(self):
+        self.clock.schedule_once(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+
+    def test_schedule_once_twice(self):
+        self.clock.schedule_once(callback)
+        self.clock.schedule_once(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 2)
+
+    def test_schedule_once_draw_after(self):
+        self.clock.schedule_once(callback, 0)
+        self.clock.tick_draw()
+        self.assertEqual(counter, 0)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+
+    def test_schedule_once_draw_before(self):
+        self.clock.schedule_once(callback, -1)
+        self.clock.tick_draw()
+        self.assertEqual(counter, 1)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+
+    def test_schedule_interval(self):
+        self.clock.schedule_interval(callback, 0)
+        self.clock.tick()
+        self.clock.tick()
+        self.assertEqual(counter, 2)
+        self.clock.unschedule(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 2)
+
+    def test_schedule_future(self):
+        self.clock.schedule_once(callback, 5.)
+        self.clock.tick()
+        self.assertEqual(counter, 0)
+        self.clock._last_tick += 5.
+        self.clock._process_events()
+        self.assertEqual(counter, 1)
+
+    def test_change_timeout(self):
+        event = self.clock.schedule_once(callback, 5.)
+        self.clock.tick()
+        event.timeout = 0
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+
+        # to and from before the next frame
+        event = self.clock.schedule_once(callback, 5.)
+        event.timeout = -1
+        self.clock.tick_draw()
+        self.assertEqual(counter, 2)
+        event = self.clock.schedule_once(callback, -1)
+        event.timeout = 5.
+        self.clock.tick_draw()
+        self.assertEqual(counter, 2)
+        self.clock._last_tick += 5.
+        self.clock._process_events()
+        self.assertEqual(counter, 3)
+
+        # an interval slowed down by its callback is scheduled once
+        def slow_down(dt):
+            callback(dt)
+            event.timeout = 5.
+
+        event = self.clock.schedule_interval(slow_down, 0)
+        self.clock._process_events()
+        self.assertEqual(counter, 4)
+        self.assertEqual(len(self.clock._heap) - self.clock._heap_stale, 1)
+        self.clock._process_events()
+        self.assertEqual(counter, 4)
+        self.clock._last_tick += 5.
+        self.clock._process_events()
+        self.assertEqual(counter, 5)
+        event.cancel()
+        self.assertEqual(self.clock._events_before_frame, [])
+        self.assertEqual(self.clock.get_next_event_timeout(), None)
+
+    def test_unschedule(self):
+        self.clock.schedule_once(callback)
+        self.clock.unschedule(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 0)
+
+    def test_unschedule_after_tick(self):
+        self.clock.schedule_once(callback, 5.)
+        self.clock.tick()
+        self.clock.unschedule(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 0)
+
+    def test_unschedule_draw(self):
+        self.clock.schedule_once(callback, 0)
+        self.clock.tick_draw()
+        self.assertEqual(counter, 0)
+        self.clock.unschedule(callback)
+        self.clock.tick()
+        self.assertEqual(counter, 0)
+
+    def test_unschedule_not_all(self):
+        self.clock.schedule_once(callback)
+        self.clock.schedule_once(callback)
+        self.clock.unschedule(callback, all=False)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+
+    def test_trigger_cancel(self):
+        trigger = self.clock.create_trigger(callback)
+        for i in range(200):
+            trigger()
+            trigger.cancel()
+        trigger()
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+        self.assertEqual(len(self.clock._heap), 0)
+
+    def test_retrigger_in_callback(self):
+        def retrigger(dt):
+            callback(dt)
+            if counter < 3:
+                trigger()
+        trigger = self.clock.create_trigger(retrigger)
+        trigger()
+        for i in range(5):
+            self.clock.tick()
+        self.assertEqual(counter, 3)
+
+
+class ClockIdleTestCase(unittest.TestCase):
+
+    clock_class = 'ClockBase'
+
+    def setUp(self):
+        import kivy.clock
+        global counter
+        counter = 0
+        self.clock = getattr(kivy.clock, self.clock_class)()
+        self.clock._max_fps = 0
+
+    def test_next_event_timeout(self):
+        clock = self.clock
+        self.assertIsNone(clock.get_next_event_timeout())
+        clock.schedule_once(callback, 10)
+        self.assertTrue(9 < clock.get_next_event_timeout() <= 10)
+        clock.schedule_once(callback)
+        self.assertEqual(clock.get_next_event_timeout(), 0)
+        clock.unschedule(callback)
+        self.assertIsNone(clock.get_next_event_timeout())
+        clock.schedule_once(callback, -1)
+        self.assertEqual(clock.get_next_event_timeout(), 0)
+
+    def test_idle_sleep_until_event(self):
+        from time import time
+        clock = self.clock
+        clock.idle_timeout = 1.
+        clock.schedule_once(callback, .1)
+        start = time()
+        clock.tick()
+        self.assertTrue(time() - start < .5)
+        self.assertEqual(counter, 1)
+
+    def test_idle_wakeup(self):
+        from threading import Timer
+        from time import time
+        clock = self.clock
+        clock.idle_timeout = 1.
+        Timer(.1, clock.wakeup).start()
+        start = time()
+        clock.tick()
+        self.assertTrue(time() - start < .5)
+
+    def test_idle_wakeup_on_schedule(self):
+        from threading import Timer
+        from time import time
+        clock = self.clock
+        clock.idle_timeout = 1.
+        Timer(.1, clock.schedule_once, (callback, )).start()
+        start = time()
+        clock.tick()
+        self.assertTrue(time() - start < .5)
+        self.assertEqual(counter, 1)
+
+
+class ClockHeapIdleTestCase(ClockIdleTestCase):
+
+    clock_class = 'ClockBaseHeap'
+
+
+class ClockWorkTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.clock import ClockBase
+        global counter
+        counter = 0
+        self.clock = ClockBase()
+        self.clock._max_fps = 0
+
+    def test_jobs(self):
+        self.clock.schedule_work([job] * 3, on_complete=self.complete)
+        self.clock.tick()
+        self.assertEqual(counter, 3)
+        self.assertEqual(self.completed, 1)
+
+    def test_callable(self):
+        work = self.clock.schedule_work(job)
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+        self.assertTrue(work.is_done)
+
+    def test_budget(self):
+        self.clock.work_budget = 0
+        work = self.clock.schedule_work(self.gen(5))
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+        self.clock.tick()
+        self.assertEqual(counter, 2)
+        self.assertFalse(work.is_done)
+        for i in range(4):
+            self.clock.tick()
+        self.assertEqual(counter, 5)
+        self.assertTrue(work.is_done)
+
+    def test_priority(self):
+        order = []
+        self.clock.schedule_work(lambda: order.append('low'))
+        self.clock.schedule_work(lambda: order.append('high'), priority=1)
+        self.clock.schedule_work(lambda: order.append('low2'))
+        self.clock.tick()
+        self.assertEqual(order, ['high', 'low', 'low2'])
+
+    def test_cancel(self):
+        self.clock.work_budget = 0
+        work = self.clock.schedule_work(self.gen(5), on_complete=self.complete)
+        self.clock.tick()
+        work.cancel()
+        self.clock.tick()
+        self.assertEqual(counter, 1)
+        self.assertEqual(self.completed, 0)
+        self.assertEqual(self.clock._works, [])
+
+    def test_error(self):
+        def fail():
+            raise ValueError('step')
+
+        work = self.clock.schedule_work([job, fail, job],
+                                        on_complete=self.complete)
+        other = self.clock.schedule_work([job])
+        self.clock.tick()
+        self.assertEqual(counter, 2)
+        self.assertTrue(work.is_done)
+        self.assertTrue(isinstance(work.error, ValueError))
+        self.assertEqual(self.completed, 1)
+        self.assertTrue(other.is_done)
+        self.assertTrue(other.error is None)
+        self.assertEqual(self.clock._works, [])
+
+    completed = 0
+
+    def complete(self, work):
+        self.completed += 1
+
+    def gen(self, n):
+        for i in range(n):
+            callback(0)
+            yield
+
+
+class ClockProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.clock import ClockBase
+        global counter
+        counter = 0
+        self.clock = ClockBase()
+        self.clock._max_fps = 0
+
+    def test_disabled(self):
+        self.assertIsNone(self.clock.profiler)
+        self.assertIsNone(self.clock.stop_profiling())
+
+    def test_stats(self):
+        clock = self.clock
+        profiler = clock.start_profiling()
+        self.assertIs(clock.profiler, profiler)
+        clock.schedule_once(callback)
+        clock.schedule_once(callback, -1)
+        clock.tick_draw()
+        clock.tick()
+        self.assertIs(clock.stop_profiling(), profiler)
+        self.assertIsNone(clock.profiler)
+
+        stats = dict(((s['name'], s['category']), s)
+                     for s in profiler.get_stats())
+        cb_stats = stats[(__name__ + '.callback', 'callback')]
+        self.assertEqual(cb_stats['count'], 2)
+        self.assertEqual(sum(cb_stats['histogram']), 2)
+        self.assertEqual(stats[('tick_draw', 'clock')]['count'], 1)
+        self.assertEqual(stats[('before_frame_pass', 'clock')]['count'], 2)
+        self.assertEqual(stats[('process_events', 'clock')]['count'], 1)
+
+    def test_export_trace(self):
+        import json
+        import os
+        import tempfile
+        clock = self.clock
+        profiler = clock.start_profiling()
+        clock.schedule_once(callback)
+        clock.tick()
+        clock.stop_profiling()
+        fd, filename = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            profiler.export_trace(filename)
+            with open(filename) as fd:
+                events = json.load(fd)['traceEvents']
+        finally:
+            os.unlink(filename)
+        names = [ev['name'] for ev in events]
+        self.assertIn(__name__ + '.callback', names)
+        self.assertIn('process_events', names)
+        self.assertTrue(all(ev['ph'] == 'X' for ev in events))
+
+
+class ClockThreadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.clock import ClockBase
+        global counter
+        counter = 0
+        self.clock = ClockBase()
+        self.clock._max_fps = 0
+
+    def test_schedule_from_thread(self):
+        from threading import Thread
+        clock = self.clock
+        threads = [Thread(target=self.produce, args=(100, ))
+                   for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(clock.pending_thread_callbacks, 400)
+        clock.tick()
+        self.assertEqual(counter, 400)
+        self.assertEqual(clock.pending_thread_callbacks, 0)
+
+    def test_bounded(self):
+        clock = self.clock
+        clock.max_thread_callbacks = 2
+        self.assertTrue(clock.schedule_from_thread(callback))
+        self.assertTrue(clock.schedule_from_thread(callback))
+        self.assertFalse(clock.schedule_from_thread(callback))
+        # never blocks the kivy thread
+        self.assertFalse(clock.schedule_from_thread(callback, block=True))
+        clock.tick()
+        self.assertEqual(counter, 2)
+
+    def test_back_pressure(self):
+        from threading import Thread
+        clock = self.clock
+        clock.max_thread_callbacks = 10
+        thread = Thread(target=self.produce, args=(100, True))
+        thread.start()
+        while thread.is_alive() or clock.pending_thread_callbacks:
+            self.assertTrue(clock.pending_thread_callbacks <= 10)
+            clock.tick()
+        thread.join()
+        self.assertEqual(counter, 100)
+
+    def test_timeout(self):
+        from threading import Thread
+        clock = self.clock
+        clock.max_thread_callbacks = 1
+        clock.schedule_from_thread(callback)
+        result = []
+        thread = Thread(target=lambda: result.append(
+            clock.schedule_from_thread(callback, block=True, timeout=.05)))
+        thread.start()
+        thread.join()
+        self.assertEqual(result, [False])
+
+    def test_mainthread_bounded(self):
+        import kivy.clock
+        from kivy.clock import mainthread
+        clock = self.clock
+        clock.max_thread_callbacks = 1
+        clock.schedule_from_thread(callback)
+        default_clock = kivy.clock.Clock
+        kivy.clock.Clock = clock
+        try:
+            # the queue is full, the call is scheduled for the next frame
+            mainthread(callback)(0)
+        finally:
+            kivy.clock.Clock = default_clock
+        clock.tick()
+        self.assertEqual(counter, 2)
+
+    def produce(self, n, block=False):
+        for x in range(n):
+            self.clock.schedule_from_thread(callback, block=block)
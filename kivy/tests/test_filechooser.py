@@ -9,3 +9,24 @@ class FileChooserTestCase(GraphicUnitTest):
         r = self.render
         wid = FileChooserListView(path=expanduser('~'))
         r(wid, 2)
+
+    def test_small_directory_listed_in_one_frame(self):
+        from kivy.clock import Clock
+        from kivy.uix.filechooser import FileChooserListView
+        from os.path import basename, join
+        from shutil import rmtree
+        from tempfile import mkdtemp
+        names = ['a.txt', 'b.txt', 'c.txt']
+        path = mkdtemp()
+        try:
+            for name in names:
+                open(join(path, name), 'w').close()
+            wid = FileChooserListView(path=path)
+            # the entries of a small directory are created in the frame
+            # following the change of path, not over several frames
+            Clock.tick()
+            self.assertEqual(
+                sorted(x for x in map(basename, wid.files) if x in names),
+                names)
+        finally:
+            rmtree(path)
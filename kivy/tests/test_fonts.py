@@ -20,6 +20,15 @@ class FontTestCase(unittest.TestCase):
         lbl.refresh()
         self.assertNotEqual(lbl.get_extents(''), None)
 
+    def test_release_memory(self):
+        import os
+        from kivy.core.text import Label
+        lbl = Label(font_name=self.font_name)
+        lbl.refresh()
+        # the estimate counts at least the size of the closed font file
+        self.assertTrue(Label.release_memory(0) >=
+                        os.path.getsize(self.font_name))
+
     def tearDown(self):
         import os
         if os.path.exists(self.font_name):
@@ -18,3 +18,25 @@ class ImageTestCase(unittest.TestCase):
         i1 = self.cls(self.image, keep_data=True)
         if not i1._image._data[0].data:
             self.fail('Image has no data even with keep_data = True')
+
+
+class ImageDiskTestCase(unittest.TestCase):
+
+    def test_dump_restore(self):
+        from kivy.core.image import ImageData, ImageLoaderDisk
+        imagedata = ImageData(2, 2, 'rgba', b'\x01' * 16,
+                              flip_vertical=False)
+        imagedata.add_mipmap(1, 1, 1, b'\x02' * 4, 0)
+        meta, data = ImageLoaderDisk.dump([imagedata])
+        image = ImageLoaderDisk.restore('test.png', meta, memoryview(data))
+        self.assertEqual(len(image), 1)
+        restored = image[0]
+        self.assertEqual(restored.size, (2, 2))
+        self.assertEqual(restored.fmt, 'rgba')
+        self.assertFalse(restored.flip_vertical)
+        self.assertEqual(bytes(restored.data), b'\x01' * 16)
+        self.assertEqual(bytes(restored.get_mipmap(1)[2]), b'\x02' * 4)
+        # the texture upload needs bytes or a writable buffer, not a view of
+        # the read-only cache file
+        self.assertTrue(isinstance(restored.data, bytes))
+        self.assertTrue(isinstance(restored.get_mipmap(1)[2], bytes))
@@ -52,6 +52,38 @@ class TestClass3(BaseClass):
     obj = None
 
 
+def dispatcher_classes():
+    # the properties need kivy._event, imported only when a test needs it
+    from kivy.event import EventDispatcher
+    from kivy.properties import NumericProperty, StringProperty
+
+    class DispatcherBase(EventDispatcher):
+        a = NumericProperty(0)
+        b = NumericProperty(0)
+        text = StringProperty('')
+
+        def __init__(self, **kwargs):
+            kwargs.pop('__no_builder', None)
+            super(DispatcherBase, self).__init__(**kwargs)
+            self.children = []
+            self.parent = None
+            self.id = None
+            self.ids = {}
+            self.cls = []
+
+        def add_widget(self, widget):
+            self.children.append(widget)
+            widget.parent = self
+
+    class DispatcherRoot(DispatcherBase):
+        pass
+
+    class DispatcherChild(DispatcherBase):
+        pass
+
+    return DispatcherRoot, DispatcherChild
+
+
 class LangTestCase(unittest.TestCase):
 
     def import_builder(self):
@@ -226,3 +258,709 @@ class LangTestCase(unittest.TestCase):
         self.assertTrue('on_press' in wid.binded_func)
         wid.binded_func['on_press']()
         self.assertEquals(wid.a, 1)
+
+    def test_compiled_cache(self):
+        import shutil
+        import tempfile
+        from kivy.cache import Cache
+        from kivy.lang import Parser
+        content = '''
+#:set default_a 2
+<TestClass>:
+    obj: self.a + 1
+    a: default_a
+    on_press:
+        self.a = 3
+    TestClass2:
+        obj: root.a
+        canvas:
+            Color:
+                rgb: 1, 1, 1
+'''
+        previous = Cache._disks.get('kv.compiled')
+        directory = tempfile.mkdtemp()
+        try:
+            Cache.register_disk('kv.compiled', directory=directory)
+            parser = Parser(content=content)
+            disk = Cache._disks['kv.compiled']
+            self.assertEqual(disk.hits, 0)
+            compiled = Parser(content=content)
+            self.assertEqual(disk.hits, 1)
+        finally:
+            if previous is None:
+                Cache._disks.pop('kv.compiled', None)
+            else:
+                Cache._disks['kv.compiled'] = previous
+            shutil.rmtree(directory)
+
+        self.assertEqual(len(compiled.rules), 1)
+        self.assertEqual(compiled.directives, parser.directives)
+        self.assertEqual(compiled._dump_rule(compiled.rules[0][1]),
+                         parser._dump_rule(parser.rules[0][1]))
+        prop = compiled.rules[0][1].properties['obj']
+        self.assertEqual(prop.watched_keys, [['self', 'a']])
+
+    def test_match_index(self):
+        Builder = self.import_builder()
+        Builder.load_string('''
+<BaseClass>:
+    a: 1
+<TestClass>:
+    a: 2
+<.special>:
+    a: 3
+<#myid>:
+    a: 4
+''', filename='first.kv')
+
+        def names(wid):
+            return [rule.properties['a'].value for rule in Builder.match(wid)]
+
+        wid = TestClass()
+        self.assertEqual(names(wid), ['1', '2'])
+        wid2 = TestClass2()
+        wid2.cls = ['special']
+        wid2.id = 'MyId'
+        self.assertEqual(names(wid2), ['1', '3', '4'])
+
+        # a new rule only invalidates the matches of the classes it targets
+        cached = Builder.match(wid2)
+        Builder.load_string('''
+<-TestClass>:
+    a: 5
+''', filename='second.kv')
+        self.assertTrue(Builder.match(wid2) is cached)
+        self.assertEqual(names(wid), ['5'])
+
+        Builder.unload_file('second.kv')
+        self.assertEqual(names(wid), ['1', '2'])
+        Builder.unload_file('first.kv')
+        self.assertEqual(Builder.match(wid), [])
+        self.assertEqual(Builder.match(wid2), [])
+
+    def test_compiled_module(self):
+        from types import ModuleType
+        from kivy.factory import Factory
+        from kivy.tools.kvcompiler import compile_kv
+        content = '''
+<DispatcherRoot>:
+    text: str(self.a + self.b)
+    DispatcherChild:
+        id: child
+        a: root.b * 2
+        b: len(root.text) + sum([1, 2])
+        text: str(child.a) + str([x for x in (1, 2)])
+'''
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        Factory.register('DispatcherChild', cls=child_cls)
+        try:
+            module = ModuleType('dispatcher_kv')
+            exec(compile(compile_kv(content), '<kv>', 'exec'), module.__dict__)
+            interpreted = self.import_builder()
+            interpreted.load_string(content)
+            compiled = self.import_builder()
+            module.load(compiled)
+
+            rule = compiled.rules[0][1]
+            self.assertTrue(rule.properties['text'].binder is not None)
+            child = rule.children[0]
+            self.assertTrue(child.properties['a'].binder is not None)
+            # no binder for the comprehension or a.b.c
+            self.assertTrue(child.properties['text'].binder is None)
+
+            widgets = []
+            for builder in (interpreted, compiled):
+                wid = cls()
+                builder.apply(wid)
+                wid.b = 3
+                widgets.append(wid)
+
+            for wid in widgets:
+                child = wid.children[0]
+                self.assertEqual(child.a, 6)
+                self.assertEqual(child.b, len(wid.text) + 3)
+            a, b = widgets
+            self.assertEqual((a.a, a.b, a.text), (b.a, b.b, b.text))
+            self.assertEqual(a.children[0].text, b.children[0].text)
+        finally:
+            Factory.unregister('DispatcherRoot')
+            Factory.unregister('DispatcherChild')
+
+    def test_expression_closure(self):
+        from kivy.factory import Factory
+        from kivy.lang import global_idmap
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        Factory.register('DispatcherChild', cls=child_cls)
+        try:
+            Builder = self.import_builder()
+            Builder.load_string('''
+#:set closure_offset 10
+<DispatcherRoot>:
+    a: self.b + closure_offset
+    DispatcherChild:
+        id: child
+        a: max(root.a, root.b) + 1
+        text: str([x for x in (child.a, )])
+''')
+            rule = Builder.rules[0][1]
+            self.assertEqual(rule.properties['a'].get_closure()[1],
+                             ['closure_offset'])
+            child = rule.children[0]
+            self.assertEqual(child.properties['a'].get_closure()[1],
+                             ['max', 'root'])
+            self.assertTrue(child.properties['text'].get_closure() is None)
+
+            wid = cls()
+            Builder.apply(wid)
+            self.assertEqual(wid.a, 10)
+            self.assertEqual(wid.children[0].a, 11)
+            self.assertEqual(wid.children[0].text, '[11]')
+            wid.b = 5
+            self.assertEqual(wid.a, 15)
+            self.assertEqual(wid.children[0].a, 16)
+            self.assertEqual(wid.children[0].text, '[16]')
+        finally:
+            Factory.unregister('DispatcherRoot')
+            Factory.unregister('DispatcherChild')
+            global_idmap.pop('closure_offset', None)
+
+    def test_deferred_expressions(self):
+        from kivy.factory import Factory
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        Factory.register('DispatcherChild', cls=child_cls)
+        try:
+            Builder = self.import_builder()
+            Builder.deferred = True
+            Builder.load_string('''
+<DispatcherRoot>:
+    DispatcherChild:
+        a: root.a + root.b
+        b: self.a * 2
+''')
+            prop = Builder.rules[0][1].children[0].properties['a']
+            wid = cls()
+            Builder.apply(wid)
+            child = wid.children[0]
+            self.assertEqual((child.a, child.b), (0, 0))
+
+            count = prop.count
+            wid.a = 1
+            wid.b = 2
+            # not evaluated before the sync, and then only once
+            self.assertEqual((child.a, child.b), (0, 0))
+            Builder.sync()
+            self.assertEqual(prop.count, count + 1)
+            # the deferred calls scheduled by the sync are done in it
+            self.assertEqual((child.a, child.b), (3, 6))
+        finally:
+            Factory.unregister('DispatcherRoot')
+            Factory.unregister('DispatcherChild')
+
+    def test_deferred_expressions_loop(self):
+        from kivy.factory import Factory
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        try:
+            Builder = self.import_builder()
+            Builder.deferred = True
+            Builder.max_iteration = 5
+            Builder.load_string('''
+<DispatcherRoot>:
+    a: self.b + 1
+    b: self.a + 1
+''')
+            wid = cls()
+            Builder.apply(wid)
+            Builder.sync()
+            # the expressions trigger each other, the sync stops anyway
+            a = wid.a
+            wid.a += 1
+            Builder.sync()
+            self.assertTrue(a < wid.a < a + 20)
+            # the remaining calls are done in the next sync
+            a = wid.a
+            Builder.sync()
+            self.assertTrue(wid.a > a)
+        finally:
+            Factory.unregister('DispatcherRoot')
+
+    def test_rebind_changed_segment(self):
+        from kivy.event import EventDispatcher
+        from kivy.factory import Factory
+        from kivy.lang import _handlers
+        from kivy.properties import NumericProperty, ObjectProperty
+        cls, child_cls = dispatcher_classes()
+
+        class Leaf(EventDispatcher):
+            a = NumericProperty(0)
+
+        class Node(EventDispatcher):
+            leaf = ObjectProperty(None, rebind=True, allownone=True)
+
+        class Holder(cls):
+            node = ObjectProperty(None, rebind=True, allownone=True)
+
+        Factory.register('Holder', cls=Holder)
+        try:
+            Builder = self.import_builder()
+            Builder.load_string('''
+<Holder>:
+    a: self.node.leaf.a if self.node and self.node.leaf else -1
+''')
+            leaf = Leaf(a=1)
+            wid = Holder(node=Node(leaf=leaf))
+            Builder.apply(wid)
+            self.assertEqual(wid.a, 1)
+            # the bindings of self.node.leaf.a
+            bound = [x for x in _handlers[wid.uid] if len(x) == 3][0]
+            leaf_binding = bound[-1]
+            self.assertTrue(leaf_binding[0] is leaf)
+
+            # a new node with the same leaf: the leaf binding is kept
+            wid.node = Node(leaf=leaf)
+            self.assertTrue(bound[-1] is leaf_binding)
+            leaf.a = 2
+            self.assertEqual(wid.a, 2)
+            self.assertEqual(len(leaf.get_property_observers('a')), 1)
+
+            # a new leaf is bound, and the old one unbound
+            leaf2 = Leaf(a=3)
+            wid.node.leaf = leaf2
+            self.assertEqual(wid.a, 3)
+            self.assertTrue(bound[-1][0] is leaf2)
+            self.assertEqual(len(leaf.get_property_observers('a')), 0)
+            wid.node = None
+            self.assertEqual(wid.a, -1)
+            self.assertEqual(len(leaf2.get_property_observers('a')), 0)
+        finally:
+            Factory.unregister('Holder')
+
+    def test_profiling(self):
+        import json
+        from kivy.factory import Factory
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        Factory.register('DispatcherChild', cls=child_cls)
+        try:
+            Builder = self.import_builder()
+            Builder.load_string('''
+<DispatcherRoot>:
+    a: self.b + 1
+    DispatcherChild:
+        text: str(root.a * 2)
+        on_b: root.text = str(args[1])
+''')
+            Builder.start_profiling()
+            try:
+                wid = cls()
+                Builder.apply(wid)
+                wid.b = 1
+                wid.children[0].b = 2
+            finally:
+                Builder.stop_profiling()
+            # not recorded anymore
+            wid.b = 3
+
+            stats = Builder.get_stats(sort='count')
+            by_name = dict(((x['kind'], x['name']), x) for x in stats)
+            rule = by_name[('rule', '<DispatcherRoot>')]
+            self.assertEqual(rule['count'], 1)
+            self.assertEqual(rule['line'], 2)
+            # root a, child text and on_b
+            self.assertEqual(rule['handlers'], 3)
+            self.assertEqual(by_name[('rule', 'DispatcherChild')]['count'], 1)
+            prop = by_name[('property', 'a')]
+            self.assertEqual(prop['value'], 'self.b + 1')
+            self.assertEqual(prop['count'], 2)
+            self.assertEqual(prop['handlers'], 1)
+            self.assertTrue(prop['total_time'] >= prop['time'] >= 0)
+            self.assertEqual(by_name[('handler', 'on_b')]['count'], 1)
+            self.assertEqual(
+                [x['count'] for x in stats],
+                sorted([x['count'] for x in stats], reverse=True))
+
+            self.assertEqual(json.loads(Builder.dump_stats(format='json')),
+                             Builder.get_stats())
+            report = Builder.dump_stats(limit=2).splitlines()
+            self.assertEqual(len(report), 3)
+            self.assertRaises(ValueError, Builder.get_stats, sort='name')
+        finally:
+            Factory.unregister('DispatcherRoot')
+            Factory.unregister('DispatcherChild')
+
+    def test_canvas_recipe(self):
+        import kivy.lang
+        from kivy.event import EventDispatcher
+        from kivy.factory import Factory
+        from kivy.properties import ListProperty, NumericProperty
+        cls = dispatcher_classes()[0]
+
+        class Canvas(object):
+            def __init__(self):
+                self.before = self.after = self
+                self.cleared = 0
+
+            def __enter__(self):
+                pass
+
+            def __exit__(self, *largs):
+                pass
+
+            def clear(self):
+                self.cleared += 1
+
+        class Instruction(EventDispatcher):
+            created = []
+
+            def __init__(self, **kwargs):
+                super(Instruction, self).__init__(**kwargs)
+                self.created.append(self)
+
+        class Shape(Instruction):
+            pos = ListProperty([0, 0])
+            width = NumericProperty(0)
+
+        class Shape2(Shape):
+            pass
+
+        class Painted(cls):
+            def __init__(self, **kwargs):
+                self.canvas = Canvas()
+                super(Painted, self).__init__(**kwargs)
+
+        previous = kivy.lang.Instruction
+        kivy.lang.Instruction = Instruction
+        Factory.register('Painted', cls=Painted)
+        Factory.register('RecipeShape', cls=Shape)
+        try:
+            Builder = self.import_builder()
+            Builder.load_string('''
+<Painted>:
+    canvas:
+        Clear
+        RecipeShape:
+            pos: 1, 2
+            width: self.a * 2
+''')
+            rule = Builder.match(Painted())[0]
+            self.assertTrue(rule.canvas_root.recipe is None)
+            wids = [Painted(a=i) for i in range(3)]
+            Builder.apply(wids[0])
+            recipe = rule.canvas_root.recipe
+            self.assertTrue(recipe is not None)
+            Instruction.created[:] = []
+            for wid in wids:
+                Builder.apply(wid)
+            Builder.sync()
+            # the recipe is built once for all the widgets
+            self.assertTrue(rule.canvas_root.recipe is recipe)
+            self.assertEqual([x.width for x in Instruction.created],
+                             [0, 2, 4])
+            self.assertEqual([x.pos for x in Instruction.created],
+                             [[1, 2]] * 3)
+            self.assertEqual(wids[1].canvas.cleared, 1)
+            wids[1].a = 5
+            Builder.sync()
+            self.assertEqual(Instruction.created[1].width, 10)
+
+            # registering the class again updates the recipe
+            Factory.unregister('RecipeShape')
+            Factory.register('RecipeShape', cls=Shape2)
+            Instruction.created[:] = []
+            wid = Painted(a=1)
+            Builder.apply(wid)
+            self.assertTrue(rule.canvas_root.recipe is not recipe)
+            self.assertTrue(type(Instruction.created[0]) is Shape2)
+            self.assertEqual(Instruction.created[0].width, 2)
+        finally:
+            kivy.lang.Instruction = previous
+            Factory.unregister('Painted')
+            Factory.unregister('RecipeShape')
+
+    def test_lazy_loading(self):
+        import os
+        import shutil
+        import tempfile
+        from kivy.factory import Factory
+        directory = tempfile.mkdtemp()
+
+        def write(name, content):
+            filename = os.path.join(directory, name)
+            with open(filename, 'w') as fd:
+                fd.write(content)
+            return filename
+
+        lazy = write('lazy.kv', '''
+<TestClass>:
+    obj: 'lazy'
+    cls: ['lazy']
+
+<LazyDynamic@TestClass3>:
+    obj: 'dynamic'
+
+[LazyTemplate@TestClass3]:
+    obj: ctx.value
+''')
+        other = write('other.kv', '''
+<TestClass3>:
+    obj: 'other'
+''')
+        eager = write('eager.kv', '''
+<TestClass>:
+    obj: 'eager'
+''')
+        unloaded = write('unloaded.kv', '''
+<TestClass2>:
+    obj: 'unloaded'
+''')
+        with_root = write('root.kv', '''
+<TestClass2>:
+    obj: 'root'
+TestClass3:
+''')
+        try:
+            Builder = self.import_builder()
+            Builder.load_file(lazy, lazy=True)
+            Builder.load_file(other, lazy=True)
+            Builder.load_file(eager)
+            Builder.load_file(unloaded, lazy=True)
+            self.assertEqual(len(Builder.rules), 1)
+            self.assertTrue(Factory.get('LazyDynamic') is not None)
+
+            # the rules of the lazy file come before the ones loaded after
+            wid = TestClass()
+            Builder.apply(wid)
+            self.assertEqual(wid.obj, 'eager')
+            self.assertEqual(wid.cls, ['lazy'])
+            self.assertEqual(len(Builder.rules), 3)
+            self.assertEqual(Builder.rules[0][1].ctx.filename, lazy)
+            self.assertTrue(lazy in Builder.files)
+
+            # still not needed
+            self.assertTrue(other in Builder._lazy_files)
+            wid = Factory.LazyDynamic()
+            Builder.apply(wid)
+            self.assertTrue(other not in Builder._lazy_files)
+            # other.kv was loaded before eager.kv
+            self.assertEqual([x[1].ctx.filename for x in Builder.rules],
+                             [lazy, lazy, other, eager])
+            # as if loaded right away, <TestClass3> is applied last
+            self.assertEqual(wid.obj, 'other')
+            wid = Builder.template('LazyTemplate', value='template')
+            self.assertEqual(wid.obj, 'template')
+
+            Builder.unload_file(unloaded)
+            self.assertEqual(Builder._lazy_files, {})
+            self.assertEqual(Builder._lazy_names, {})
+            wid = TestClass2()
+            Builder.apply(wid)
+            self.assertEqual(wid.obj, None)
+
+            # loaded right away
+            self.assertRaises(Exception, Builder.load_file, with_root,
+                              lazy=True)
+        finally:
+            Factory.unregister('LazyDynamic', 'LazyTemplate')
+            shutil.rmtree(directory)
+
+    def test_reload(self):
+        from kivy.factory import Factory
+        from kivy.lang import _handlers
+        cls, child_cls = dispatcher_classes()
+        Factory.register('DispatcherRoot', cls=cls)
+        Factory.register('DispatcherChild', cls=child_cls)
+        content = '''
+<DispatcherRoot>:
+    a: self.b + 1
+    text: 'one'
+    on_b: self.text = 'b{}'.format(args[1])
+    DispatcherChild:
+        id: child
+        a: root.a * 2
+'''
+        try:
+            Builder = self.import_builder()
+            Builder.live_reload = True
+            Builder.load_string(content, filename='reload.kv')
+            wid = cls()
+            Builder.apply(wid)
+            child = wid.children[0]
+            wid.b = 1
+            self.assertEqual((wid.a, wid.text, child.a), (2, 'b1', 4))
+            bindings = len(_handlers[wid.uid])
+
+            # same tree, changed expressions and handler
+            changed = content.replace('self.b + 1', 'self.b + 10')
+            changed = changed.replace("'b{}'", "'c{}'")
+            changed = changed.replace('root.a * 2', 'root.a * 3')
+            self.assertTrue(Builder.reload_string(changed,
+                                                  filename='reload.kv'))
+            self.assertEqual((wid.a, child.a), (11, 33))
+            wid.b = 2
+            self.assertEqual((wid.a, wid.text, child.a), (12, 'c2', 36))
+            self.assertEqual(len(_handlers[wid.uid]), bindings)
+            self.assertEqual(len(Builder.rules), 1)
+
+            # a removed property is not bound anymore
+            self.assertTrue(Builder.reload_string(content.replace(
+                '    a: self.b + 1\n', ''), filename='reload.kv'))
+            wid.b = 3
+            self.assertEqual(wid.a, 12)
+            self.assertEqual(child.a, 24)
+
+            # a new child can't be added to the existing widgets
+            self.assertFalse(Builder.reload_string(
+                content + '    DispatcherChild:\n', filename='reload.kv'))
+            self.assertEqual(len(wid.children), 1)
+            wid = cls()
+            Builder.apply(wid)
+            self.assertEqual(len(wid.children), 2)
+        finally:
+            Factory.unregister('DispatcherRoot')
+            Factory.unregister('DispatcherChild')
+
+    def test_reload_canvas(self):
+        import kivy.lang
+        from kivy.event import EventDispatcher
+        from kivy.factory import Factory
+        from kivy.properties import NumericProperty
+        cls = dispatcher_classes()[0]
+        active = []
+
+        class Canvas(object):
+            def __init__(self):
+                self.children = []
+
+            def __enter__(self):
+                active.append(self)
+
+            def __exit__(self, *largs):
+                active.pop()
+
+            def add(self, instr):
+                self.children.append(instr)
+
+            def remove(self, instr):
+                self.children.remove(instr)
+
+            def clear(self):
+                del self.children[:]
+
+        class Instruction(EventDispatcher):
+            def __init__(self, **kwargs):
+                super(Instruction, self).__init__(**kwargs)
+                if active:
+                    active[-1].add(self)
+
+        class InstructionGroup(Instruction, Canvas):
+            def __init__(self, **kwargs):
+                Canvas.__init__(self)
+                super(InstructionGroup, self).__init__(**kwargs)
+
+        class ReloadShape(Instruction):
+            width = NumericProperty(0)
+
+        class Painted(cls):
+            def __init__(self, **kwargs):
+                self.canvas = Canvas()
+                self.canvas.before = Canvas()
+                self.canvas.after = Canvas()
+                super(Painted, self).__init__(**kwargs)
+
+        content = '''
+<Painted>:
+    canvas:
+        ReloadShape:
+            width: self.a
+        ReloadShape:
+            width: 1
+'''
+        previous = kivy.lang.Instruction
+        classes = dict((x, Factory.classes[x])
+                       for x in ('Canvas', 'InstructionGroup'))
+        kivy.lang.Instruction = Instruction
+        Factory.classes['Canvas'] = dict(classes['Canvas'], cls=Canvas)
+        Factory.classes['InstructionGroup'] = dict(
+            classes['InstructionGroup'], cls=InstructionGroup)
+        Factory.register('Painted', cls=Painted)
+        Factory.register('ReloadShape', cls=ReloadShape)
+        try:
+            Builder = self.import_builder()
+            Builder.live_reload = True
+            Builder.load_string(content, filename='canvas.kv')
+            wid = Painted(a=2)
+            Builder.apply(wid)
+            group, = wid.canvas.children
+            first, second = group.children
+            self.assertEqual((first.width, second.width), (2, 1))
+
+            self.assertTrue(Builder.reload_string(content.replace(
+                'width: self.a', 'width: self.a * 10'), filename='canvas.kv'))
+            Builder.sync()
+            self.assertEqual(wid.canvas.children, [group])
+            new, second = group.children
+            self.assertTrue(new is not first)
+            self.assertEqual(new.width, 20)
+            wid.a = 3
+            Builder.sync()
+            self.assertEqual((first.width, new.width), (2, 30))
+
+            # a canvas can't be added to the existing widgets
+            self.assertFalse(Builder.reload_string(
+                content + '    canvas.after:\n        ReloadShape:\n',
+                filename='canvas.kv'))
+            self.assertEqual(wid.canvas.after.children, [])
+        finally:
+            kivy.lang.Instruction = previous
+            Factory.classes.update(classes)
+            Factory.unregister('Painted')
+            Factory.unregister('ReloadShape')
+
+    def test_load_files(self):
+        import os
+        import shutil
+        import tempfile
+        from kivy.cache import Cache
+        from kivy.lang import ParserException
+        directory = tempfile.mkdtemp()
+        previous = Cache._disks.pop('kv.compiled', None)
+        Cache.register_disk('kv.compiled', directory=directory)
+        filenames = []
+        for i in range(4):
+            filename = os.path.join(directory, 'file%d.kv' % i)
+            with open(filename, 'w') as fd:
+                fd.write('#:set load_files_%d %d\n<TestClass>:\n'
+                         '    obj: load_files_%d + self.uid\n' % (i, i, i))
+            filenames.append(filename)
+        try:
+            Builder = self.import_builder()
+            self.assertEqual(Builder.load_files(filenames, processes=2),
+                             [None] * 4)
+            self.assertEqual([x[1].ctx.filename for x in Builder.rules],
+                             filenames)
+            wid = TestClass()
+            Builder.apply(wid)
+            self.assertEqual(wid.obj, 3 + wid.uid)
+
+            # the results were stored in the cache by this process
+            disk = Cache._disks['kv.compiled']
+            hits = disk.hits
+            Builder = self.import_builder()
+            Builder.load_files(filenames, processes=2)
+            self.assertEqual(disk.hits, hits + 4)
+            self.assertEqual(len(Builder.rules), 4)
+
+            # the errors are raised as with load_file()
+            with open(filenames[1], 'w') as fd:
+                fd.write('<TestClass>:\n    obj 1\n')
+            Builder = self.import_builder()
+            self.assertRaises(ParserException, Builder.load_files,
+                              filenames, processes=2)
+        finally:
+            Cache._disks.pop('kv.compiled', None)
+            if previous is not None:
+                Cache._disks['kv.compiled'] = previous
+            shutil.rmtree(directory)
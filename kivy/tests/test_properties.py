@@ -518,3 +518,264 @@ class PropertiesTestCase(unittest.TestCase):
         self.assertEqual(dict_rebind.text, 'Unset')
         self.assertEqual(dict_false.text, 'Unset')
         self.assertEqual(alias_rebind.text, 'Unset')
+
+    def test_batch_dispatch(self):
+        from kivy.properties import (NumericProperty, ReferenceListProperty,
+                                     AliasProperty)
+
+        class Rect(EventDispatcher):
+            x = NumericProperty(0)
+            y = NumericProperty(0)
+            width = NumericProperty(1)
+            pos = ReferenceListProperty(x, y)
+            right = AliasProperty(lambda self: self.x + self.width, None,
+                                  bind=('x', 'width'))
+
+        calls = []
+
+        def observe(name, obj, value):
+            calls.append((name, value if name != 'pos' else list(value)))
+
+        rect = Rect()
+        for name in ('x', 'y', 'width', 'pos', 'right'):
+            rect.fast_bind(name, observe, name)
+
+        with rect.batch_dispatch():
+            rect.x = 1
+            rect.x = 2
+            rect.y = 3
+            with rect.batch_dispatch():
+                rect.width = 4
+            self.assertEqual(calls, [])
+            self.assertEqual(rect.pos, [2, 3])
+            self.assertEqual(rect.right, 6)
+        self.assertEqual(sorted(calls), sorted([
+            ('x', 2), ('y', 3), ('width', 4), ('pos', [2, 3]),
+            ('right', 6)]))
+        self.assertEqual([x[0] for x in calls[:3]], ['x', 'y', 'width'])
+
+        # unchanged values are not dispatched, and without a batch the
+        # dependent properties are dispatched for every change
+        del calls[:]
+        rect.set_properties(x=2, y=5, width=4)
+        self.assertEqual(calls, [('y', 5), ('pos', [2, 5])])
+        del calls[:]
+        rect.x = 0
+        rect.y = 0
+        self.assertEqual(len(calls), 5)
+
+    def test_deferred_dispatch(self):
+        from kivy.clock import Clock
+        from kivy.properties import NumericProperty, ListProperty
+
+        class Sensor(EventDispatcher):
+            value = NumericProperty(0, deferred=True)
+            values = ListProperty([], deferred=True)
+            immediate = NumericProperty(0)
+
+        calls = []
+
+        def observe(name, obj, value):
+            calls.append((name, value))
+
+        sensors = Sensor(), Sensor()
+        for sensor in sensors:
+            for name in ('value', 'values', 'immediate'):
+                sensor.fast_bind(name, observe, name)
+
+        for i in range(1, 10):
+            sensors[0].value = i
+            sensors[1].value = i * 2
+            sensors[0].values.append(i)
+            self.assertEqual(sensors[0].value, i)
+        sensors[0].immediate = 1
+        self.assertEqual(calls, [('immediate', 1)])
+
+        del calls[:]
+        Clock.tick_draw()
+        self.assertEqual(calls, [
+            ('value', 9), ('value', 18), ('values', list(range(1, 10)))])
+
+        # observers changing deferred properties are dispatched in the same
+        # frame
+        sensors[0].fast_bind('value', lambda obj, value: setattr(
+            sensors[1], 'value', value + 1))
+        del calls[:]
+        sensors[0].value = 5
+        Clock.tick_draw()
+        self.assertEqual(calls, [('value', 5), ('value', 6)])
+        Clock.tick_draw()
+        self.assertEqual(calls, [('value', 5), ('value', 6)])
+
+    def test_dispatch_profiling(self):
+        from kivy.event import (start_dispatch_profiling,
+                                stop_dispatch_profiling)
+        from kivy.properties import NumericProperty
+
+        class Chatty(EventDispatcher):
+            __events__ = ('on_ping', )
+            value = NumericProperty(0)
+
+            def on_ping(self):
+                pass
+
+        def on_value(obj, value):
+            pass
+
+        def on_ping(obj):
+            pass
+
+        chatty = Chatty()
+        chatty.bind(value=on_value)
+        chatty.fast_bind('value', on_value)
+        chatty.bind(on_ping=on_ping)
+
+        profiler = start_dispatch_profiling()
+        try:
+            self.assertIs(start_dispatch_profiling(), profiler)
+            for i in range(5):
+                chatty.value = i + 1
+            chatty.dispatch('on_ping')
+        finally:
+            self.assertIs(stop_dispatch_profiling(), profiler)
+        chatty.value = 0
+        self.assertIsNone(stop_dispatch_profiling())
+
+        stats = dict(((x['cls'], x['name']), x) for x in profiler.get_stats())
+        self.assertEqual(stats['Chatty', 'value']['dispatches'], 5)
+        self.assertEqual(stats['Chatty', 'value']['calls'], 10)
+        self.assertEqual(stats['Chatty', 'on_ping']['dispatches'], 1)
+        self.assertEqual(stats['Chatty', 'on_ping']['calls'], 1)
+
+        observers = profiler.get_top_observers(2)
+        self.assertEqual(len(observers), 2)
+        self.assertEqual(
+            sorted((x['observer'].split('.')[-1], x['name'], x['calls'])
+                   for x in profiler.get_top_observers()),
+            [('on_ping', 'on_ping', 1), ('on_value', 'value', 10)])
+        profiler.print_stats()
+
+    def test_compact_storage(self):
+        from kivy.properties import (NumericProperty, ListProperty,
+                                     DictProperty, StringProperty)
+
+        class Base(EventDispatcher):
+            value = NumericProperty(0)
+            items = ListProperty([1, 2])
+            mapping = DictProperty({'a': 1})
+
+        class Mixin(object):
+            label = StringProperty('mixin')
+
+        class Child(Mixin, Base):
+            extra = NumericProperty(1)
+
+        class Other(Mixin, EventDispatcher):
+            pass
+
+        base, child, other = Base(), Child(), Other()
+        self.assertEqual(base.get_property_observers('value'), [])
+
+        # the default values are not shared once read or written
+        base.items.append(3)
+        child.mapping['b'] = 2
+        self.assertEqual(base.items, [1, 2, 3])
+        self.assertEqual(child.items, [1, 2])
+        self.assertEqual(base.mapping, {'a': 1})
+        self.assertEqual(child.mapping, {'a': 1, 'b': 2})
+        self.assertEqual(Base.items.defaultvalue, [1, 2])
+        self.assertEqual(Base.mapping.defaultvalue, {'a': 1})
+
+        # the properties are found in all the classes using them
+        calls = []
+        for obj in (base, child, other):
+            for name in obj.properties():
+                obj.fast_bind(name, lambda obj, value, name=name: calls.append(
+                    (obj.__class__.__name__, name)))
+        base.value = 1
+        child.value = 2
+        child.extra = 3
+        child.label = 'child'
+        other.label = 'other'
+        child.items = [1, 2]
+        child.items = [1]
+        self.assertEqual(calls, [
+            ('Base', 'value'), ('Child', 'value'), ('Child', 'extra'),
+            ('Child', 'label'), ('Other', 'label'), ('Child', 'items')])
+        self.assertEqual(
+            (base.value, child.value, child.label, other.label),
+            (1, 2, 'child', 'other'))
+        self.assertEqual(child.properties(), dict(
+            value=Base.value, items=Base.items, mapping=Base.mapping,
+            label=Mixin.label, extra=Child.extra))
+
+        # a forced dispatch passes the value of the instance
+        received = []
+        other = Base()
+        other.fast_bind('items', lambda obj, value: received.append(value))
+        other.property('items').dispatch(other)
+        self.assertIs(received[0], other.items)
+
+    def test_array_property(self):
+        from array import array
+        from kivy.properties import ArrayProperty, ObservableArray
+
+        class Plot(EventDispatcher):
+            points = ArrayProperty([0, 1, 2, 3])
+            indices = ArrayProperty(typecode='H')
+
+        plot = Plot()
+        calls = []
+        plot.fast_bind('points', lambda obj, value: calls.append(len(value)))
+        points = plot.points
+        self.assertIs(type(points), ObservableArray)
+        self.assertEqual(points.typecode, 'f')
+        self.assertEqual(points.tolist(), [0, 1, 2, 3])
+        self.assertEqual(points.pop_dirty(), (0, 4))
+        self.assertEqual(points.pop_dirty(), None)
+
+        # a slice assignment dispatches once, and reports the changed range
+        points[1:3] = [10, 20]
+        self.assertEqual(calls, [4])
+        self.assertEqual(points.tolist(), [0, 10, 20, 3])
+        points[-1] = 30
+        self.assertEqual(points.pop_dirty(), (1, 4))
+        points.extend(range(4))
+        self.assertEqual(points.pop_dirty(), (4, 8))
+        del points[:2]
+        self.assertEqual(points.pop_dirty(), (0, 6))
+        self.assertEqual(calls, [4, 4, 8, 6])
+
+        # the changes of nothing are not dispatched
+        del points[10:20]
+        points[2:2] = []
+        points.extend([])
+        points *= 1
+        self.assertEqual(calls, [4, 4, 8, 6])
+        self.assertEqual(points.pop_dirty(), None)
+        # but the removal of the last item is
+        points.pop()
+        self.assertEqual(points.pop_dirty(), (5, 5))
+        self.assertEqual(calls, [4, 4, 8, 6, 5])
+
+        # buffers are copied, other typecodes converted
+        plot.points = array('f', [1.5, 2.5])
+        self.assertEqual(plot.points.tolist(), [1.5, 2.5])
+        self.assertEqual(plot.points.pop_dirty(), (0, 2))
+        plot.points = array('d', [1, 2, 3])
+        self.assertIs(type(plot.points), ObservableArray)
+        self.assertEqual(plot.points.tolist(), [1, 2, 3])
+        self.assertEqual(calls, [4, 4, 8, 6, 5, 2, 3])
+        self.assertRaises(ValueError, setattr, plot, 'points', ['a'])
+
+        # changes made through the buffer are dispatched with mark_dirty
+        array.__setitem__(plot.points, 2, 5)
+        plot.points.pop_dirty()
+        plot.points.mark_dirty(2)
+        self.assertEqual(plot.points.pop_dirty(), (2, 3))
+        self.assertEqual(plot.points.tolist(), [1, 2, 5])
+        self.assertEqual(calls[-1], 3)
+
+        plot.indices.append(2)
+        self.assertEqual(Plot().indices.tolist(), [])
+        self.assertEqual(Plot().points.tolist(), [0, 1, 2, 3])
@@ -0,0 +1,160 @@
+'''
+Asyncio support tests
+=====================
+'''
+
+import unittest
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class AsyncioSupportTestCase(unittest.TestCase):
+
+    def setUp(self):
+        from kivy.support import install_asyncio_loop
+        self.loop = asyncio.new_event_loop()
+        install_asyncio_loop(self.loop)
+
+    def tearDown(self):
+        from kivy.support import uninstall_asyncio_loop
+        uninstall_asyncio_loop()
+        self.loop.close()
+
+    def run_until_done(self, future, max_ticks=200):
+        from kivy.clock import Clock
+        for i in range(max_ticks):
+            if future.done():
+                break
+            Clock.tick()
+        self.assertTrue(future.done())
+        return future.result()
+
+    def test_install_twice(self):
+        from kivy.support import install_asyncio_loop
+        self.assertIs(install_asyncio_loop(self.loop), self.loop)
+        other = asyncio.new_event_loop()
+        try:
+            self.assertRaises(RuntimeError, install_asyncio_loop, other)
+        finally:
+            other.close()
+
+    def test_loop_callbacks(self):
+        result = []
+        self.loop.call_soon(result.append, 1)
+        self.run_until_done(self.loop.run_in_executor(None, lambda: 2))
+        self.assertEqual(result, [1])
+
+    def test_async_sleep(self):
+        from kivy.support import async_sleep
+        future = async_sleep(0, loop=self.loop)
+        dt = self.run_until_done(future)
+        self.assertTrue(dt >= 0)
+
+    def test_async_sleep_cancel(self):
+        from kivy.clock import Clock
+        from kivy.support import async_sleep
+        future = async_sleep(0, loop=self.loop)
+        future.cancel()
+        Clock.tick()
+        self.assertTrue(future.cancelled())
+
+    def test_gather(self):
+        from kivy.support import async_sleep
+        future = asyncio.gather(
+            async_sleep(0, loop=self.loop), async_sleep(0.01, loop=self.loop))
+        result = self.run_until_done(future)
+        self.assertEqual(len(result), 2)
+
+    def test_async_store(self):
+        from kivy.storage.dictstore import DictStore
+        from kivy.support import async_store
+        store = DictStore(None)
+        result = self.run_until_done(async_store(
+            store, 'put', 'tito', age=28, loop=self.loop))
+        self.assertTrue(result)
+        result = self.run_until_done(async_store(
+            store, 'get', 'tito', loop=self.loop))
+        self.assertEqual(result, {'age': 28})
+        result = self.run_until_done(async_store(
+            store, 'exists', 'tito', loop=self.loop))
+        self.assertTrue(result)
+        result = self.run_until_done(async_store(
+            store, 'find', age=28, loop=self.loop))
+        self.assertEqual(result, [('tito', {'age': 28})])
+        result = self.run_until_done(async_store(
+            store, 'count', loop=self.loop))
+        self.assertEqual(result, 1)
+
+
+class Listener(object):
+
+    def dispatch(self, *largs):
+        pass
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class AsyncioRunTouchAppTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_run_touch_app(self):
+        from kivy.base import EventLoop, stopTouchApp
+        from kivy.clock import Clock
+        from kivy.support import asyncio_runTouchApp
+        max_fps = Clock._max_fps
+        frames = []
+
+        def on_frame(dt):
+            frames.append(dt)
+            if len(frames) == 3:
+                stopTouchApp()
+
+        # without a window, the event loop leaves if nothing listens to it
+        listener = Listener()
+        EventLoop.add_event_listener(listener)
+        event = Clock.schedule_interval(on_frame, 0)
+        try:
+            future = asyncio_runTouchApp(loop=self.loop)
+            # the frames are run by the asyncio loop, until the app stops
+            self.loop.run_until_complete(
+                asyncio.wait_for(future, 10))
+        finally:
+            event.cancel()
+            EventLoop.remove_event_listener(listener)
+        self.assertTrue(future.done())
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(Clock._max_fps, max_fps)
+
+    def test_idle_wakeup(self):
+        from time import time
+        from kivy.base import EventLoop, stopTouchApp
+        from kivy.clock import Clock
+        from kivy.support import asyncio_runTouchApp
+        idle_timeout = Clock.idle_timeout
+
+        def stop(dt):
+            stopTouchApp()
+
+        listener = Listener()
+        EventLoop.add_event_listener(listener)
+        Clock.idle_timeout = 10
+        try:
+            future = asyncio_runTouchApp(loop=self.loop)
+            # an event scheduled by the asyncio loop during the idle delay
+            # starts the next frame right away
+            self.loop.call_later(.1, Clock.schedule_once, stop)
+            start = time()
+            self.loop.run_until_complete(asyncio.wait_for(future, 20))
+            self.assertTrue(time() - start < .6)
+        finally:
+            Clock.idle_timeout = idle_timeout
+            EventLoop.remove_event_listener(listener)
+        self.assertTrue(Clock._wakeup_hook is None)
@@ -2,6 +2,43 @@
 Benchmark
 =========
 
+Run the benchmarks and print a report::
+
+    python -m kivy.tools.benchmark
+
+The options of the benchmark are given after ``--``, so that Kivy doesn't
+read them::
+
+    python -m kivy.tools.benchmark -- [options]
+
+`--headless`
+    Skip the OpenGL informations and the benchmarks that need an OpenGL
+    context (drawing, texture creation). The others, including all the kv
+    benchmarks, only need the compiled graphics modules.
+`--filter <text>`
+    Run only the benchmarks whose name contains `text` (can be repeated),
+    e.g. `--filter kv_` for the kv benchmarks.
+`--repeat <n>`
+    Run each benchmark `n` times and keep the best time.
+`--json <file>`
+    Save the results in a JSON file.
+`--compare <old.json> [<new.json>]`
+    Compare the results of `old.json` with the ones of `new.json`, or with
+    the results of the current run if `new.json` is not given. The
+    benchmarks slower by more than `--threshold` (10% by default) are flagged
+    as regressions, and the exit status is 1 if there is any.
+`--no-post`
+    Don't offer to post the report on gist.github.com.
+
+After the benchmarks, the memory used by each instance of
+:class:`~kivy.uix.widget.Widget`, :class:`~kivy.uix.label.Label` and
+:class:`~kivy.uix.button.Button` is reported, if Python has the `tracemalloc`
+module (Python 3.4 and later). It is skipped if the filters don't match
+`memory`. The creation time of these widgets is measured by the
+`widget_creation`, `label_creation` and `button_creation` benchmarks.
+
+.. versionchanged:: 1.9.0
+    The kv benchmarks, the memory report and all the options were added.
 '''
 
 from __future__ import print_function
@@ -13,7 +50,9 @@ import sys
 import json
 import kivy
 import gc
-from time import clock, time, ctime
+from argparse import ArgumentParser
+from time import ctime
+from timeit import default_timer as clockfn
 from random import randint
 
 from kivy.uix.label import Label
@@ -22,21 +61,26 @@ from kivy.uix.widget import Widget
 from kivy.graphics import RenderContext
 from kivy.input.motionevent import MotionEvent
 from kivy.cache import Cache
-from kivy.clock import Clock
+from kivy.clock import Clock, ClockBase, ClockBaseHeap
 from kivy.compat import PY2
+from kivy.factory import Factory
+from kivy.lang import Builder, BuilderBase, Parser
+from kivy.tools.kvcompiler import compile_kv
 
 if not PY2:
     xrange = range
 
-clockfn = time
-if sys.platform == 'win32':
-    clockfn = clock
-
 
 class FakeMotionEvent(MotionEvent):
     pass
 
 
+class FakeClockTarget(object):
+
+    def callback(self, dt):
+        pass
+
+
 class bench_widget_creation:
     '''Widget: creation (10000 Widget)'''
 
@@ -57,6 +101,7 @@ class bench_widget_creation_with_root:
 
 class bench_widget_draw:
     '''Widget: empty drawing (10000 Widget + 1 root)'''
+    needs_gl = True
 
     def __init__(self):
         self.ctx = RenderContext()
@@ -122,6 +167,7 @@ class bench_button_creation:
 
 class bench_label_creation_with_tick:
     '''Core: label creation (10000 * 10 a-z), with Clock.tick'''
+    needs_gl = True
 
     def __init__(self):
         labels = []
@@ -140,6 +186,7 @@ class bench_label_creation_with_tick:
 
 class bench_button_creation_with_tick:
     '''Core: button creation (10000 * 10 a-z), with Clock.tick'''
+    needs_gl = True
 
     def __init__(self):
         labels = []
@@ -156,60 +203,367 @@ class bench_button_creation_with_tick:
         Clock.tick()
 
 
-if __name__ == '__main__':
+class _bench_clock_tick(object):
+    clock_class = ClockBase
+    events = 10
 
-    report = []
-    report_newline = True
+    def __init__(self):
+        self.clock = clock = self.clock_class()
+        # don't let maxfps make us sleep between the ticks
+        clock._max_fps = 0
+        self.targets = targets = [FakeClockTarget()
+                                  for x in xrange(self.events)]
+        for target in targets:
+            clock.schedule_interval(target.callback, randint(1, 10))
+        clock.tick()
 
-    def log(s, newline=True):
-        global report_newline
-        if not report_newline:
-            report[-1] = '%s %s' % (report[-1], s)
-        else:
-            report.append(s)
-        if newline:
-            print(s)
-            report_newline = True
-        else:
-            print(s, end=' ')
-            report_newline = False
-        sys.stdout.flush()
+    def run(self):
+        tick = self.clock.tick
+        for x in xrange(10):
+            tick()
 
-    clock_total = 0
-    benchs = list(globals().keys())
-    benchs.sort()
-    benchs = [globals()[x] for x in benchs if x.startswith('bench_')]
 
-    log('')
-    log('=' * 70)
-    log('Kivy Benchmark v%s' % benchmark_version)
-    log('=' * 70)
-    log('')
-    log('System informations')
-    log('-------------------')
+class bench_clock_tick_10(_bench_clock_tick):
+    '''Clock: 10 ticks with 10 scheduled events'''
+    events = 10
 
-    log('OS platform     : %s' % sys.platform)
-    log('Python EXE      : %s' % sys.executable)
-    log('Python Version  : %s' % sys.version)
-    log('Python API      : %s' % sys.api_version)
-    log('Kivy Version    : %s' % kivy.__version__)
-    log('Install path    : %s' % os.path.dirname(kivy.__file__))
-    log('Install date    : %s' % ctime(os.path.getctime(kivy.__file__)))
 
-    log('')
-    log('OpenGL informations')
-    log('-------------------')
+class bench_clock_tick_1000(_bench_clock_tick):
+    '''Clock: 10 ticks with 1000 scheduled events'''
+    events = 1000
 
-    from kivy.core.gl import glGetString, GL_VENDOR, GL_RENDERER, GL_VERSION
-    log('GL Vendor: %s' % glGetString(GL_VENDOR))
-    log('GL Renderer: %s' % glGetString(GL_RENDERER))
-    log('GL Version: %s' % glGetString(GL_VERSION))
-    log('')
 
-    log('Benchmark')
-    log('---------')
+class bench_clock_tick_100000(_bench_clock_tick):
+    '''Clock: 10 ticks with 100000 scheduled events'''
+    events = 100000
+
+
+class bench_clock_heap_tick_10(_bench_clock_tick):
+    '''Clock (heap): 10 ticks with 10 scheduled events'''
+    clock_class = ClockBaseHeap
+    events = 10
+
+
+class bench_clock_heap_tick_1000(_bench_clock_tick):
+    '''Clock (heap): 10 ticks with 1000 scheduled events'''
+    clock_class = ClockBaseHeap
+    events = 1000
+
+
+class bench_clock_heap_tick_100000(_bench_clock_tick):
+    '''Clock (heap): 10 ticks with 100000 scheduled events'''
+    clock_class = ClockBaseHeap
+    events = 100000
+
+
+class _bench_kv_parse(object):
+    use_compiled = False
+
+    def __init__(self):
+        filename = os.path.join(kivy.kivy_data_dir, 'style.kv')
+        with open(filename) as fd:
+            self.content = fd.read()
+        self.filename = filename
+        # the first parse fills the compiled cache
+        Parser(content=self.content, filename=filename)
+
+    def run(self):
+        disks = Cache._disks
+        disk = disks.pop('kv.compiled', None)
+        if self.use_compiled and disk is not None:
+            disks['kv.compiled'] = disk
+        try:
+            for x in xrange(10):
+                Parser(content=self.content, filename=self.filename)
+        finally:
+            if disk is not None:
+                disks['kv.compiled'] = disk
+
+
+class bench_kv_parse(_bench_kv_parse):
+    '''Lang: 10 parses of style.kv'''
+
+
+class bench_kv_parse_compiled(_bench_kv_parse):
+    '''Lang: 10 loads of style.kv from the compiled cache'''
+    use_compiled = True
+
+
+def _compile_style_kv():
+    filename = os.path.join(kivy.kivy_data_dir, 'style.kv')
+    with open(filename) as fd:
+        content = fd.read()
+    source = compile_kv(content, filename)
+    return filename, content, compile(source, 'style_kv.py', 'exec')
+
+
+class _bench_kv_load(object):
+    use_module = False
+
+    def __init__(self):
+        self.filename, self.content, self.code = _compile_style_kv()
+
+    def run(self):
+        disks = Cache._disks
+        disk = disks.pop('kv.compiled', None)
+        try:
+            for x in xrange(10):
+                builder = BuilderBase()
+                if self.use_module:
+                    # same as importing the module from its .pyc
+                    module = {'__name__': 'style_kv'}
+                    exec(self.code, module)
+                    module['load'](builder, rulesonly=True)
+                else:
+                    builder.load_string(self.content, filename=self.filename,
+                                        rulesonly=True)
+        finally:
+            if disk is not None:
+                disks['kv.compiled'] = disk
+
+
+class bench_kv_load(_bench_kv_load):
+    '''Lang: 10 loads of style.kv'''
+
+
+class bench_kv_load_module(_bench_kv_load):
+    '''Lang: 10 loads of style.kv compiled to a Python module'''
+    use_module = True
+
+
+class _bench_kv_widget_creation(object):
+    use_module = False
+
+    def __init__(self):
+        self.filename, content, code = _compile_style_kv()
+        if self.use_module:
+            module = {'__name__': 'style_kv'}
+            exec(code, module)
+            Builder.unload_file(self.filename)
+            module['load'](Builder, filename=self.filename, rulesonly=True)
+
+    def run(self):
+        try:
+            o = []
+            for x in xrange(1000):
+                o.append(Button(text='button'))
+        finally:
+            if self.use_module:
+                Builder.unload_file(self.filename)
+                Builder.load_file(self.filename, rulesonly=True)
+
+
+class bench_kv_widget_creation(_bench_kv_widget_creation):
+    '''Lang: button creation (1000) with style.kv'''
+
+
+class bench_kv_widget_creation_module(_bench_kv_widget_creation):
+    '''Lang: button creation (1000) with style.kv compiled to a module'''
+    use_module = True
+
+
+class BenchRuleWidget(Widget):
+    pass
+
+
+def _deep_kv(depth):
+    lines = ['<BenchDeep@Widget>:']
+    for level in xrange(1, depth + 1):
+        indent = '    ' * level
+        lines.append(indent + 'Widget:')
+        lines.append(indent + '    x: self.parent.x + 1')
+        lines.append(indent + '    width: root.width - {}'.format(level))
+    return '\n'.join(lines)
+
+
+#: Filename of the kv rules of the kv benchmarks
+BENCH_KV_FILENAME = '<benchmark.kv>'
+
+#: kv rules of the kv benchmarks
+BENCH_KV = '''
+<BenchRuleWidget>:
+    size_hint: None, None
+    size: 100, 50
+    opacity: 0.5 if self.disabled else 1
+
+<BenchDynamic@Widget>:
+    value: 0
+    label: 'value {}'.format(self.value)
+    size_hint_x: None
+    width: self.value * 2
+
+[BenchTemplate@Widget]:
+    size_hint: None, None
+    width: ctx.width
+    height: ctx.height
+
+<BenchIds@Widget>:
+    first: first
+    second: second
+    Widget:
+        id: first
+        width: second.width + 1
+    Widget:
+        id: second
+        width: root.width / 2
+
+<BenchBindings@Widget>:
+    a: 0
+    b: self.a * 2
+    c: self.b + self.a
+    d: self.c * 2 + self.b
+    x: self.a + self.d
+
+<BenchCanvas@Widget>:
+    canvas.before:
+        Color:
+            rgba: 1, 1, 1, self.opacity
+        Rectangle:
+            pos: self.pos
+            size: self.size
+    canvas:
+        Color:
+            rgb: 1, 0, 0
+        Line:
+            points: self.x, self.y, self.right, self.top
+    canvas.after:
+        Color:
+            rgba: 0, 0, 1, .5
+        Rectangle:
+            pos: self.center_x - 5, self.center_y - 5
+            size: 10, 10
+
+''' + _deep_kv(20)
+
+
+def _load_bench_kv():
+    if BENCH_KV_FILENAME not in Builder.files:
+        Builder.load_string(BENCH_KV, filename=BENCH_KV_FILENAME)
+
+
+class _bench_kv(object):
+
+    def __init__(self):
+        _load_bench_kv()
+
+
+class bench_kv_rule_application(_bench_kv):
+    '''Lang: rule application (1000 Widget with a rule)'''
+
+    def run(self):
+        o = []
+        for x in xrange(1000):
+            o.append(BenchRuleWidget())
+
+
+class bench_kv_dynamic_class(_bench_kv):
+    '''Lang: dynamic class creation (1000)'''
+
+    def run(self):
+        cls = Factory.BenchDynamic
+        o = []
+        for x in xrange(1000):
+            o.append(cls(value=x))
+
+
+class bench_kv_template(_bench_kv):
+    '''Lang: template creation (1000)'''
+
+    def run(self):
+        template = Builder.template
+        o = []
+        for x in xrange(1000):
+            o.append(template('BenchTemplate', width=x, height=50))
+
+
+class bench_kv_ids(_bench_kv):
+    '''Lang: creation of a rule with ids (1000 * 2 children)'''
+
+    def run(self):
+        cls = Factory.BenchIds
+        o = []
+        for x in xrange(1000):
+            o.append(cls())
+
+
+class bench_kv_bindings_creation(_bench_kv):
+    '''Lang: creation of a rule with bindings (1000 * 4 expressions)'''
+
+    def run(self):
+        cls = Factory.BenchBindings
+        o = []
+        for x in xrange(1000):
+            o.append(cls())
+
+
+class bench_kv_bindings_dispatch(_bench_kv):
+    '''Lang: bound expressions updates (100 * 100 changes)'''
+
+    def __init__(self):
+        super(bench_kv_bindings_dispatch, self).__init__()
+        cls = Factory.BenchBindings
+        self.widgets = [cls() for x in xrange(100)]
+
+    def run(self):
+        for wid in self.widgets:
+            for x in xrange(100):
+                wid.a = x
+
+
+class bench_kv_canvas(_bench_kv):
+    '''Lang: creation of a rule with canvas (1000 * 6 instructions)'''
+
+    def run(self):
+        cls = Factory.BenchCanvas
+        o = []
+        for x in xrange(1000):
+            o.append(cls())
+        Builder.sync()
+
+
+class bench_kv_deep_nesting(_bench_kv):
+    '''Lang: creation of a deeply nested rule (100 * 20 levels)'''
+
+    def run(self):
+        cls = Factory.BenchDeep
+        o = []
+        for x in xrange(100):
+            o.append(cls())
+
+
+class bench_kv_unload_reload(_bench_kv):
+    '''Lang: unload and reload of the benchmark rules (10)'''
 
-    for x in benchs:
+    def run(self):
+        for x in xrange(10):
+            Builder.unload_file(BENCH_KV_FILENAME)
+            Builder.load_string(BENCH_KV, filename=BENCH_KV_FILENAME)
+
+
+def get_benchmarks(filters=None, headless=False):
+    '''Return the benchmark classes, sorted by name. If `filters` is given,
+    only the benchmarks whose name contains one of them are returned. If
+    `headless` is True, the benchmarks needing an OpenGL context are skipped.
+    '''
+    benchs = []
+    for name in sorted(globals().keys()):
+        if not name.startswith('bench_'):
+            continue
+        if filters and not any(x in name for x in filters):
+            continue
+        bench = globals()[name]
+        if headless and getattr(bench, 'needs_gl', False):
+            continue
+        benchs.append(bench)
+    return benchs
+
+
+def run_benchmark(bench, repeat=1):
+    '''Run the benchmark class `bench` `repeat` times, and return the best
+    time. The setup of the benchmark is not measured.
+    '''
+    best = None
+    for x in xrange(repeat):
         # clean cache to prevent weird case
         for cat in Cache._categories:
             Cache.remove(cat)
@@ -217,60 +571,281 @@ if __name__ == '__main__':
         # force gc before next test
         gc.collect()
 
-        log('%2d/%-2d %-60s' % (benchs.index(x) + 1,
-            len(benchs), x.__doc__), False)
-        try:
-            sys.stderr.write('.')
-            test = x()
-        except Exception as e:
-            log('failed %s' % str(e))
-            import traceback
-            traceback.print_exc()
-            continue
-
+        sys.stderr.write('.')
+        test = bench()
+        sys.stderr.write('.')
         clock_start = clockfn()
+        test.run()
+        clock_end = clockfn() - clock_start
+        if best is None or clock_end < best:
+            best = clock_end
+    return best
+
+
+def measure_memory(cls, count=10000):
+    '''Return the memory allocated by each instance of `cls`, in bytes,
+    measured over `count` instances, or None if the `tracemalloc` module is
+    not available.
+    '''
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        instances = [cls() for x in xrange(count)]
+        size = tracemalloc.get_traced_memory()[0] - start
+        del instances
+    finally:
+        tracemalloc.stop()
+    return size / float(count)
+
+
+#: Classes whose memory per instance is reported
+MEMORY_CLASSES = (Widget, Label, Button)
+
+
+def system_info():
+    '''Return the system informations of the report, as a list of
+    (name, value).
+    '''
+    return [
+        ('OS platform', sys.platform),
+        ('Python EXE', sys.executable),
+        ('Python Version', sys.version),
+        ('Python API', sys.api_version),
+        ('Kivy Version', kivy.__version__),
+        ('Install path', os.path.dirname(kivy.__file__)),
+        ('Install date', ctime(os.path.getctime(kivy.__file__)))]
+
+
+def compare_results(old, new, threshold=0.1):
+    '''Compare two results, as saved with `--json`, and return a list of
+    (name, description, old time, new time, status). The status is
+    'regression' when the new time is slower than the old one by more than
+    `threshold` (a ratio), 'improvement' when it's faster by more than
+    `threshold`, 'same' otherwise, and 'missing' when one of the times is
+    unknown (the benchmark failed or was not run).
+    '''
+    old = old['results']
+    new = new['results']
+    comparison = []
+    for name in sorted(set(old) | set(new)):
+        old_time = old.get(name, {}).get('time')
+        new_time = new.get(name, {}).get('time')
+        doc = (new.get(name) or old.get(name))['doc']
+        if old_time is None or new_time is None:
+            status = 'missing'
+        elif new_time > old_time * (1 + threshold):
+            status = 'regression'
+        elif new_time < old_time * (1 - threshold):
+            status = 'improvement'
+        else:
+            status = 'same'
+        comparison.append((name, doc, old_time, new_time, status))
+    return comparison
 
-        try:
-            sys.stderr.write('.')
-            test.run()
-            clock_end = clockfn() - clock_start
-            log('%.6f' % clock_end)
-        except Exception as e:
-            log('failed %s' % str(e))
-            continue
 
-        clock_total += clock_end
+class BenchmarkReport(object):
+    '''Print the report of the benchmarks, and keep its lines for posting.
+    '''
 
-    log('')
-    log('Result: %.6f' % clock_total)
-    log('')
+    def __init__(self):
+        self.lines = []
+        self.newline = True
+
+    def log(self, s, newline=True):
+        if not self.newline:
+            self.lines[-1] = '%s %s' % (self.lines[-1], s)
+        else:
+            self.lines.append(s)
+        if newline:
+            print(s)
+            self.newline = True
+        else:
+            print(s, end=' ')
+            self.newline = False
+        sys.stdout.flush()
+
+    def log_comparison(self, comparison):
+        log = self.log
+        log('%-50s %10s %10s %8s' % ('Benchmark', 'Old', 'New', 'Change'))
+        regressions = 0
+        for name, doc, old_time, new_time, status in comparison:
+            if status == 'missing':
+                log('%-50s %10s %10s %8s' % (
+                    doc[:50], '-' if old_time is None else '%.6f' % old_time,
+                    '-' if new_time is None else '%.6f' % new_time, '-'))
+                continue
+            change = (new_time - old_time) / old_time if old_time else 0
+            line = '%-50s %10.6f %10.6f %+7.1f%%' % (
+                doc[:50], old_time, new_time, change * 100)
+            if status == 'regression':
+                regressions += 1
+                line += '  REGRESSION'
+            elif status == 'improvement':
+                line += '  improvement'
+            log(line)
+        log('')
+        log('%d regression(s)' % regressions)
+        return regressions
+
+
+def post_report(report):
+    try:
+        reply = input(
+            'Do you want to send benchmark to gist.github.com (Y/n) : ')
+    except EOFError:
+        return
 
-try:
-    reply = input(
-        'Do you want to send benchmark to gist.github.com (Y/n) : ')
-except EOFError:
-    sys.exit(0)
+    if reply.lower().strip() not in ('', 'y'):
+        print('No benchmark posted.')
+        return
 
-if reply.lower().strip() in ('', 'y'):
     print('Please wait while sending the benchmark...')
 
     try:
         import requests
     except ImportError:
         print("`requests` module not found, no benchmark posted.")
-        sys.exit(1)
+        return
 
     payload = {
         'public': True, 'files': {
             'benchmark.txt': {
-                'content': '\n'.join(report)}}}
+                'content': '\n'.join(report.lines)}}}
 
     r = requests.post('https://api.github.com/gists', data=json.dumps(payload))
 
     print()
     print()
-    print('REPORT posted at {0}'.format(r.json['html_url']))
+    print('REPORT posted at {0}'.format(r.json()['html_url']))
     print()
     print()
-else:
-    print('No benchmark posted.')
+
+
+def main(argv=None):
+    parser = ArgumentParser(description='Kivy benchmark')
+    parser.add_argument('--headless', action='store_true',
+                        help='skip the benchmarks needing an OpenGL context')
+    parser.add_argument('--filter', action='append', default=None,
+                        help='run only the benchmarks containing this text')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='run each benchmark n times and keep the best')
+    parser.add_argument('--json', default=None, metavar='FILE',
+                        help='save the results in a JSON file')
+    parser.add_argument('--compare', nargs='+', default=None,
+                        metavar='FILE',
+                        help='compare old.json with new.json or this run')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown ratio flagged as a regression')
+    parser.add_argument('--no-post', action='store_true',
+                        help="don't offer to post the report")
+    options = parser.parse_args(argv)
+    if options.compare and len(options.compare) > 2:
+        parser.error('--compare takes one or two files')
+
+    report = BenchmarkReport()
+    log = report.log
+
+    if options.compare and len(options.compare) == 2:
+        with open(options.compare[0]) as fd:
+            old = json.load(fd)
+        with open(options.compare[1]) as fd:
+            new = json.load(fd)
+        regressions = report.log_comparison(
+            compare_results(old, new, options.threshold))
+        return 1 if regressions else 0
+
+    benchs = get_benchmarks(options.filter, options.headless)
+    info = system_info()
+
+    log('')
+    log('=' * 70)
+    log('Kivy Benchmark v%s' % benchmark_version)
+    log('=' * 70)
+    log('')
+    log('System informations')
+    log('-------------------')
+
+    for name, value in info:
+        log('%-16s: %s' % (name, value))
+
+    if not options.headless:
+        log('')
+        log('OpenGL informations')
+        log('-------------------')
+
+        from kivy.core.gl import (glGetString, GL_VENDOR, GL_RENDERER,
+                                  GL_VERSION)
+        log('GL Vendor: %s' % glGetString(GL_VENDOR))
+        log('GL Renderer: %s' % glGetString(GL_RENDERER))
+        log('GL Version: %s' % glGetString(GL_VERSION))
+    log('')
+
+    log('Benchmark')
+    log('---------')
+
+    clock_total = 0
+    results = {}
+    for index, bench in enumerate(benchs):
+        log('%2d/%-2d %-60s' % (index + 1, len(benchs), bench.__doc__),
+            False)
+        result = results[bench.__name__] = {'doc': bench.__doc__,
+                                             'time': None}
+        try:
+            clock_end = run_benchmark(bench, options.repeat)
+        except Exception as e:
+            log('failed %s' % str(e))
+            import traceback
+            traceback.print_exc()
+            continue
+        log('%.6f' % clock_end)
+        result['time'] = clock_end
+        clock_total += clock_end
+
+    log('')
+    log('Result: %.6f' % clock_total)
+    log('')
+
+    memory = {}
+    if not options.filter or any(x in 'memory' for x in options.filter):
+        log('Memory')
+        log('------')
+        for cls in MEMORY_CLASSES:
+            size = memory[cls.__name__] = measure_memory(cls)
+            if size is None:
+                log('tracemalloc is not available, memory not measured')
+                break
+            log('%-50s %10d bytes' % (
+                '%s: memory per instance' % cls.__name__, size))
+        log('')
+
+    if options.json:
+        with open(options.json, 'w') as fd:
+            json.dump({'version': benchmark_version,
+                       'system': dict(info),
+                       'headless': options.headless,
+                       'repeat': options.repeat,
+                       'total': clock_total,
+                       'memory': memory,
+                       'results': results}, fd, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare[0]) as fd:
+            old = json.load(fd)
+        log('Comparison with %s' % options.compare[0])
+        log('-----------------' + '-' * len(options.compare[0]))
+        regressions = report.log_comparison(
+            compare_results(old, {'results': results}, options.threshold))
+        return 1 if regressions else 0
+
+    if not (options.json or options.no_post):
+        post_report(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
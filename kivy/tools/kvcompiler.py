@@ -0,0 +1,264 @@
+'''
+Kv compiler
+===========
+
+.. versionadded:: 1.9.0
+
+This tool translates kv files into Python modules, so that the kv parser can
+be skipped entirely at runtime. See :mod:`kivy.lang` for more information.
+
+Usage
+-----
+
+In order to compile a kv file::
+
+    python -m kivy.tools.kvcompiler [-o <module.py>] <file.kv> [<file.kv> ...]
+
+This will create a `file_kv.py` module next to each kv file (or the module
+given with `-o`). Then, instead of `Builder.load_file('file.kv')`::
+
+    import file_kv
+    root = file_kv.load()
+
+The module registers the same rules, dynamic classes and templates in the
+:data:`~kivy.lang.Builder` and the :class:`~kivy.factory.Factory`, and
+executes the same directives. The expressions are compiled with the module,
+and an expression that watches only direct attributes (`self.x`, `root.y`,
+`an_id.z`) gets a function that resolves its names once and binds them with
+:meth:`~kivy.event.EventDispatcher.fast_bind`. The other expressions (with
+longer chains like `self.parent.x`, lambdas or comprehensions) are bound as
+if they were loaded from the kv file.
+
+.. note::
+
+    The module must be generated again when the kv file is changed.
+'''
+
+from __future__ import print_function
+
+__all__ = ('compile_kv', 'compile_kv_file')
+
+from argparse import ArgumentParser
+from os.path import basename, dirname, join, relpath, splitext, abspath
+from types import CodeType
+
+from kivy import __version__
+from kivy.lang import Parser, expression_names
+
+#: Header of the generated modules
+MODULE_HEADER = """# -*- coding: utf-8 -*-
+'''
+Compiled kv module
+==================
+
+Generated by kivy.tools.kvcompiler (Kivy {version}) from {source}.
+Do not edit: generate it again when the kv file is changed.
+'''
+from os.path import dirname, join
+from kivy.lang import (Builder, create_handler, create_compiled_handler,
+                       resolve_compiled_names)
+
+__all__ = ('load', )
+
+"""
+
+#: Footer of the generated modules
+MODULE_FOOTER = """
+
+def load(builder=None, **kwargs):
+    '''Insert the rules in the `builder` (defaults to the global Builder), and
+    return the root widget of the kv file, if there is one. The keyword
+    arguments are the same as for Builder.load_file().
+    '''
+    if builder is None:
+        builder = Builder
+    kwargs.setdefault('filename', FILENAME)
+    return builder.load_compiled((DIRECTIVES, RULES),
+                                 sourcecode=SOURCECODE, **kwargs)
+"""
+
+
+class KvModuleWriter(object):
+    '''Write the Python module of a :class:`~kivy.lang.Parser` result.
+    '''
+
+    def __init__(self, parser, filename=None, module_filename=None):
+        super(KvModuleWriter, self).__init__()
+        self.parser = parser
+        self.filename = filename
+        self.module_filename = module_filename
+        self.binders = []
+
+    def write(self):
+        parser = self.parser
+        objects = []
+        for selector, rule in parser.rules:
+            if rule not in objects:
+                objects.append(rule)
+        objects.extend(x[2] for x in parser.templates)
+        if parser.root is not None:
+            objects.append(parser.root)
+
+        rules = ',\n'.join('    ' + self.rule(x, 4) for x in objects)
+        source = basename(self.filename) if self.filename else '<string>'
+        return ''.join([
+            MODULE_HEADER.format(version=__version__, source=source),
+            'FILENAME = {}\n'.format(self.filename_source()),
+            'SOURCECODE = {!r}\n'.format([x[1] for x in parser.sourcecode]),
+            'DIRECTIVES = {!r}\n'.format(list(parser.directives)),
+            ''.join(self.binders),
+            '\n\nRULES = [\n', rules, ']\n',
+            MODULE_FOOTER])
+
+    def filename_source(self):
+        filename = self.filename
+        if filename is None:
+            return 'None'
+        if self.module_filename is not None:
+            try:
+                path = relpath(abspath(filename),
+                               dirname(abspath(self.module_filename)))
+            except ValueError:
+                # not on the same drive
+                path = None
+            if path and not path.startswith('..'):
+                return 'join(dirname(__file__), {!r})'.format(path)
+        return repr(abspath(filename))
+
+    def rule(self, rule, indent):
+        pad = ' ' * (indent + 4)
+        lines = ['({!r}, {!r}, {!r}, {!r},'.format(
+            rule.line, rule.name, rule.level, rule.id)]
+        for props in (list(rule.properties.values()), rule.handlers):
+            if not props:
+                lines.append(pad + '[],')
+                continue
+            lines.append(pad + '[')
+            for prop in props:
+                lines.append(pad + '    ' + self.property(prop) + ',')
+            lines.append(pad + '],')
+        if rule.children:
+            lines.append(pad + '[')
+            for child in rule.children:
+                lines.append(
+                    pad + '    ' + self.rule(child, indent + 8) + ',')
+            lines.append(pad + '],')
+        else:
+            lines.append(pad + '[],')
+        for canvas in (rule.canvas_before, rule.canvas_root,
+                       rule.canvas_after):
+            if canvas is None:
+                lines.append(pad + 'None,')
+            else:
+                lines.append(pad + self.rule(canvas, indent + 4) + ',')
+        lines[-1] = lines[-1][:-1] + ')'
+        return '\n'.join(lines)
+
+    def property(self, prop):
+        value = prop.co_value
+        binder = 'None'
+        if type(value) is not CodeType:
+            # a constant, evaluated by the parser without names
+            co_value = '({}\n)'.format(prop.value)
+        elif prop.mode == 'exec':
+            co_value = "compile('\\n' * {} + {!r}, FILENAME or '<string>', " \
+                "'exec')".format(prop.line, prop.value)
+        else:
+            co_value = '(lambda: ({}\n)).__code__'.format(prop.value)
+            binder = self.binder(prop)
+        return '({!r}, {!r}, {!r}, {!r}, {}, {!r}, {})'.format(
+            prop.line, prop.name, prop.value, prop.mode, co_value,
+            prop.watched_keys, binder)
+
+    def binder(self, prop):
+        '''Write the function binding the expression of `prop`, and return its
+        name, or 'None' if the expression must be bound by the Builder.
+        '''
+        watched = prop.watched_keys or []
+        if any(len(keys) > 2 for keys in watched):
+            return 'None'
+        names = expression_names(prop.value, watched)
+        if names is None or any(x.startswith('_kv_') for x in names):
+            return 'None'
+
+        func = '_kv_binder_{}'.format(len(self.binders))
+        targets = ', '.join(['self'] + names)
+        watched = ', '.join('({}, {!r})'.format(keys[0], keys[-1])
+                            for keys in watched)
+        self.binders.append(BINDER_TEMPLATE.format(
+            func=func, line=prop.line + 1, name=prop.name,
+            names=tuple(names), targets=targets, value=prop.value,
+            watched=watched + ',' if watched else ''))
+        return func
+
+
+BINDER_TEMPLATE = """
+
+def {func}(_kv_iself, _kv_idmap, _kv_element, _kv_key, _kv_rule,
+        _kv_delayed):
+    # line {line}, {name}
+    _kv_values = resolve_compiled_names(_kv_iself, _kv_idmap, {names!r})
+    if _kv_values is None:
+        return create_handler(_kv_iself, _kv_element, _kv_key,
+                              _kv_rule.co_value, _kv_rule, _kv_idmap,
+                              _kv_delayed)
+    ({targets}, ) = _kv_values
+    return create_compiled_handler(
+        _kv_iself, _kv_element, _kv_key, _kv_rule, _kv_delayed,
+        lambda: ({value}
+        ),
+        ({watched}))
+"""
+
+
+def compile_kv(content, filename=None, module_filename=None):
+    '''Return the source code of a Python module holding the rules of the kv
+    `content`.
+
+    :Parameters:
+        `content`: str
+            Content of the kv file.
+        `filename`: str, defaults to None
+            Name of the kv file, as passed to
+            :meth:`~kivy.lang.BuilderBase.load_file`.
+        `module_filename`: str, defaults to None
+            Name of the generated module. If given, the kv filename is stored
+            relative to the module.
+    '''
+    parser = Parser(content=content, filename=filename)
+    return KvModuleWriter(parser, filename, module_filename).write()
+
+
+def compile_kv_file(filename, module_filename=None):
+    '''Compile the kv file `filename` into the `module_filename` Python
+    module, which defaults to `<name>_kv.py` in the same directory. Return the
+    name of the module file.
+    '''
+    if module_filename is None:
+        name = splitext(basename(filename))[0]
+        name = ''.join(x if x.isalnum() else '_' for x in name)
+        module_filename = join(dirname(filename), name + '_kv.py')
+    with open(filename) as fd:
+        content = fd.read()
+    source = compile_kv(content, filename, module_filename)
+    with open(module_filename, 'w') as fd:
+        fd.write(source)
+    return module_filename
+
+
+def main(argv=None):
+    parser = ArgumentParser(
+        description='Translate kv files into Python modules')
+    parser.add_argument('-o', '--output', default=None,
+                        help='name of the module (only with one kv file)')
+    parser.add_argument('filenames', nargs='+', metavar='file.kv')
+    options = parser.parse_args(argv)
+    if options.output and len(options.filenames) > 1:
+        parser.error('--output can be used only with one kv file')
+    for filename in options.filenames:
+        print('{} -> {}'.format(
+            filename, compile_kv_file(filename, options.output)))
+
+
+if __name__ == '__main__':
+    main()
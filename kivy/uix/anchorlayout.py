@@ -104,7 +104,4 @@ class AnchorLayout(Layout):
             if anchor_y == 'center':
                 y = y + (height / 2) - (h / 2)
 
-            c.x = x
-            c.y = y
-            c.width = w
-            c.height = h
+            c.set_properties(x=x, y=y, width=w, height=h)
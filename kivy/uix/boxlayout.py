@@ -169,10 +169,7 @@ class BoxLayout(Layout):
                     elif key == 'center_y':
                         cy += posy - (h / 2.)
 
-                c.x = cx
-                c.y = cy
-                c.width = w
-                c.height = h
+                c.set_properties(x=cx, y=cy, width=w, height=h)
                 x += w + spacing
 
         if orientation == 'vertical':
@@ -200,10 +197,7 @@ class BoxLayout(Layout):
                     elif key == 'center_x':
                         cx += posx - (w / 2.)
 
-                c.x = cx
-                c.y = cy
-                c.width = w
-                c.height = h
+                c.set_properties(x=cx, y=cy, width=w, height=h)
                 y += h + spacing
 
     def add_widget(self, widget, index=0):
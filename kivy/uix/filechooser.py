@@ -452,6 +452,7 @@ class FileChooserController(FloatLayout):
 
     def __init__(self, **kwargs):
         self._progress = None
+        self._gitems_work = None
         super(FileChooserController, self).__init__(**kwargs)
 
         self._items = []
@@ -608,53 +609,47 @@ class FileChooserController(FloatLayout):
 
     def _update_files(self, *args, **kwargs):
         # trigger to start gathering the files in the new directory
-        # we'll start a timer that will do the job, 10 times per frames
-        # (default)
+        # the first entries are created right away, during 50ms max or 10
+        # entries minimum (slow system), and the remaining ones by the clock,
+        # within its work budget of each frame
         self._gitems = []
         self._gitems_parent = kwargs.get('parent', None)
         self._gitems_gen = self._generate_file_entries(
             path=kwargs.get('path', self.path),
             parent=self._gitems_parent)
 
-        # cancel any previous clock if exist
-        Clock.unschedule(self._create_files_entries)
+        # cancel any previous work if exist
+        if self._gitems_work is not None:
+            self._gitems_work.cancel()
 
         # show the progression screen
         self._hide_progress()
-        if self._create_files_entries():
-            # not enough for creating all the entries, all a clock to continue
-            # start a timer for the next 100 ms
-            Clock.schedule_interval(self._create_files_entries, .1)
+        self._gitems_work = None
+        entries = self._create_files_entries()
+        start = time()
+        count = 0
+        for _ in entries:
+            count += 1
+            if time() - start >= 0.05 and count >= 10:
+                self._gitems_work = Clock.schedule_work(entries)
+                break
 
     def _get_file_paths(self, items):
         return [file.path for file in items]
 
-    def _create_files_entries(self, *args):
-        # create maximum entries during 50ms max, or 10 minimum (slow system)
-        # (on a "fast system" (core i7 2700K), we can create up to 40 entries
-        # in 50 ms. So 10 is fine for low system.
+    def _create_files_entries(self):
+        # generator creating one entry per step. If the entries are not all
+        # created after 50ms, show a progress bar and report the activity to
+        # the user.
         start = time()
-        finished = False
-        index = total = count = 1
-        while time() - start < 0.05 or count < 10:
-            try:
-                index, total, item = next(self._gitems_gen)
-                self._gitems.append(item)
-                count += 1
-            except StopIteration:
-                finished = True
-                break
-            except TypeError:  # in case _gitems_gen is None
-                finished = True
-                break
-
-        # if this wasn't enough for creating all the entries, show a progress
-        # bar, and report the activity to the user.
-        if not finished:
-            self._show_progress()
-            self._progress.total = total
-            self._progress.index = index
-            return True
+        for index, total, item in self._gitems_gen:
+            self._gitems.append(item)
+            if self._progress is None and time() - start > 0.05:
+                self._show_progress()
+            if self._progress is not None:
+                self._progress.total = total
+                self._progress.index = index
+            yield
 
         # we created all the files, now push them on the view
         self._items = items = self._gitems
@@ -673,8 +668,7 @@ class FileChooserController(FloatLayout):
         self._hide_progress()
         self._gitems = None
         self._gitems_gen = None
-        Clock.unschedule(self._create_files_entries)
-        return False
+        self._gitems_work = None
 
     def cancel(self, *largs):
         '''Cancel any background action started by filechooser, such as loading
@@ -682,7 +676,9 @@ class FileChooserController(FloatLayout):
 
         .. versionadded:: 1.2.0
         '''
-        Clock.unschedule(self._create_files_entries)
+        if self._gitems_work is not None:
+            self._gitems_work.cancel()
+            self._gitems_work = None
         self._hide_progress()
         if len(self._previous_path) > 1:
             # if we cancel any action, the path will be set same as the
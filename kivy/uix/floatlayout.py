@@ -79,33 +79,34 @@ class FloatLayout(Layout):
         w, h = kwargs.get('size', self.size)
         x, y = kwargs.get('pos', self.pos)
         for c in self.children:
-            # size
-            shw, shh = c.size_hint
-            if shw and shh:
-                c.size = w * shw, h * shh
-            elif shw:
-                c.width = w * shw
-            elif shh:
-                c.height = h * shh
-
-            # pos
-            for key, value in c.pos_hint.items():
-                if key == 'x':
-                    c.x = x + value * w
-                elif key == 'right':
-                    c.right = x + value * w
-                elif key == 'pos':
-                    c.pos = x + value[0] * w, y + value[1] * h
-                elif key == 'y':
-                    c.y = y + value * h
-                elif key == 'top':
-                    c.top = y + value * h
-                elif key == 'center':
-                    c.center = x + value[0] * w, y + value[1] * h
-                elif key == 'center_x':
-                    c.center_x = x + value * w
-                elif key == 'center_y':
-                    c.center_y = y + value * h
+            with c.batch_dispatch():
+                # size
+                shw, shh = c.size_hint
+                if shw and shh:
+                    c.size = w * shw, h * shh
+                elif shw:
+                    c.width = w * shw
+                elif shh:
+                    c.height = h * shh
+
+                # pos
+                for key, value in c.pos_hint.items():
+                    if key == 'x':
+                        c.x = x + value * w
+                    elif key == 'right':
+                        c.right = x + value * w
+                    elif key == 'pos':
+                        c.pos = x + value[0] * w, y + value[1] * h
+                    elif key == 'y':
+                        c.y = y + value * h
+                    elif key == 'top':
+                        c.top = y + value * h
+                    elif key == 'center':
+                        c.center = x + value[0] * w, y + value[1] * h
+                    elif key == 'center_x':
+                        c.center_x = x + value * w
+                    elif key == 'center_y':
+                        c.center_y = y + value * h
 
     def add_widget(self, widget, index=0):
         widget.bind(
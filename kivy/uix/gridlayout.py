@@ -434,10 +434,8 @@ class GridLayout(Layout):
                 if i < 0:
                     break
                 c = children[i]
-                c.x = x
-                c.y = y - row_height
-                c.width = col_width
-                c.height = row_height
+                c.set_properties(x=x, y=y - row_height, width=col_width,
+                                 height=row_height)
                 i = i - 1
                 x = x + col_width + spacing_x
             y -= row_height + spacing_y
@@ -103,8 +103,7 @@ class PageLayout(Layout):
             else:
                 x = right
 
-            c.height = h
-            c.width = width
+            c.set_properties(height=h, width=width)
 
             Animation(
                 x=x,